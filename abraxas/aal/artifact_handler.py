@@ -15,7 +15,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from abraxas.runtime.artifacts import ArtifactWriter
+from abraxas.runtime.artifacts import ArtifactWriter, read_manifest
 
 
 class NeonGenieArtifactHandler:
@@ -136,12 +136,7 @@ class NeonGenieArtifactHandler:
         Returns:
             List of artifact records with metadata
         """
-        manifest_path = self.artifacts_dir / "manifests" / f"{run_id}.manifest.json"
-        if not manifest_path.exists():
-            return []
-
-        with manifest_path.open("r") as f:
-            manifest = json.load(f)
+        manifest = read_manifest(self.artifacts_dir, run_id)
 
         # Filter for Neon-Genie generations only
         generations = [
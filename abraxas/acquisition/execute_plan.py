@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 from abraxas.acquisition.perf_ledger import PerfLedger
 from abraxas.acquisition.plan_schema import BulkPullPlan, PlanStep
@@ -14,7 +14,7 @@ from abraxas.runtime.concurrency import ConcurrencyConfig
 from abraxas.runtime.deterministic_executor import commit_results, execute_parallel, WorkResult
 from abraxas.runtime.work_units import WorkUnit
 from abraxas.sources.packets import SourcePacket
-from abraxas.storage.cas import CASStore
+from abraxas.storage.cas import CASIndexEntry, CASStore
 
 
 @dataclass(frozen=True)
@@ -38,11 +38,19 @@ def execute_plan(
 
     config = ConcurrencyConfig.from_portfolio(budgets)
     work_units = _build_work_units(plan)
+    resolved_index: Mapping[str, CASIndexEntry | None] | None = None
+    if offline:
+        # Resolve every step against the URL index in one pass.
+        resolved_index = cas_store.lookup_urls(
+            [unit.input_refs.get("url") for unit in work_units]
+        )
     results = execute_parallel(
         work_units,
         config=config,
         stage="FETCH",
-        handler=lambda unit: _execute_unit(unit, plan, run_ctx, budgets, cas_store, offline),
+        handler=lambda unit: _execute_unit(
+            unit, plan, run_ctx, budgets, cas_store, offline, resolved_index
+        ),
     )
     committed = commit_results(results.results)
 
@@ -105,6 +113,7 @@ def _execute_unit(
     budgets: PortfolioTuningIR,
     cas_store: CASStore,
     offline: bool,
+    resolved_index: Mapping[str, CASIndexEntry | None] | None = None,
 ) -> WorkResult:
     step_id = unit.input_refs.get("step_id")
     url = unit.input_refs.get("url")
@@ -113,6 +122,7 @@ def _execute_unit(
             url=url,
             cas_store=cas_store,
             policy_reason=CACHE_POLICY_OFFLINE_ONLY,
+            resolved_index=resolved_index,
         )
         if cached is None:
             return WorkResult(
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from abraxas.core.canonical import sha256_hex
 from abraxas.osh.types import OSHFetchJob, RawFetchArtifact
-from abraxas.storage.cas import CASRef, CASStore
+from abraxas.storage.cas import CASIndexEntry, CASRef, CASStore
 from abraxas.acquisition.reason_codes import CachePolicyReason, validate_cache_policy_reason
 
 
@@ -98,9 +98,18 @@ def acquire_cache_only(
     url: str,
     cas_store: CASStore,
     policy_reason: CachePolicyReason | str,
+    resolved_index: Mapping[str, CASIndexEntry | None] | None = None,
 ) -> FetchResult | None:
+    """Serve a URL from the CAS cache.
+
+    ``resolved_index`` is an optional pre-resolved ``CASStore.lookup_urls``
+    result; when given, the per-URL index lookup is skipped.
+    """
     policy_reason = validate_cache_policy_reason(policy_reason)
-    entry = cas_store.lookup_url(url)
+    if resolved_index is not None:
+        entry = resolved_index.get(url)
+    else:
+        entry = cas_store.lookup_url(url)
     if not entry:
         return None
     body = Path(entry.path).read_bytes()
@@ -16,8 +16,8 @@ app = FastAPI(
     version="1.0.0",
 )
 
-# Initialize event bus and WebSocket publisher
-bus = EventBus()
+# Initialize event bus and WebSocket publisher; subscribers run off the request path
+bus = EventBus("thread")
 ws_pub = WebSocketPublisher()
 
 # Wire event bus to WebSocket publisher
@@ -27,6 +27,12 @@ wire_bus_to_ws(bus, ws_pub)
 app.include_router(api_router, prefix="/api")
 
 
+@app.on_event("shutdown")
+def shutdown_event_bus() -> None:
+    """Deliver buffered events and stop the event bus worker pool."""
+    bus.close()
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -60,4 +66,9 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "ok", "websocket_connections": ws_pub.connection_count()}
+    return {
+        "status": "ok",
+        "websocket_connections": ws_pub.connection_count(),
+        "websocket": ws_pub.stats(),
+        "event_bus": bus.stats(),
+    }
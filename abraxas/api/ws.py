@@ -1,26 +1,109 @@
-"""WebSocket publisher for real-time event broadcasting."""
+"""WebSocket publisher for real-time event broadcasting.
+
+Each connection gets a bounded send queue drained by its own sender task,
+so a slow client only backs up its own queue and never the broadcaster.
+Messages are serialized once per event and the same text is queued for
+every client. When a queue is full the oldest message is dropped; event
+types configured to "coalesce" keep only their newest queued message.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Dict, List
-
-from fastapi import WebSocket
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Literal, Mapping, Optional
+
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+
+
+DeliveryPolicy = Literal["queue", "coalesce"]
+
+DEFAULT_MAX_QUEUE = 256
+DEFAULT_SEND_TIMEOUT_S = 10.0
+# High-rate metric streams: clients only need the latest value.
+DEFAULT_POLICIES: Dict[str, DeliveryPolicy] = {
+    "compression": "coalesce",
+    "correlation": "coalesce",
+}
+
+
+class _ClientChannel:
+    """Bounded send queue and sender task for one connection."""
+
+    def __init__(self, websocket: "WebSocket", max_queue: int) -> None:
+        self.websocket = websocket
+        self.max_queue = max_queue
+        # Entries are [event_type, text] so coalescing can replace text in place.
+        self.queue: Deque[List[Any]] = deque()
+        self.pending: Dict[str, List[Any]] = {}
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def offer(self, event_type: str, text: str, policy: DeliveryPolicy) -> None:
+        if policy == "coalesce":
+            entry = self.pending.get(event_type)
+            if entry is not None:
+                entry[1] = text
+                self.coalesced += 1
+                return
+        if len(self.queue) >= self.max_queue:
+            old_type, _ = old = self.queue.popleft()
+            if self.pending.get(old_type) is old:
+                del self.pending[old_type]
+            self.dropped += 1
+        entry = [event_type, text]
+        self.queue.append(entry)
+        if policy == "coalesce":
+            self.pending[event_type] = entry
+        self.wakeup.set()
+
+    def take(self) -> Optional[str]:
+        if not self.queue:
+            return None
+        event_type, text = entry = self.queue.popleft()
+        if self.pending.get(event_type) is entry:
+            del self.pending[event_type]
+        return text
 
 
 class WebSocketPublisher:
     """
     WebSocket publisher for broadcasting events to connected clients.
     Manages connections and handles broadcast with error recovery.
-    """
 
-    def __init__(self) -> None:
-        """Initialize with empty connections list."""
-        self._connections: List[WebSocket] = []
-        self._lock = asyncio.Lock()
+    Args:
+        max_queue: Messages buffered per connection before dropping
+        policies: Delivery policy per event type ("queue" or "coalesce")
+        send_timeout: Seconds a single send may take before the client is
+            dropped and its socket closed
+    """
 
-    async def connect(self, websocket: WebSocket) -> None:
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        policies: Optional[Mapping[str, DeliveryPolicy]] = None,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT_S,
+    ) -> None:
+        """Initialize with no connections."""
+        self._channels: Dict[int, _ClientChannel] = {}
+        self._max_queue = max(1, int(max_queue))
+        self._policies: Dict[str, DeliveryPolicy] = dict(DEFAULT_POLICIES if policies is None else policies)
+        self._send_timeout = send_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats_lock = threading.Lock()
+        # Totals carried over from closed connections
+        self._closed = {"sent": 0, "dropped": 0, "coalesced": 0}
+        self._broadcasts = 0
+        self._send_errors = 0
+
+    async def connect(self, websocket: "WebSocket") -> None:
         """
         Accept and manage a WebSocket connection.
 
@@ -28,8 +111,10 @@ class WebSocketPublisher:
             websocket: WebSocket connection to manage
         """
         await websocket.accept()
-        async with self._lock:
-            self._connections.append(websocket)
+        self._loop = asyncio.get_running_loop()
+        channel = _ClientChannel(websocket, self._max_queue)
+        channel.task = asyncio.ensure_future(self._sender(channel))
+        self._channels[id(websocket)] = channel
 
         try:
             # Keep connection alive, waiting for client disconnect
@@ -42,42 +127,115 @@ class WebSocketPublisher:
         finally:
             await self.disconnect(websocket)
 
-    async def disconnect(self, websocket: WebSocket) -> None:
+    async def disconnect(self, websocket: "WebSocket") -> None:
         """
         Remove a WebSocket connection.
 
         Args:
             websocket: WebSocket to remove
         """
-        async with self._lock:
-            if websocket in self._connections:
-                self._connections.remove(websocket)
+        channel = self._channels.pop(id(websocket), None)
+        if channel is None:
+            return
+        with self._stats_lock:
+            self._closed["sent"] += channel.sent
+            self._closed["dropped"] += channel.dropped + len(channel.queue)
+            self._closed["coalesced"] += channel.coalesced
+        channel.queue.clear()
+        channel.pending.clear()
+        task = channel.task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _sender(self, channel: _ClientChannel) -> None:
+        while True:
+            text = channel.take()
+            if text is None:
+                channel.wakeup.clear()
+                await channel.wakeup.wait()
+                continue
+            try:
+                await asyncio.wait_for(channel.websocket.send_text(text), self._send_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                with self._stats_lock:
+                    self._send_errors += 1
+                await self.disconnect(channel.websocket)
+                await self._close(channel.websocket)
+                return
+            channel.sent += 1
+
+    async def _close(self, websocket: "WebSocket") -> None:
+        """Close a dropped client so it stops waiting and can reconnect."""
+        try:
+            # 1013: try again later
+            await asyncio.wait_for(websocket.close(code=1013), self._send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+
+    def _enqueue(self, event_type: str, text: str) -> None:
+        policy = self._policies.get(event_type, "queue")
+        self._broadcasts += 1
+        for channel in list(self._channels.values()):
+            channel.offer(event_type, text, policy)
 
     async def broadcast(self, message: Dict[str, Any]) -> None:
         """
         Broadcast a message to all connected clients.
 
+        Queues the serialized message for every client and returns without
+        waiting for the sends.
+
         Args:
             message: Message dictionary to broadcast as JSON
         """
-        if not self._connections:
+        if not self._channels:
             return
+        self._enqueue(str(message.get("type", "")), json.dumps(message))
 
-        message_json = json.dumps(message)
-        disconnected = []
-
-        async with self._lock:
-            for ws in self._connections:
-                try:
-                    await ws.send_text(message_json)
-                except Exception:
-                    disconnected.append(ws)
+    def publish_threadsafe(self, message: Dict[str, Any]) -> None:
+        """
+        Broadcast from any thread, including ones without an event loop.
 
-            # Clean up disconnected clients
-            for ws in disconnected:
-                if ws in self._connections:
-                    self._connections.remove(ws)
+        The message is serialized on the calling thread and handed to the
+        publisher's loop; no task is created per message.
+        """
+        loop = self._loop
+        if loop is None or not self._channels or loop.is_closed():
+            return
+        text = json.dumps(message)
+        event_type = str(message.get("type", ""))
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(event_type, text)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, event_type, text)
 
     def connection_count(self) -> int:
         """Return the number of active connections."""
-        return len(self._connections)
+        return len(self._channels)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and delivery counters for health reporting."""
+        channels = list(self._channels.values())
+        depths = [len(c.queue) for c in channels]
+        with self._stats_lock:
+            closed = dict(self._closed)
+            send_errors = self._send_errors
+        return {
+            "connections": len(channels),
+            "broadcasts": self._broadcasts,
+            "queue_depth": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "queue_limit": self._max_queue,
+            "sent": closed["sent"] + sum(c.sent for c in channels),
+            "dropped": closed["dropped"] + sum(c.dropped for c in channels),
+            "coalesced": closed["coalesced"] + sum(c.coalesced for c in channels),
+            "send_errors": send_errors,
+        }
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Dict
 
 from abraxas.api.ws import WebSocketPublisher
@@ -14,7 +13,8 @@ def wire_bus_to_ws(bus: EventBus, ws_pub: WebSocketPublisher) -> None:
     Wire event bus to WebSocket publisher.
 
     Events published to the bus are forwarded to all WebSocket clients.
-    Assumes FastAPI event loop is running; uses create_task for async dispatch.
+    Handlers may run on any thread; messages are queued on the publisher's
+    loop per client without spawning a task per event.
 
     Args:
         bus: Event bus to subscribe to
@@ -26,12 +26,7 @@ def wire_bus_to_ws(bus: EventBus, ws_pub: WebSocketPublisher) -> None:
 
         def handler(payload: Dict[str, Any]) -> None:
             """Forward event to WebSocket clients."""
-            try:
-                # Create async task to broadcast (non-blocking)
-                asyncio.create_task(ws_pub.broadcast({"type": event_type, "payload": payload}))
-            except RuntimeError:
-                # No event loop running (e.g., during testing)
-                pass
+            ws_pub.publish_threadsafe({"type": event_type, "payload": payload})
 
         return handler
 
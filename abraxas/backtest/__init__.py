@@ -7,12 +7,14 @@ Components:
 - event_query: Load signal events and ledgers by time range
 - evaluator: Evaluate triggers and score backtest cases
 - schema: Pydantic models for backtest cases and results
+- session: Load events and ledgers once for many cases
 """
 
 from .event_query import load_signal_events, load_domain_ledgers
 from .evaluator import evaluate_trigger, evaluate_case, BacktestResult
 from .schema import BacktestCase, TriggerSpec, BacktestStatus
 from .portfolio import load_portfolios, select_cases_for_portfolio
+from .session import BacktestSession
 
 __all__ = [
     "load_signal_events",
@@ -25,4 +27,5 @@ __all__ = [
     "BacktestStatus",
     "load_portfolios",
     "select_cases_for_portfolio",
+    "BacktestSession",
 ]
@@ -10,7 +10,7 @@ from __future__ import annotations
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from abraxas.backtest.event_query import (
     SignalEvent,
@@ -28,6 +28,9 @@ from abraxas.backtest.schema import (
     TriggerSpec,
 )
 
+if TYPE_CHECKING:
+    from abraxas.backtest.session import BacktestSession
+
 
 def evaluate_trigger(
     trigger: TriggerSpec,
@@ -216,7 +219,10 @@ def _evaluate_index_threshold(
 
 
 def evaluate_case(
-    case: BacktestCase, enable_learning: bool = False, run_id: str = "manual"
+    case: BacktestCase,
+    enable_learning: bool = False,
+    run_id: str = "manual",
+    session: Optional["BacktestSession"] = None,
 ) -> BacktestResult:
     """
     Evaluate a complete backtest case.
@@ -225,21 +231,22 @@ def evaluate_case(
         case: BacktestCase specification
         enable_learning: If True, auto-trigger failure analysis on MISS/ABSTAIN
         run_id: Run identifier for failure analysis
+        session: Optional BacktestSession serving events/ledgers from memory
 
     Returns:
         BacktestResult with status and score
     """
-    # Load events
-    events = load_signal_events(
-        time_min=case.evaluation_window.start_ts,
-        time_max=case.evaluation_window.end_ts,
-    )
+    time_min = case.evaluation_window.start_ts
+    time_max = case.evaluation_window.end_ts
+    if session is not None:
+        events = session.events_in(time_min, time_max)
+        ledgers = session.ledgers_in(time_min, time_max)
+    else:
+        # Load events
+        events = load_signal_events(time_min=time_min, time_max=time_max)
 
-    # Load ledgers
-    ledgers = load_domain_ledgers(
-        time_min=case.evaluation_window.start_ts,
-        time_max=case.evaluation_window.end_ts,
-    )
+        # Load ledgers
+        ledgers = load_domain_ledgers(time_min=time_min, time_max=time_max)
 
     # Check guardrails
     notes = []
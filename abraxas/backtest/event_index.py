@@ -0,0 +1,302 @@
+"""
+Sparse Time Index
+
+Sidecar index over append-only JSONL files (signal events, temporal ledgers)
+so time-window queries seek to and parse only the relevant byte ranges.
+
+The file is cut into blocks of consecutive lines. Each block records its
+byte range, the min/max timestamp of its lines and (optionally) the set of
+sources it contains. Blocks whose range cannot intersect a query window, or
+whose sources cannot match the filter, are skipped. Lines the indexer cannot
+classify (bad JSON, unparseable or naive timestamps) mark their block as
+"always scan", so callers that re-apply their own filters to the returned
+ranges get exactly the results of a full scan.
+
+The sidecar is stored next to the file as <name>.tidx.json and extended
+incrementally as the file grows; a rewritten file triggers a rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from abraxas.core.jsonl_sidecar import (
+    AppendCursor,
+    iter_complete_lines,
+    iter_range_lines,
+    read_sidecar,
+    write_sidecar,
+)
+
+INDEX_VERSION = 1
+DEFAULT_BLOCK_LINES = 256
+MAX_BLOCK_SOURCES = 64
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_us(ts: datetime) -> int:
+    """Exact integer microseconds since epoch for an aware datetime."""
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+
+def _parse_aware(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        return None
+    return ts
+
+
+@dataclass
+class IndexBlock:
+    start: int
+    end: int
+    min_us: Optional[int] = None
+    max_us: Optional[int] = None
+    sources: Optional[List[str]] = field(default_factory=list)
+    always_scan: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "sources": self.sources,
+            "always_scan": self.always_scan,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexBlock":
+        return cls(
+            start=int(data["start"]),
+            end=int(data["end"]),
+            min_us=data.get("min_us"),
+            max_us=data.get("max_us"),
+            sources=data.get("sources"),
+            always_scan=bool(data.get("always_scan", False)),
+        )
+
+
+class SparseTimeIndex:
+    """
+    Timestamp -> byte-offset block index for one JSONL file.
+
+    Args:
+        path: Indexed JSONL file
+        ts_field: Field holding the ISO timestamp
+        source_field: Optional field to build per-block source postings
+        block_lines: Lines per block
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ts_field: str = "timestamp",
+        source_field: Optional[str] = None,
+        block_lines: int = DEFAULT_BLOCK_LINES,
+    ) -> None:
+        self.path = Path(path)
+        self.ts_field = ts_field
+        self.source_field = source_field
+        self.block_lines = max(1, int(block_lines))
+        self.sidecar_path = self.path.with_name(self.path.name + ".tidx.json")
+        self.blocks: List[IndexBlock] = []
+        self._cursor = AppendCursor(self.path)
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self._cursor.indexed_bytes
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Load the sidecar and index any lines appended since it was written."""
+        if not self.path.exists():
+            self._reset()
+            return
+        if not self.blocks and self.indexed_bytes == 0:
+            self._load_sidecar()
+        size = self.path.stat().st_size
+        if not self._cursor.is_current(size):
+            self._reset()
+        if size > self.indexed_bytes:
+            self._index_from(self.indexed_bytes, size)
+            self._save_sidecar()
+
+    def rebuild(self) -> None:
+        """Discard the sidecar and index the whole file."""
+        self._reset()
+        if self.sidecar_path.exists():
+            self.sidecar_path.unlink()
+        self.refresh()
+
+    def _reset(self) -> None:
+        self.blocks = []
+        self._cursor.reset()
+
+    def _index_from(self, offset: int, size: int) -> None:
+        # Only index complete lines; a torn trailing line waits for the next refresh.
+        end = offset
+        block: Optional[IndexBlock] = None
+        lines_in_block = 0
+        sources: set[str] = set()
+        for start, raw in iter_complete_lines(self.path, offset, size):
+            if block is None:
+                block = IndexBlock(start=start, end=start)
+                lines_in_block = 0
+                sources = set()
+            self._classify(raw, block, sources)
+            end = start + len(raw)
+            block.end = end
+            lines_in_block += 1
+            if lines_in_block >= self.block_lines:
+                self._close_block(block, sources)
+                block = None
+        if block is not None:
+            self._close_block(block, sources)
+        if end != offset:
+            self._cursor.advance(end)
+
+    def _classify(self, raw: bytes, block: IndexBlock, sources: set[str]) -> None:
+        if not raw.strip():
+            return
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            block.always_scan = True
+            return
+        if not isinstance(data, dict):
+            block.always_scan = True
+            return
+        ts = _parse_aware(data.get(self.ts_field, ""))
+        if ts is None:
+            block.always_scan = True
+            return
+        us = _to_us(ts)
+        block.min_us = us if block.min_us is None else min(block.min_us, us)
+        block.max_us = us if block.max_us is None else max(block.max_us, us)
+        if self.source_field is not None:
+            source = data.get(self.source_field, "")
+            if isinstance(source, str):
+                sources.add(source)
+            else:
+                block.sources = None
+
+    def _close_block(self, block: IndexBlock, sources: set[str]) -> None:
+        if self.source_field is None or block.sources is None or len(sources) > MAX_BLOCK_SOURCES:
+            block.sources = None
+        else:
+            block.sources = sorted(sources)
+        self.blocks.append(block)
+
+    def _load_sidecar(self) -> None:
+        data = read_sidecar(self.sidecar_path, INDEX_VERSION)
+        if (
+            data is None
+            or data.get("ts_field") != self.ts_field
+            or data.get("source_field") != self.source_field
+            or data.get("block_lines") != self.block_lines
+        ):
+            return
+        self.blocks = [IndexBlock.from_dict(b) for b in data.get("blocks", [])]
+        self._cursor.restore(data)
+
+    def _save_sidecar(self) -> None:
+        # Read-only location: keep the in-memory index for this process.
+        write_sidecar(
+            self.sidecar_path,
+            {
+                "version": INDEX_VERSION,
+                "ts_field": self.ts_field,
+                "source_field": self.source_field,
+                "block_lines": self.block_lines,
+                **self._cursor.to_dict(),
+                "blocks": [b.to_dict() for b in self.blocks],
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def ranges_for(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        sources: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Byte ranges (in file order) that may hold lines in [time_min, time_max].
+
+        Includes any unindexed tail of the file. Callers must still apply
+        their own per-line filters.
+        """
+        self.refresh()
+        lo, hi = _to_us(time_min), _to_us(time_max)
+        wanted = set(sources) if sources else None
+        ranges: List[Tuple[int, int]] = []
+        for block in self.blocks:
+            if not block.always_scan:
+                if block.min_us is None or block.max_us < lo or block.min_us > hi:
+                    continue
+                if wanted is not None and block.sources is not None and not wanted.intersection(block.sources):
+                    continue
+            if ranges and ranges[-1][1] == block.start:
+                ranges[-1] = (ranges[-1][0], block.end)
+            else:
+                ranges.append((block.start, block.end))
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if size > self.indexed_bytes:
+            ranges.append((self.indexed_bytes, size))
+        return ranges
+
+
+def iter_lines_in_ranges(path: str | Path, ranges: Sequence[Tuple[int, int]]) -> Iterator[str]:
+    """Yield decoded lines from the given byte ranges, in order.
+
+    Lines are read one at a time, so a whole-file range does not load the
+    file into memory. Line breaks follow universal newlines, as text-mode
+    iteration of the file would: a lone \\r also ends a line. (The indexer
+    cannot parse a record holding one, so its block is always scanned.)
+    """
+    for raw in iter_range_lines(path, ranges):
+        yield from raw.decode("utf-8").split("\r")
+
+
+def window_ranges(
+    path: str | Path,
+    time_min: datetime,
+    time_max: datetime,
+    *,
+    ts_field: str = "timestamp",
+    source_field: Optional[str] = None,
+    sources: Optional[Sequence[str]] = None,
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Byte ranges to scan for a window, or None when the index cannot be used
+    (naive query bounds compare differently from aware file timestamps).
+    """
+    if time_min.tzinfo is None or time_max.tzinfo is None:
+        return None
+    key = (str(Path(path).resolve()), ts_field, source_field)
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        index = SparseTimeIndex(path, ts_field=ts_field, source_field=source_field)
+        _INDEX_CACHE[key] = index
+    return index.ranges_for(time_min, time_max, sources)
+
+
+_INDEX_CACHE: Dict[Tuple[str, str, Optional[str]], SparseTimeIndex] = {}
@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from abraxas.backtest.event_index import iter_lines_in_ranges, window_ranges
+
 
 class SignalEvent:
     """
@@ -57,6 +59,7 @@ def load_signal_events(
     time_max: datetime,
     source_labels: Optional[List[str]] = None,
     events_path: str | Path | None = None,
+    use_index: bool = True,
 ) -> List[SignalEvent]:
     """
     Load signal events from local JSONL file within time range.
@@ -66,6 +69,7 @@ def load_signal_events(
         time_max: Maximum timestamp (inclusive)
         source_labels: Optional filter by source labels
         events_path: Path to events file (default: data/signals/events.jsonl)
+        use_index: Seek via the sparse time index sidecar instead of a full scan
 
     Returns:
         List of SignalEvent objects, sorted by (timestamp, event_id)
@@ -80,29 +84,34 @@ def load_signal_events(
     if not events_path.exists():
         return events
 
-    with open(events_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                data = json.loads(line)
-                event = SignalEvent.from_dict(data)
+    ranges = window_ranges(
+        events_path, time_min, time_max, source_field="source", sources=source_labels
+    ) if use_index else None
+    if ranges is None:
+        ranges = [(0, events_path.stat().st_size)]
 
-                # Time filter
-                if not (time_min <= event.timestamp <= time_max):
-                    continue
+    for line in iter_lines_in_ranges(events_path, ranges):
+        line = line.strip()
+        if not line:
+            continue
 
-                # Source filter
-                if source_labels and event.source not in source_labels:
-                    continue
+        try:
+            data = json.loads(line)
+            event = SignalEvent.from_dict(data)
 
-                events.append(event)
+            # Time filter
+            if not (time_min <= event.timestamp <= time_max):
+                continue
 
-            except (json.JSONDecodeError, KeyError):
+            # Source filter
+            if source_labels and event.source not in source_labels:
                 continue
 
+            events.append(event)
+
+        except (json.JSONDecodeError, KeyError):
+            continue
+
     # Deterministic ordering
     events.sort(key=lambda e: (e.timestamp, e.event_id))
 
@@ -113,6 +122,7 @@ def load_domain_ledgers(
     time_min: datetime,
     time_max: datetime,
     ledger_dir: str | Path | None = None,
+    use_index: bool = True,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Load domain ledgers (oracle_delta, integrity, tau, etc.) within time range.
@@ -121,6 +131,7 @@ def load_domain_ledgers(
         time_min: Minimum timestamp (inclusive)
         time_max: Maximum timestamp (inclusive)
         ledger_dir: Directory containing ledgers (default: out/temporal_ledgers)
+        use_index: Seek via the sparse time index sidecar instead of a full scan
 
     Returns:
         Dict mapping ledger_name -> list of entries
@@ -148,33 +159,36 @@ def load_domain_ledgers(
         if not ledger_path.exists():
             continue
 
+        ranges = window_ranges(ledger_path, time_min, time_max) if use_index else None
+        if ranges is None:
+            ranges = [(0, ledger_path.stat().st_size)]
+
         entries = []
-        with open(ledger_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        for line in iter_lines_in_ranges(ledger_path, ranges):
+            line = line.strip()
+            if not line:
+                continue
 
-                try:
-                    entry = json.loads(line)
+            try:
+                entry = json.loads(line)
 
-                    # Parse timestamp
-                    timestamp_str = entry.get("timestamp", "")
-                    try:
-                        timestamp = datetime.fromisoformat(
-                            timestamp_str.replace("Z", "+00:00")
-                        )
-                    except (ValueError, AttributeError):
-                        continue
+                # Parse timestamp
+                timestamp_str = entry.get("timestamp", "")
+                try:
+                    timestamp = datetime.fromisoformat(
+                        timestamp_str.replace("Z", "+00:00")
+                    )
+                except (ValueError, AttributeError):
+                    continue
 
-                    # Time filter
-                    if not (time_min <= timestamp <= time_max):
-                        continue
+                # Time filter
+                if not (time_min <= timestamp <= time_max):
+                    continue
 
-                    entries.append(entry)
+                entries.append(entry)
 
-                except (json.JSONDecodeError, KeyError):
-                    continue
+            except (json.JSONDecodeError, KeyError):
+                continue
 
         # Deterministic ordering
         entries.sort(key=lambda e: e.get("timestamp", ""))
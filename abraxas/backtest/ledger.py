@@ -11,10 +11,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from abraxas.core.provenance import hash_canonical_json
+from abraxas.core.hash_chain import HashChainLedger
 from abraxas.backtest.schema import BacktestResult
 
 
+def _dumps_entry(entry: Dict[str, Any]) -> str:
+    return json.dumps(entry, default=str, sort_keys=True)
+
+
 class BacktestLedger:
     """
     Append-only ledger for backtest results.
@@ -35,6 +39,7 @@ class BacktestLedger:
         if ledger_path is None:
             ledger_path = Path("out/backtest_ledgers/backtest_runs.jsonl")
         self.ledger_path = Path(ledger_path)
+        self._chain = HashChainLedger(self.ledger_path, dumps=_dumps_entry)
         self._ensure_ledger_exists()
 
     def _ensure_ledger_exists(self) -> None:
@@ -56,55 +61,43 @@ class BacktestLedger:
         Returns:
             SHA256 hash of ledger entry
         """
-        # Get previous hash
-        prev_hash = self._get_last_hash()
-
-        # Build entry
-        entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "backtest_run_id": backtest_run_id,
-            "case_id": result.case_id,
-            "status": result.status.value,
-            "score": result.score,
-            "confidence": result.confidence.value,
-            "satisfied_triggers": result.satisfied_triggers,
-            "satisfied_falsifiers": result.satisfied_falsifiers,
-            "notes": result.notes,
-            "provenance": result.provenance,
-            "evaluated_at": result.evaluated_at.isoformat(),
-            "prev_hash": prev_hash,
-        }
+        return self.append_results(backtest_run_id, [result])[0]
 
-        # Hash entry
-        step_hash = hash_canonical_json(entry)
-        entry["step_hash"] = step_hash
+    def append_results(
+        self, backtest_run_id: str, results: List[BacktestResult]
+    ) -> List[str]:
+        """
+        Append several backtest results in one write.
 
-        # Append to file
-        with open(self.ledger_path, "a") as f:
-            f.write(json.dumps(entry, default=str, sort_keys=True) + "\n")
+        Args:
+            backtest_run_id: Unique run ID
+            results: BacktestResult instances, in ledger order
 
-        return step_hash
+        Returns:
+            SHA256 hash of each ledger entry
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        entries = [
+            {
+                "timestamp": timestamp,
+                "backtest_run_id": backtest_run_id,
+                "case_id": result.case_id,
+                "status": result.status.value,
+                "score": result.score,
+                "confidence": result.confidence.value,
+                "satisfied_triggers": result.satisfied_triggers,
+                "satisfied_falsifiers": result.satisfied_falsifiers,
+                "notes": result.notes,
+                "provenance": result.provenance,
+                "evaluated_at": result.evaluated_at.isoformat(),
+            }
+            for result in results
+        ]
+        return self._chain.append_many(entries)
 
     def _get_last_hash(self) -> str:
         """Get hash of last ledger entry."""
-        if not self.ledger_path.exists():
-            return "0" * 64  # Genesis hash
-
-        last_line = None
-        with open(self.ledger_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    last_line = line
-
-        if last_line is None:
-            return "0" * 64
-
-        try:
-            last_entry = json.loads(last_line)
-            return last_entry.get("step_hash", "0" * 64)
-        except json.JSONDecodeError:
-            return "0" * 64
+        return self._chain.head()
 
     def read_all(self) -> List[Dict[str, Any]]:
         """Read all entries from ledger."""
@@ -161,35 +154,18 @@ class BacktestLedger:
 
         return list(latest_by_case.values())
 
-    def verify_chain_integrity(self) -> bool:
+    def verify_chain_integrity(self, incremental: bool = False) -> bool:
         """
         Verify hash chain integrity.
 
+        Args:
+            incremental: Only re-hash entries appended since the last
+                verification (hot paths; does not re-check older entries)
+
         Returns:
             True if chain is valid
         """
-        entries = self.read_all()
-
-        if not entries:
-            return True
-
-        prev_hash = "0" * 64
-        for entry in entries:
-            claimed_prev = entry.get("prev_hash", "")
-            if claimed_prev != prev_hash:
-                return False
-
-            # Verify step_hash
-            entry_copy = entry.copy()
-            claimed_step = entry_copy.pop("step_hash", "")
-            computed_step = hash_canonical_json(entry_copy)
-
-            if claimed_step != computed_step:
-                return False
-
-            prev_hash = claimed_step
-
-        return True
+        return self._chain.verify_chain_integrity(incremental=incremental)
 
     def get_summary(self) -> Dict[str, Any]:
         """Get ledger summary statistics."""
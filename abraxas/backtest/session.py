@@ -0,0 +1,223 @@
+"""
+Backtest Session
+
+Loads signal events and domain ledgers once and serves every case window
+from memory, instead of re-reading the files for each case. Rows are kept
+sorted by parsed timestamp so a window is two binary searches; each slice
+is then put in the same order load_signal_events()/load_domain_ledgers()
+return, so results match evaluate_case() without a session exactly.
+
+Cases can be evaluated across a process pool; results come back in case
+order regardless of which worker finished first.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from abraxas.backtest.event_index import iter_lines_in_ranges
+from abraxas.backtest.event_query import SignalEvent
+from abraxas.backtest.schema import BacktestCase, BacktestResult
+
+DEFAULT_EVENTS_PATH = Path("data/signals/events.jsonl")
+DEFAULT_LEDGER_DIR = Path("out/temporal_ledgers")
+
+# Same ledger set as load_domain_ledgers().
+LEDGER_FILES = {
+    "oracle_delta": "oracle_delta.jsonl",
+    "integrity": "integrity_ledger.jsonl",
+    "tau": "tau_ledger.jsonl",
+    "mw": "mw_ledger.jsonl",
+}
+
+
+class _SortedLedger:
+    """Ledger entries sorted by parsed timestamp, with their file position."""
+
+    def __init__(self, rows: List[Tuple[datetime, int, Dict[str, Any]]]) -> None:
+        rows.sort(key=lambda r: (r[0], r[1]))
+        self.times = [r[0] for r in rows]
+        self.rows = rows
+
+    def window(self, time_min: datetime, time_max: datetime) -> List[Dict[str, Any]]:
+        lo = bisect_left(self.times, time_min)
+        hi = bisect_right(self.times, time_max)
+        # load_domain_ledgers() sorts by the raw timestamp string (stable).
+        picked = sorted(self.rows[lo:hi], key=lambda r: (r[2].get("timestamp", ""), r[1]))
+        return [r[2] for r in picked]
+
+
+class BacktestSession:
+    """
+    Shared, in-memory event and ledger store for evaluating many cases.
+
+    Args:
+        events_path: Signal events JSONL (default: data/signals/events.jsonl)
+        ledger_dir: Temporal ledger directory (default: out/temporal_ledgers)
+        workers: Processes used by evaluate_cases() (1 = in-process)
+    """
+
+    def __init__(
+        self,
+        events_path: str | Path | None = None,
+        ledger_dir: str | Path | None = None,
+        *,
+        workers: int = 1,
+    ) -> None:
+        self.events_path = Path(events_path) if events_path is not None else DEFAULT_EVENTS_PATH
+        self.ledger_dir = Path(ledger_dir) if ledger_dir is not None else DEFAULT_LEDGER_DIR
+        self.workers = max(1, int(workers))
+        self._loaded = False
+        self._event_times: List[datetime] = []
+        self._events: List[SignalEvent] = []
+        self._ledgers: Dict[str, _SortedLedger] = {}
+        self._pool: Optional[Executor] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_pool"] = None
+        return state
+
+    def __enter__(self) -> "BacktestSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """Read events and ledgers (once)."""
+        if self._loaded:
+            return
+        self._load_events()
+        self._load_ledgers()
+        self._loaded = True
+
+    def _load_events(self) -> None:
+        events: List[SignalEvent] = []
+        if self.events_path.exists():
+            size = self.events_path.stat().st_size
+            for line in iter_lines_in_ranges(self.events_path, [(0, size)]):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(SignalEvent.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        events.sort(key=lambda e: (e.timestamp, e.event_id))
+        self._events = events
+        self._event_times = [e.timestamp for e in events]
+
+    def _load_ledgers(self) -> None:
+        self._ledgers = {}
+        if not self.ledger_dir.exists():
+            return
+        for ledger_name, filename in LEDGER_FILES.items():
+            ledger_path = self.ledger_dir / filename
+            if not ledger_path.exists():
+                continue
+            rows: List[Tuple[datetime, int, Dict[str, Any]]] = []
+            size = ledger_path.stat().st_size
+            for pos, line in enumerate(iter_lines_in_ranges(ledger_path, [(0, size)])):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    timestamp = datetime.fromisoformat(
+                        entry.get("timestamp", "").replace("Z", "+00:00")
+                    )
+                except (json.JSONDecodeError, KeyError, ValueError, AttributeError):
+                    continue
+                rows.append((timestamp, pos, entry))
+            self._ledgers[ledger_name] = _SortedLedger(rows)
+
+    # ------------------------------------------------------------------
+    # Window queries
+    # ------------------------------------------------------------------
+
+    def events_in(self, time_min: datetime, time_max: datetime) -> List[SignalEvent]:
+        """Events with time_min <= timestamp <= time_max, as load_signal_events() orders them."""
+        self.load()
+        lo = bisect_left(self._event_times, time_min)
+        hi = bisect_right(self._event_times, time_max)
+        return self._events[lo:hi]
+
+    def ledgers_in(self, time_min: datetime, time_max: datetime) -> Dict[str, List[Dict[str, Any]]]:
+        """Ledger entries in the window, keyed like load_domain_ledgers()."""
+        self.load()
+        return {name: ledger.window(time_min, time_max) for name, ledger in self._ledgers.items()}
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate_case(
+        self, case: BacktestCase, enable_learning: bool = False, run_id: str = "manual"
+    ) -> BacktestResult:
+        """evaluate_case() against the session's events and ledgers."""
+        from abraxas.backtest.evaluator import evaluate_case
+
+        return evaluate_case(case, enable_learning=enable_learning, run_id=run_id, session=self)
+
+    def evaluate_cases(
+        self,
+        cases: Iterable[BacktestCase],
+        *,
+        enable_learning: bool = False,
+        run_id: str = "manual",
+    ) -> List[BacktestResult]:
+        """
+        Evaluate cases, in parallel when workers > 1.
+
+        Returns:
+            Results in the order of cases
+        """
+        cases = list(cases)
+        self.load()
+        if self.workers <= 1 or len(cases) <= 1:
+            return [self.evaluate_case(case, enable_learning, run_id) for case in cases]
+        pool = self._get_pool()
+        jobs = [(case, enable_learning, run_id) for case in cases]
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        # map() yields in submission order.
+        return list(pool.map(_evaluate_in_worker, jobs, chunksize=chunksize))
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            # The loaded session is handed to each worker once, not per case.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+_WORKER_SESSION: Optional[BacktestSession] = None
+
+
+def _init_worker(session: BacktestSession) -> None:
+    global _WORKER_SESSION
+    _WORKER_SESSION = session
+
+
+def _evaluate_in_worker(job: Tuple[BacktestCase, bool, str]) -> BacktestResult:
+    case, enable_learning, run_id = job
+    assert _WORKER_SESSION is not None
+    return _WORKER_SESSION.evaluate_case(case, enable_learning, run_id)
@@ -224,11 +224,11 @@ def main():
 
         backtest_run_id = f"backtest_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
 
-        for result_dict in results:
-            from abraxas.backtest.schema import BacktestResult
+        from abraxas.backtest.schema import BacktestResult
 
-            result = BacktestResult(**result_dict)
-            ledger.append_result(backtest_run_id, result)
+        ledger.append_results(
+            backtest_run_id, [BacktestResult(**result_dict) for result_dict in results]
+        )
 
         print(f"  Wrote {len(results)} results to {args.ledger_path}")
         print("")
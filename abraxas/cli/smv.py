@@ -17,6 +17,7 @@ def run_smv_cli(args) -> int:
         portfolios_path=args.portfolios_path,
         vector_map_path=args.vector_map,
         max_units=args.max_units,
+        workers=getattr(args, "workers", 1),
     )
 
     print("Baseline Scores:", report["baseline_scores"])
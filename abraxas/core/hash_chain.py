@@ -0,0 +1,260 @@
+"""
+Hash-Chained JSONL Ledger
+
+Shared append/verify primitive for the append-only ledgers whose entries
+carry a `prev_hash` link and a `step_hash` over the canonical entry.
+
+The chain head is never found by re-reading the file. It is served from
+memory or from a small sidecar (<name>.head.json) while the ledger's
+size/mtime still match, and otherwise recovered by reading backward from
+EOF to the last non-empty line. The sidecar also holds a verification
+checkpoint: verify_chain_integrity(incremental=True) only re-hashes entries
+appended since the last successful verification. That mode trusts the
+sidecar and the already-verified history, so it is opt-in for hot paths;
+the default always re-hashes the whole chain.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from abraxas.core.provenance import hash_canonical_json
+
+
+SIDECAR_VERSION = 1
+_TAIL_CHUNK = 4096
+
+
+def _dumps_sorted(entry: Dict[str, Any]) -> str:
+    return json.dumps(entry, sort_keys=True)
+
+
+def read_last_line(path: Path) -> Optional[bytes]:
+    """Return the last non-empty line of a file by reading backward from EOF."""
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        tail = b""
+        while pos > 0:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            stripped = tail.rstrip()
+            if not stripped:
+                continue
+            cut = stripped.rfind(b"\n")
+            if cut >= 0 or pos == 0:
+                return stripped[cut + 1 :].strip()
+    return None
+
+
+class HashChainLedger:
+    """
+    Append-only JSONL ledger with a `prev_hash` -> `step_hash` chain.
+
+    Args:
+        path: Ledger file
+        genesis: prev_hash of the first entry
+        dumps: Serializer for one ledger line (without the newline)
+        hash_fn: Hash over an entry without its step_hash
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        genesis: str = "0" * 64,
+        dumps: Callable[[Dict[str, Any]], str] = _dumps_sorted,
+        hash_fn: Callable[[Any], str] = hash_canonical_json,
+    ) -> None:
+        self.path = Path(path)
+        self.genesis = genesis
+        self.dumps = dumps
+        self.hash_fn = hash_fn
+        self.sidecar_path = self.path.with_name(self.path.name + ".head.json")
+        self._state: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------
+    # Chain head
+    # ------------------------------------------------------------------
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self._state is None:
+            self._state = {}
+            try:
+                data = json.loads(self.sidecar_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = None
+            if isinstance(data, dict) and data.get("version") == SIDECAR_VERSION:
+                self._state = data
+        return self._state
+
+    def _save_state(self) -> None:
+        state = dict(self._load_state())
+        state["version"] = SIDECAR_VERSION
+        try:
+            tmp = self.sidecar_path.with_name(self.sidecar_path.name + ".tmp")
+            tmp.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+            tmp.replace(self.sidecar_path)
+        except OSError:
+            # Read-only location: the in-memory state still serves this process.
+            pass
+
+    def _hash_of_line(self, line: Optional[bytes]) -> str:
+        if not line:
+            return self.genesis
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return self.genesis
+        if not isinstance(entry, dict):
+            return self.genesis
+        return entry.get("step_hash", self.genesis)
+
+    def head(self) -> str:
+        """Return the step_hash of the last entry (genesis for an empty ledger)."""
+        stat = self._stat()
+        if stat is None or stat[0] == 0:
+            return self.genesis
+        state = self._load_state()
+        if state.get("size") == stat[0] and state.get("mtime_ns") == stat[1] and "head" in state:
+            return state["head"]
+        head = self._hash_of_line(read_last_line(self.path))
+        state.update({"size": stat[0], "mtime_ns": stat[1], "head": head})
+        return head
+
+    # ------------------------------------------------------------------
+    # Appends
+    # ------------------------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]) -> str:
+        """
+        Link an entry to the chain head and append it.
+
+        Sets entry["prev_hash"] and entry["step_hash"] in place.
+
+        Returns:
+            The entry's step_hash
+        """
+        return self.append_many([entry])[0]
+
+    def append_many(self, entries: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Append several entries with one head lookup and one write.
+
+        Returns:
+            step_hash of each entry, in order
+        """
+        prev_hash = self.head()
+        lines: List[str] = []
+        hashes: List[str] = []
+        for entry in entries:
+            entry["prev_hash"] = prev_hash
+            entry.pop("step_hash", None)
+            step_hash = self.hash_fn(entry)
+            entry["step_hash"] = step_hash
+            lines.append(self.dumps(entry) + "\n")
+            hashes.append(step_hash)
+            prev_hash = step_hash
+        if not lines:
+            return hashes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write("".join(lines))
+        stat = self._stat()
+        if stat is not None:
+            self._load_state().update({"size": stat[0], "mtime_ns": stat[1], "head": prev_hash})
+            self._save_state()
+        return hashes
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def _checkpoint(self, size: int) -> Tuple[int, str, int]:
+        """(offset, prev_hash, entries) to resume verification from."""
+        state = self._load_state()
+        offset = state.get("verified_offset")
+        line_start = state.get("verified_line_start")
+        digest = state.get("verified_line_sha")
+        if not isinstance(offset, int) or not isinstance(line_start, int) or not (0 < offset <= size):
+            return 0, self.genesis, 0
+        with self.path.open("rb") as f:
+            f.seek(line_start)
+            line = f.read(offset - line_start)
+        if hashlib.sha256(line).hexdigest() != digest:
+            return 0, self.genesis, 0
+        return offset, str(state.get("verified_hash")), int(state.get("verified_entries", 0))
+
+    def verify_chain_integrity(self, *, incremental: bool = False) -> bool:
+        """
+        Verify prev_hash links and step_hashes.
+
+        Re-hashes the whole chain by default. With `incremental`, resumes
+        after the last verified entry (unless the checkpointed line no longer
+        matches); edits to entries before the checkpoint are then not seen.
+        Lines that are not valid JSON are skipped, as in the readers.
+        """
+        stat = self._stat()
+        if stat is None or stat[0] == 0:
+            return True
+        size = stat[0]
+        offset, prev_hash, count = self._checkpoint(size) if incremental else (0, self.genesis, 0)
+
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            data = f.read(size - offset)
+
+        pos = offset
+        checkpoint: Optional[Tuple[int, int, bytes, str, int]] = None
+        for raw in data.splitlines(keepends=True):
+            start = pos
+            pos += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict) or entry.get("prev_hash", "") != prev_hash:
+                return False
+            claimed = entry.pop("step_hash", "")
+            if claimed != self.hash_fn(entry):
+                return False
+            prev_hash = claimed
+            count += 1
+            # Only complete lines become a checkpoint; a torn tail is re-read next time.
+            if raw.endswith(b"\n"):
+                checkpoint = (pos, start, raw, prev_hash, count)
+
+        if checkpoint is not None:
+            end, start, raw, head, entries = checkpoint
+            self._load_state().update(
+                {
+                    "verified_offset": end,
+                    "verified_line_start": start,
+                    "verified_line_sha": hashlib.sha256(raw).hexdigest(),
+                    "verified_hash": head,
+                    "verified_entries": entries,
+                }
+            )
+            self._save_state()
+        return True
@@ -0,0 +1,138 @@
+"""
+Incremental JSONL Sidecars
+
+Shared plumbing for derived state (indexes, rollups, per-key folds) kept in
+a sidecar file next to an append-only JSONL file and extended as it grows.
+
+An AppendCursor records how many bytes of the source have been folded in,
+plus sha256 fingerprints of the first and last 4 KB of that prefix. If the
+file shrank or either fingerprint changed, the source was rewritten and the
+derived state must be rebuilt from offset 0. Only complete lines are folded;
+a torn trailing line is picked up once its newline lands.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+
+FINGERPRINT_BYTES = 4096
+
+
+def prefix_fingerprints(path: str | Path, upto: int) -> Tuple[str, str]:
+    """sha256 of the first and last FINGERPRINT_BYTES of the file's first `upto` bytes."""
+    if upto <= 0:
+        return "", ""
+    with open(path, "rb") as f:
+        head = f.read(min(upto, FINGERPRINT_BYTES))
+        tail_start = max(0, upto - FINGERPRINT_BYTES)
+        f.seek(tail_start)
+        tail = f.read(upto - tail_start)
+    return hashlib.sha256(head).hexdigest(), hashlib.sha256(tail).hexdigest()
+
+
+class AppendCursor:
+    """How far an append-only file has been folded into derived state."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = path
+        self.indexed_bytes = 0
+        self.head_sha = ""
+        self.tail_sha = ""
+
+    def reset(self) -> None:
+        self.indexed_bytes = 0
+        self.head_sha = ""
+        self.tail_sha = ""
+
+    def is_current(self, size: int) -> bool:
+        """False if the folded prefix was truncated or rewritten."""
+        if size < self.indexed_bytes:
+            return False
+        if self.indexed_bytes == 0:
+            return True
+        return prefix_fingerprints(self.path, self.indexed_bytes) == (self.head_sha, self.tail_sha)
+
+    def advance(self, offset: int) -> None:
+        """Mark the file folded up to `offset` and re-fingerprint the prefix."""
+        self.indexed_bytes = offset
+        self.head_sha, self.tail_sha = prefix_fingerprints(self.path, offset)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "indexed_bytes": self.indexed_bytes,
+            "head_sha": self.head_sha,
+            "tail_sha": self.tail_sha,
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Load offset and fingerprints written by to_dict()."""
+        self.indexed_bytes = int(data.get("indexed_bytes", 0))
+        self.head_sha = str(data.get("head_sha", ""))
+        self.tail_sha = str(data.get("tail_sha", ""))
+
+
+def iter_complete_lines(path: str | Path, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    Stream (offset, raw line with newline) for the complete lines in [start, end).
+
+    An unterminated last line is not yielded.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            raw = f.readline(end - pos)
+            if not raw or not raw.endswith(b"\n"):
+                return
+            yield pos, raw
+            pos += len(raw)
+
+
+def iter_range_lines(path: str | Path, ranges: Sequence[Tuple[int, int]]) -> Iterator[bytes]:
+    """Stream the lines (without newlines) in the given byte ranges, in order."""
+    with open(path, "rb") as f:
+        for start, end in ranges:
+            f.seek(start)
+            pos = start
+            while pos < end:
+                raw = f.readline(end - pos)
+                if not raw:
+                    break
+                pos += len(raw)
+                yield raw.rstrip(b"\r\n")
+
+
+def read_sidecar(path: str | Path, version: int) -> Optional[Dict[str, Any]]:
+    """Sidecar payload, or None if missing, unreadable or another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    return data
+
+
+def write_sidecar(path: str | Path, payload: Dict[str, Any], *, sort_keys: bool = True) -> bool:
+    """
+    Atomically replace a sidecar (tmp file + rename).
+
+    Returns:
+        False if the location is not writable; callers keep their
+        in-memory state for this process
+    """
+    text = json.dumps(payload, sort_keys=sort_keys, separators=(",", ":"))
+    tmp = str(path) + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    return True
@@ -7,20 +7,32 @@ This module provides three complementary temporal metrics:
 
 All computations are deterministic with provenance embedding.
 Silence-as-signal: missing observations affect decay/velocity calculations.
+
+compute_snapshots_batch() computes the same metrics for many terms at once
+from a columnar observation table. It orders each term's rows as
+compute_snapshot() does (by timestamp text when given), handles timestamps
+as integer microseconds and sums each term's rows with builtin sum() in
+that order, so batch results are bit-identical to compute_snapshot().
 """
 
 from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from abraxas.core.canonical import canonical_json, sha256_hex
 from abraxas.core.provenance import Provenance
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US_PER_S = 1e6
+
+
 class ConfidenceLevel(str, Enum):
     """Confidence band for τ measurements."""
 
@@ -134,19 +146,7 @@ class TauCalculator:
             "current_time_utc": current_ts.isoformat().replace("+00:00", "Z"),
         }
         inputs_hash = sha256_hex(canonical_json(inputs_obj))
-        config_hash = sha256_hex(
-            canonical_json(
-                {
-                    "operator": "TauCalculator.v1",
-                    "thresholds": {
-                        "min_samples_med": self.MIN_SAMPLES_MED,
-                        "min_samples_high": self.MIN_SAMPLES_HIGH,
-                        "min_window_hours": self.MIN_WINDOW_HOURS,
-                        "max_variance_high": self.MAX_VARIANCE_HIGH,
-                    },
-                }
-            )
-        )
+        config_hash = self._config_hash()
 
         prov = Provenance(
             run_id=run_id or "tau-calc",
@@ -167,6 +167,234 @@ class TauCalculator:
             provenance=prov,
         )
 
+    def compute_snapshots_batch(
+        self,
+        term_ids: Sequence[str],
+        epoch_s: Sequence[float],
+        values: Sequence[float],
+        *,
+        ts: Optional[Sequence[str]] = None,
+        run_id: Optional[str] = None,
+        current_time_utc: Optional[str] = None,
+    ) -> Dict[str, TauSnapshot]:
+        """
+        Compute τ snapshots for many terms from a columnar observation table.
+
+        Row i is one observation of term_ids[i] at epoch_s[i] (seconds since
+        the Unix epoch, microsecond resolution) with value values[i]. Rows
+        need not be grouped or sorted. Metrics are identical to calling
+        compute_snapshot() per term; provenance hashes the whole table once,
+        so all snapshots of a batch share one Provenance record.
+
+        compute_snapshot() orders a term's observations by their ts strings.
+        Pass the same strings as `ts` to reproduce that order exactly;
+        without them rows are ordered by epoch_s, which agrees whenever a
+        term's timestamps share one format (precision and UTC offset).
+        Ties keep input order in both cases.
+
+        Args:
+            term_ids: Term identifier per row
+            epoch_s: Observation time per row
+            values: Observation value per row
+            ts: Optional ISO timestamp text per row, used for ordering
+            run_id: Optional run identifier
+            current_time_utc: Optional reference time (defaults to now)
+
+        Returns:
+            Dict of term_id -> TauSnapshot, in sorted term order
+        """
+        terms = np.asarray(term_ids)
+        ts_us = np.rint(np.asarray(epoch_s, dtype=np.float64) * _US_PER_S).astype(np.int64)
+        vals = np.asarray(values, dtype=np.float64)
+        if not (terms.shape == ts_us.shape == vals.shape) or terms.ndim != 1:
+            raise ValueError("term_ids, epoch_s and values must be 1-D columns of equal length")
+        if ts is not None and len(ts) != terms.size:
+            raise ValueError("ts must have one entry per row")
+        if terms.size == 0:
+            return {}
+
+        current_ts = (
+            self._parse_iso(current_time_utc)
+            if current_time_utc
+            else datetime.now(timezone.utc)
+        )
+        current_us = (current_ts - _EPOCH) // timedelta(microseconds=1)
+
+        uniq, group = np.unique(terms, return_inverse=True)
+        group = group.reshape(-1)
+        # Stable: ties keep input order, as sorted() does in the scalar path.
+        if ts is None:
+            order = np.lexsort((ts_us, group))
+        else:
+            # np.unique sorts str by code point, like Python string comparison.
+            ts_rank = np.unique(np.asarray(ts, dtype=str), return_inverse=True)[1].reshape(-1)
+            order = np.lexsort((ts_rank, group))
+        group, ts_us, vals = group[order], ts_us[order], vals[order]
+        g = len(uniq)
+        counts = np.bincount(group, minlength=g)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        first_us = ts_us[starts]
+        last_us = ts_us[starts + counts - 1]
+
+        window_hours = (last_us - first_us) / _US_PER_S / 3600.0
+        since_last_hours = (current_us - last_us) / _US_PER_S / 3600.0
+
+        tau_h = self._batch_half_life(group, ts_us, counts, since_last_hours)
+        tau_v, mean_y = self._batch_velocity(group, ts_us, vals, counts, first_us)
+        tau_p = self._batch_phase_proximity(tau_h, tau_v)
+        confidence = self._batch_confidence(group, vals, counts, mean_y, window_hours)
+
+        inputs_hash = sha256_hex(
+            canonical_json(
+                {
+                    "table_sha256": sha256_hex(
+                        canonical_json([str(t) for t in uniq[group]])
+                        + sha256_hex(ts_us.tobytes())
+                        + sha256_hex(vals.tobytes())
+                    ),
+                    "current_time_utc": current_ts.isoformat().replace("+00:00", "Z"),
+                }
+            )
+        )
+        prov = Provenance(
+            run_id=run_id or "tau-calc",
+            started_at_utc=Provenance.now_iso_z(),
+            inputs_hash=inputs_hash,
+            config_hash=self._config_hash(),
+            git_sha=self._git_sha,
+            host=self._host,
+        )
+
+        return {
+            str(uniq[k]): TauSnapshot(
+                tau_half_life=float(tau_h[k]),
+                tau_velocity=float(tau_v[k]),
+                tau_phase_proximity=float(tau_p[k]),
+                confidence=confidence[k],
+                observation_count=int(counts[k]),
+                observation_window_hours=float(window_hours[k]),
+                provenance=prov,
+            )
+            for k in range(g)
+        }
+
+    @staticmethod
+    def _group_sum(group: np.ndarray, weights: np.ndarray, g: int) -> np.ndarray:
+        """Builtin sum() over each group's rows, in order (`group` is sorted).
+
+        sum() is compensated on Python 3.12+, so np.bincount would not match
+        the scalar path bit for bit.
+        """
+        flat = weights.tolist()
+        out = np.zeros(g, dtype=np.float64)
+        pos = 0
+        for k, n in enumerate(np.bincount(group, minlength=g).tolist()):
+            out[k] = sum(flat[pos : pos + n])
+            pos += n
+        return out
+
+    def _batch_half_life(
+        self,
+        group: np.ndarray,
+        ts_us: np.ndarray,
+        counts: np.ndarray,
+        since_last_hours: np.ndarray,
+    ) -> np.ndarray:
+        g = len(counts)
+        same = group[1:] == group[:-1]
+        intervals = (ts_us[1:] - ts_us[:-1])[same] / _US_PER_S / 3600.0
+        n_intervals = np.maximum(counts - 1, 1)
+        mean_interval = self._group_sum(group[1:][same], intervals, g) / n_intervals
+
+        recency = np.where(
+            since_last_hours > mean_interval,
+            mean_interval / np.maximum(since_last_hours, 1.0),
+            1.0,
+        )
+        half_life = np.maximum(1.0, np.minimum(mean_interval * recency, 8760.0))
+        sparse = np.maximum(1.0, 24.0 - since_last_hours)
+        return np.where(counts < 2, sparse, half_life)
+
+    def _batch_velocity(
+        self,
+        group: np.ndarray,
+        ts_us: np.ndarray,
+        vals: np.ndarray,
+        counts: np.ndarray,
+        first_us: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (velocity, mean value) per group."""
+        g = len(counts)
+        x = (ts_us - first_us[group]) / _US_PER_S / 3600.0
+        mean_x = self._group_sum(group, x, g) / counts
+        mean_y = self._group_sum(group, vals, g) / counts
+        dx = x - mean_x[group]
+        dy = vals - mean_y[group]
+        numerator = self._group_sum(group, dx * dy, g)
+        denominator = self._group_sum(group, dx**2, g)
+        safe = np.where(denominator == 0, 1.0, denominator)
+        velocity = np.where((counts < 2) | (denominator == 0), 0.0, numerator / safe * 24.0)
+        return velocity, mean_y
+
+    @staticmethod
+    def _batch_phase_proximity(tau_h: np.ndarray, tau_v: np.ndarray) -> np.ndarray:
+        """Vectorized _compute_phase_proximity (same branch order)."""
+        return np.select(
+            [
+                (tau_h < 24) & (tau_v < -0.5),
+                (tau_h < 48) & (tau_v > 0.5),
+                (tau_h >= 48) & (tau_h < 168) & (tau_v > 0),
+                (tau_h >= 168) & (np.abs(tau_v) < 0.1),
+                tau_v < -0.1,
+            ],
+            [
+                np.full_like(tau_h, 0.1),
+                np.minimum(tau_h / 48.0, 1.0),
+                tau_h / 168.0,
+                1.0 - np.abs(tau_v) / 0.1,
+                np.maximum(0.0, (168 - tau_h) / 144.0),
+            ],
+            default=0.5,
+        )
+
+    def _batch_confidence(
+        self,
+        group: np.ndarray,
+        vals: np.ndarray,
+        counts: np.ndarray,
+        mean_val: np.ndarray,
+        window_hours: np.ndarray,
+    ) -> List[ConfidenceLevel]:
+        g = len(counts)
+        variance = self._group_sum(group, (vals - mean_val[group]) ** 2, g) / counts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coef_variation = np.sqrt(variance) / np.abs(mean_val)
+        low = (counts < self.MIN_SAMPLES_MED) | (window_hours < self.MIN_WINDOW_HOURS)
+        high = (
+            (mean_val != 0)
+            & (counts >= self.MIN_SAMPLES_HIGH)
+            & (coef_variation <= self.MAX_VARIANCE_HIGH)
+        )
+        return [
+            ConfidenceLevel.LOW if low[k] else ConfidenceLevel.HIGH if high[k] else ConfidenceLevel.MED
+            for k in range(g)
+        ]
+
+    def _config_hash(self) -> str:
+        return sha256_hex(
+            canonical_json(
+                {
+                    "operator": "TauCalculator.v1",
+                    "thresholds": {
+                        "min_samples_med": self.MIN_SAMPLES_MED,
+                        "min_samples_high": self.MIN_SAMPLES_HIGH,
+                        "min_window_hours": self.MIN_WINDOW_HOURS,
+                        "max_variance_high": self.MAX_VARIANCE_HIGH,
+                    },
+                }
+            )
+        )
+
     def _compute_half_life(
         self, observations: List[Observation], time_since_last_hours: float
     ) -> float:
@@ -377,3 +605,23 @@ class TauCalculator:
         # Handle both Z and +00:00 suffixes
         ts_normalized = ts.replace("Z", "+00:00")
         return datetime.fromisoformat(ts_normalized)
+
+
+def observation_columns(
+    observations_by_term: Mapping[str, Iterable[Observation]],
+) -> Tuple[List[str], np.ndarray, np.ndarray, List[str]]:
+    """
+    Flatten per-term observations into (term_ids, epoch_s, values, ts)
+    columns for TauCalculator.compute_snapshots_batch(..., ts=ts).
+    """
+    term_ids: List[str] = []
+    epoch_s: List[float] = []
+    values: List[float] = []
+    ts: List[str] = []
+    for term_id, observations in observations_by_term.items():
+        for obs in observations:
+            term_ids.append(term_id)
+            epoch_s.append(TauCalculator._parse_iso(obs.ts).timestamp())
+            values.append(float(obs.value))
+            ts.append(obs.ts)
+    return term_ids, np.asarray(epoch_s, dtype=np.float64), np.asarray(values, dtype=np.float64), ts
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import re
 import unicodedata
 
@@ -98,6 +99,56 @@ def _prep_lexicon(cfg: AnagramConfig) -> Tuple[List[Tuple[str, Tuple[int, ...]]]
     return words, phrases
 
 
+@dataclass(frozen=True)
+class CompiledAnagramLexicon:
+    """
+    Lexicon prepared once per (lexicon, allow_digits) version.
+
+    - words/phrases: (text, counts) in lexicon order (as _prep_lexicon)
+    - words_by_counts/phrases_by_counts: exact multiset hits in lexicon order
+    - word_matrix: int8 [n_words, 36] count matrix (None without NumPy)
+    - word_lengths: letter mass per word, for length-bucket pruning
+    """
+
+    words: Tuple[Tuple[str, Tuple[int, ...]], ...]
+    phrases: Tuple[Tuple[str, Tuple[int, ...]], ...]
+    words_by_counts: Dict[Tuple[int, ...], Tuple[str, ...]]
+    phrases_by_counts: Dict[Tuple[int, ...], Tuple[str, ...]]
+    word_matrix: Any
+    word_lengths: Any
+
+
+def _group_by_counts(items: List[Tuple[str, Tuple[int, ...]]]) -> Dict[Tuple[int, ...], Tuple[str, ...]]:
+    grouped: Dict[Tuple[int, ...], List[str]] = {}
+    for text, counts in items:
+        grouped.setdefault(counts, []).append(text)
+    return {counts: tuple(texts) for counts, texts in grouped.items()}
+
+
+@lru_cache(maxsize=16)
+def compile_lexicon(lexicon: AnagramLexiconV0, allow_digits: bool = True) -> CompiledAnagramLexicon:
+    """Compile (and cache per lexicon version) the anagram lexicon."""
+    words, phrases = _prep_lexicon(AnagramConfig(lexicon=lexicon, allow_digits=allow_digits))
+    word_matrix = None
+    word_lengths = None
+    try:
+        import numpy as np
+
+        if words:
+            word_matrix = np.asarray([wc for _, wc in words], dtype=np.int8)
+            word_lengths = word_matrix.sum(axis=1, dtype=np.int32)
+    except ImportError:
+        pass
+    return CompiledAnagramLexicon(
+        words=tuple(words),
+        phrases=tuple(phrases),
+        words_by_counts=_group_by_counts(words),
+        phrases_by_counts=_group_by_counts(phrases),
+        word_matrix=word_matrix,
+        word_lengths=word_lengths,
+    )
+
+
 def _score_candidate(
     *,
     src_norm: str,
@@ -146,18 +197,30 @@ def _score_candidate(
 
 def _dp_word_splits(
     target_counts: Tuple[int, ...],
-    word_items: List[Tuple[str, Tuple[int, ...]]],
+    word_items: Sequence[Tuple[str, Tuple[int, ...]]],
     *,
     budgets: AnagramBudgets,
+    compiled: Optional[CompiledAnagramLexicon] = None,
 ) -> List[List[str]]:
     """
     Bounded DP over letter-count remainders to assemble up to N words.
     Returns list of word sequences (as original lexicon strings).
     Deterministic ordering: BFS with lexicon order.
+
+    When `word_items` is `compiled.words`, the words that
+    fit a remainder are found with one vectorized comparison against the
+    count matrix; expansion order and the max_states budget are unchanged.
     """
     # State is remainder counts; store first-seen sequences only (bounded)
     from collections import deque
 
+    matrix = None
+    if compiled is not None and compiled.word_matrix is not None and word_items is compiled.words:
+        import numpy as np
+
+        matrix = compiled.word_matrix
+        lengths = compiled.word_lengths
+
     q = deque()
     q.append((target_counts, []))
     seen = set([target_counts])
@@ -172,6 +235,19 @@ def _dp_word_splits(
         if len(seq) >= budgets.max_words_per_phrase:
             continue
 
+        if matrix is not None:
+            rem_arr = np.asarray(rem, dtype=np.int16)
+            fits = (lengths <= int(rem_arr.sum())) & (matrix <= rem_arr).all(axis=1)
+            for idx in np.flatnonzero(fits).tolist():
+                expansions += 1
+                if expansions > budgets.max_states:
+                    return out
+                nxt = tuple((rem_arr - matrix[idx]).tolist())
+                if nxt not in seen:
+                    seen.add(nxt)
+                    q.append((nxt, seq + [word_items[idx][0]]))
+            continue
+
         for word_text, wc in word_items:
             nxt = _counts_sub(rem, wc)
             if nxt is None:
@@ -199,13 +275,59 @@ def detect_shadow_anagrams(
     - Lexicon-guided (targets + DP word splits)
     - Evidence gating: emits evidence refs only if provided
     """
+    return detect_shadow_anagrams_batch(
+        [tokens],
+        context=context,
+        config=config,
+        evidence_refs=evidence_refs,
+    )[0]
+
+
+def detect_shadow_anagrams_batch(
+    token_sets: Iterable[Iterable[str]],
+    *,
+    context: Optional[Dict[str, Any]] = None,
+    config: Optional[AnagramConfig] = None,
+    evidence_refs: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run the detector over many token sets at once.
+
+    Each payload is identical to detect_shadow_anagrams(tokens) for that set.
+    The compiled lexicon is shared, and DP splits are computed once per
+    distinct letter multiset across all sets (each under the same
+    max_states budget as a single call).
+    """
     cfg = config or AnagramConfig()
+    compiled = compile_lexicon(cfg.lexicon, cfg.allow_digits)
+    split_cache: Dict[Tuple[int, ...], List[List[str]]] = {}
+    return [
+        _detect_token_set(
+            tokens,
+            context=context,
+            cfg=cfg,
+            evidence_refs=evidence_refs,
+            compiled=compiled,
+            split_cache=split_cache,
+        )
+        for tokens in token_sets
+    ]
+
+
+def _detect_token_set(
+    tokens: Iterable[str],
+    *,
+    context: Optional[Dict[str, Any]],
+    cfg: AnagramConfig,
+    evidence_refs: Optional[List[str]],
+    compiled: CompiledAnagramLexicon,
+    split_cache: Dict[Tuple[int, ...], List[List[str]]],
+) -> Dict[str, Any]:
     budgets = cfg.budgets
 
     tok_list = [str(t) for t in tokens if str(t).strip()]
     tok_list = sorted(set(tok_list))  # deterministic + dedupe
 
-    lex_words, lex_phrases = _prep_lexicon(cfg)
     ev = [str(x) for x in (evidence_refs or []) if str(x).strip()]
     has_evidence = len(ev) > 0
 
@@ -220,51 +342,52 @@ def detect_shadow_anagrams(
         src_counts = _letter_counts(src_norm)
 
         # 1) Direct phrase hits
-        for phrase_text, pc in lex_phrases:
-            if pc == src_counts:
-                dst_norm = _norm_token_letters(phrase_text)
-                scores = _score_candidate(
-                    src_norm=src_norm,
-                    dst_text=phrase_text,
-                    dst_norm=dst_norm,
-                    lexicon_hit=1.0,
-                    context=context,
-                )
-                item = {
-                    "src": t,
-                    "dst": phrase_text,
-                    "ops": ["normalize:nfkd_ascii_lower", "strip_non_alnum", "counts_match"],
-                    "scores": scores,
-                    "notes": ["lexicon_phrase_exact_multiset_match"],
-                }
-                if has_evidence:
-                    item["evidence_refs"] = ev
-                candidates_all.append(item)
+        for phrase_text in compiled.phrases_by_counts.get(src_counts, ()):
+            dst_norm = _norm_token_letters(phrase_text)
+            scores = _score_candidate(
+                src_norm=src_norm,
+                dst_text=phrase_text,
+                dst_norm=dst_norm,
+                lexicon_hit=1.0,
+                context=context,
+            )
+            item = {
+                "src": t,
+                "dst": phrase_text,
+                "ops": ["normalize:nfkd_ascii_lower", "strip_non_alnum", "counts_match"],
+                "scores": scores,
+                "notes": ["lexicon_phrase_exact_multiset_match"],
+            }
+            if has_evidence:
+                item["evidence_refs"] = ev
+            candidates_all.append(item)
 
         # 2) Single-word hits
-        for word_text, wc in lex_words:
-            if wc == src_counts:
-                dst_norm = _norm_token_letters(word_text)
-                scores = _score_candidate(
-                    src_norm=src_norm,
-                    dst_text=word_text,
-                    dst_norm=dst_norm,
-                    lexicon_hit=1.0,
-                    context=context,
-                )
-                item = {
-                    "src": t,
-                    "dst": word_text,
-                    "ops": ["normalize:nfkd_ascii_lower", "strip_non_alnum", "counts_match"],
-                    "scores": scores,
-                    "notes": ["lexicon_word_exact_multiset_match"],
-                }
-                if has_evidence:
-                    item["evidence_refs"] = ev
-                candidates_all.append(item)
+        for word_text in compiled.words_by_counts.get(src_counts, ()):
+            dst_norm = _norm_token_letters(word_text)
+            scores = _score_candidate(
+                src_norm=src_norm,
+                dst_text=word_text,
+                dst_norm=dst_norm,
+                lexicon_hit=1.0,
+                context=context,
+            )
+            item = {
+                "src": t,
+                "dst": word_text,
+                "ops": ["normalize:nfkd_ascii_lower", "strip_non_alnum", "counts_match"],
+                "scores": scores,
+                "notes": ["lexicon_word_exact_multiset_match"],
+            }
+            if has_evidence:
+                item["evidence_refs"] = ev
+            candidates_all.append(item)
 
         # 3) DP word split candidates (up to N words)
-        splits = _dp_word_splits(src_counts, lex_words, budgets=budgets)
+        splits = split_cache.get(src_counts)
+        if splits is None:
+            splits = _dp_word_splits(src_counts, compiled.words, budgets=budgets, compiled=compiled)
+            split_cache[src_counts] = splits
         for seq in splits:
             if not seq:
                 continue
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
-from .types import Budget, TaskResult, TaskSpec, TraceEvent
+from .types import Budget, Status, TaskResult, TaskSpec, TraceEvent
+
+ShadowBackend = Literal["thread", "process"]
+
+# (status, value, error) of one attempted task
+_Outcome = Tuple[Status, Any, Optional[str]]
+
+
+def _invoke(fn: Callable[[Dict[str, Any]], Any], context: Dict[str, Any]) -> _Outcome:
+    """Run one task, capturing errors. Module-level so process workers can run it."""
+    try:
+        return "ok", fn(context), None
+    except Exception as e:
+        return "error", None, f"{type(e).__name__}: {e}"
 
 
 @dataclass
@@ -17,10 +31,19 @@ class DeterministicScheduler:
     lane_order: forecast first, then shadow.
 
     This module does not use wall clock time or randomness.
+
+    Opt-in parallel shadow lane (shadow_workers > 1): budget admission is
+    decided up front from the sorted task list (it depends only on declared
+    costs), forecast tasks run serially first, then the admitted shadow tasks
+    run concurrently on a thread or process pool. Results and trace are
+    emitted in sort order, so the tick output is identical to a serial run.
+    The process backend needs picklable task callables and context.
     """
     tasks: List[TaskSpec] = field(default_factory=list)
     _insert_counter: int = 0
     _insert_index: Dict[str, int] = field(default_factory=dict)
+    shadow_workers: int = 1
+    shadow_backend: ShadowBackend = "thread"
 
     def add(self, task: TaskSpec) -> None:
         # deterministic insertion ordering
@@ -55,15 +78,31 @@ class DeterministicScheduler:
         rem_f_ops, rem_f_ent = budget_forecast.ops, budget_forecast.entropy
         rem_s_ops, rem_s_ent = budget_shadow.ops, budget_shadow.entropy
 
-        results: Dict[str, TaskResult] = {}
-        trace: List[TraceEvent] = []
-
-        for task in sorted(self.tasks, key=self._sort_key):
+        # Admission: cost is charged whenever a task is attempted, whatever
+        # its outcome, so the admitted set is known before anything runs.
+        ordered = sorted(self.tasks, key=self._sort_key)
+        admitted: List[bool] = []
+        for task in ordered:
             if task.lane == "forecast":
                 can = task.cost_ops <= rem_f_ops and task.cost_entropy <= rem_f_ent
+                if can:
+                    rem_f_ops -= task.cost_ops
+                    rem_f_ent -= task.cost_entropy
             else:
                 can = task.cost_ops <= rem_s_ops and task.cost_entropy <= rem_s_ent
+                if can:
+                    rem_s_ops -= task.cost_ops
+                    rem_s_ent -= task.cost_entropy
+            admitted.append(can)
 
+        outcomes = self._execute(
+            [task for task, can in zip(ordered, admitted) if can], context
+        )
+
+        results: Dict[str, TaskResult] = {}
+        trace: List[TraceEvent] = []
+
+        for task, can in zip(ordered, admitted):
             if not can:
                 res = TaskResult(
                     name=task.name,
@@ -88,23 +127,7 @@ class DeterministicScheduler:
                 )
                 continue
 
-            try:
-                value = task.fn(context)
-                status = "ok"
-                err = None
-            except Exception as e:
-                value = None
-                status = "error"
-                err = f"{type(e).__name__}: {e}"
-
-            # Apply cost only if attempted (ok or error).
-            if task.lane == "forecast":
-                rem_f_ops -= task.cost_ops
-                rem_f_ent -= task.cost_entropy
-            else:
-                rem_s_ops -= task.cost_ops
-                rem_s_ent -= task.cost_entropy
-
+            status, value, err = outcomes[task.name]
             res = TaskResult(
                 name=task.name,
                 lane=task.lane,
@@ -136,3 +159,31 @@ class DeterministicScheduler:
                 "shadow": Budget(ops=rem_s_ops, entropy=rem_s_ent),
             },
         }
+
+    def _execute(self, tasks: List[TaskSpec], context: Dict[str, Any]) -> Dict[str, _Outcome]:
+        """Run admitted tasks (in sort order): forecast serially, then shadow."""
+        outcomes: Dict[str, _Outcome] = {}
+        shadow: List[TaskSpec] = []
+        for task in tasks:
+            if task.lane == "forecast":
+                outcomes[task.name] = _invoke(task.fn, context)
+            else:
+                shadow.append(task)
+
+        workers = min(max(1, int(self.shadow_workers)), len(shadow))
+        if workers <= 1:
+            for task in shadow:
+                outcomes[task.name] = _invoke(task.fn, context)
+            return outcomes
+
+        if self.shadow_backend == "process":
+            pool: Executor = ProcessPoolExecutor(max_workers=workers)
+        elif self.shadow_backend == "thread":
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ers-shadow")
+        else:
+            raise ValueError(f"Unknown shadow_backend: {self.shadow_backend}")
+        with pool:
+            futures = [(task.name, pool.submit(_invoke, task.fn, context)) for task in shadow]
+            for name, future in futures:
+                outcomes[name] = future.result()
+        return outcomes
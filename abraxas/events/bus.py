@@ -1,21 +1,89 @@
-"""Simple event bus for pub/sub messaging."""
+"""Simple event bus for pub/sub messaging.
+
+Three dispatch modes:
+
+- "sync" (default): publish() runs every handler on the caller's thread.
+- "thread": publish() buffers the event and returns; handlers run on a
+  thread pool.
+- "async": publish() buffers the event and returns; handlers run as tasks
+  on an asyncio loop and may be coroutine functions.
+
+In the buffered modes each topic has a bounded buffer (the oldest event is
+dropped when it is full) and at most one drain job, so events of a topic are
+delivered in publish order. A drain job takes up to max_batch events at a
+time: per-event handlers are called once per event, batch handlers
+(subscribe_batch) once with the list.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List
+import asyncio
+import inspect
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, Set
+
+DispatchMode = Literal["sync", "thread", "async"]
+
+Handler = Callable[[Dict[str, Any]], Any]
+BatchHandler = Callable[[List[Dict[str, Any]]], Any]
+
+DEFAULT_MAX_BUFFER = 1024
+DEFAULT_MAX_BATCH = 64
+
+
+class _Topic:
+    """Buffer and drain state for one event type."""
+
+    def __init__(self) -> None:
+        self.buffer: Deque[Dict[str, Any]] = deque()
+        self.scheduled = False
 
 
 class EventBus:
     """
     Simple pub/sub event bus.
-    Thread-safe for basic use cases; handlers execute synchronously.
+    Thread-safe for basic use cases; handlers execute synchronously unless
+    a buffered dispatch mode is selected.
+
+    Args:
+        mode: "sync", "thread" or "async"
+        max_buffer: Events buffered per topic before the oldest is dropped
+        max_batch: Events delivered per drain step
+        workers: Thread pool size for "thread" mode
+        loop: Event loop for "async" mode (defaults to the publisher's running loop)
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        mode: DispatchMode = "sync",
+        *,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        workers: int = 4,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
         """Initialize event bus with empty handlers."""
-        self._handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        if mode not in ("sync", "thread", "async"):
+            raise ValueError(f"Unknown dispatch mode: {mode}")
+        self.mode: DispatchMode = mode
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._batch_handlers: Dict[str, List[BatchHandler]] = {}
+        self._max_buffer = max(1, int(max_buffer))
+        self._max_batch = max(1, int(max_batch))
+        self._workers = max(1, int(workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop = loop
+        self._tasks: Set[asyncio.Future] = set()
+        self._topics: Dict[str, _Topic] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
 
-    def subscribe(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+    def subscribe(self, event_type: str, handler: Handler) -> None:
         """
         Subscribe to an event type.
 
@@ -27,7 +95,19 @@ class EventBus:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
 
-    def unsubscribe(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+    def subscribe_batch(self, event_type: str, handler: BatchHandler) -> None:
+        """
+        Subscribe to an event type with a handler that receives lists of payloads.
+
+        In "sync" mode each list holds a single payload.
+
+        Args:
+            event_type: Event type identifier
+            handler: Callback function that receives a list of event payloads
+        """
+        self._batch_handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: str, handler: Callable[..., Any]) -> None:
         """
         Unsubscribe from an event type.
 
@@ -35,11 +115,12 @@ class EventBus:
             event_type: Event type identifier
             handler: Handler to remove
         """
-        if event_type in self._handlers:
-            try:
-                self._handlers[event_type].remove(handler)
-            except ValueError:
-                pass  # Handler not found, ignore
+        for registry in (self._handlers, self._batch_handlers):
+            if event_type in registry:
+                try:
+                    registry[event_type].remove(handler)
+                except ValueError:
+                    pass  # Handler not found, ignore
 
     def publish(self, event_type: str, payload: Dict[str, Any]) -> None:
         """
@@ -49,14 +130,203 @@ class EventBus:
             event_type: Event type identifier
             payload: Event data
         """
-        handlers = self._handlers.get(event_type, [])
-        for handler in handlers:
+        if self.mode == "async" and self._loop is None:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        if self.mode == "sync" or (self.mode == "async" and self._loop is None):
+            # No loop to hand off to yet: deliver inline.
+            with self._lock:
+                self._published += 1
+            self._deliver_sync(event_type, [payload])
+            return
+
+        with self._lock:
+            self._published += 1
+            topic = self._topics.get(event_type)
+            if topic is None:
+                topic = self._topics[event_type] = _Topic()
+            if len(topic.buffer) >= self._max_buffer:
+                topic.buffer.popleft()
+                self._dropped += 1
+            topic.buffer.append(payload)
+            if topic.scheduled:
+                return
+            topic.scheduled = True
+
+        if self.mode == "thread":
+            self._submit(event_type)
+        else:
+            self._spawn_threadsafe(event_type)
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def _report(self, event_type: str, e: Exception) -> None:
+        # Log error but don't crash
+        print(f"Error in event handler for {event_type}: {e}")
+
+    def _deliver_sync(self, event_type: str, batch: List[Dict[str, Any]]) -> None:
+        for payload in batch:
+            for handler in list(self._handlers.get(event_type, [])):
+                try:
+                    handler(payload)
+                except Exception as e:
+                    self._report(event_type, e)
+        for batch_handler in list(self._batch_handlers.get(event_type, [])):
             try:
-                handler(payload)
+                batch_handler(list(batch))
             except Exception as e:
-                # Log error but don't crash
-                print(f"Error in event handler for {event_type}: {e}")
+                self._report(event_type, e)
+        with self._lock:
+            self._delivered += len(batch)
+
+    def _take_batch(self, event_type: str) -> List[Dict[str, Any]]:
+        """Pop the next batch; marks the topic idle when its buffer is empty."""
+        with self._lock:
+            topic = self._topics[event_type]
+            n = min(len(topic.buffer), self._max_batch)
+            batch = [topic.buffer.popleft() for _ in range(n)]
+            if not batch:
+                topic.scheduled = False
+                self._idle.notify_all()
+            return batch
+
+    def _release(self, event_type: str) -> None:
+        """Mark a topic idle after its drain failed, so it can be rescheduled."""
+        with self._lock:
+            self._topics[event_type].scheduled = False
+            self._idle.notify_all()
+
+    def _submit(self, event_type: str) -> None:
+        try:
+            if self._executor is None:
+                with self._lock:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self._workers, thread_name_prefix="eventbus"
+                        )
+            self._executor.submit(self._drain_step, event_type)
+        except BaseException:
+            # e.g. RuntimeError from an executor shut down by close()
+            self._release(event_type)
+            raise
+
+    def _drain_step(self, event_type: str) -> None:
+        batch = self._take_batch(event_type)
+        if not batch:
+            return
+        try:
+            self._deliver_sync(event_type, batch)
+        except BaseException:
+            # Handler raised past _deliver_sync's Exception guard.
+            self._release(event_type)
+            raise
+        # Resubmit rather than loop so busy topics share the pool fairly.
+        self._submit(event_type)
+
+    def _spawn_threadsafe(self, event_type: str) -> None:
+        loop = self._loop
+        assert loop is not None
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        try:
+            if running is loop:
+                self._spawn(event_type)
+            else:
+                loop.call_soon_threadsafe(self._spawn, event_type)
+        except BaseException:
+            # e.g. RuntimeError from a closed loop
+            self._release(event_type)
+            raise
+
+    def _spawn(self, event_type: str) -> None:
+        task = asyncio.ensure_future(self._drain_async(event_type))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda t: self._drain_done(event_type, t))
+
+    def _drain_done(self, event_type: str, task: asyncio.Future) -> None:
+        # A drain that returns normally has already marked the topic idle;
+        # a cancelled or failed one has not.
+        if task.cancelled() or task.exception() is not None:
+            self._release(event_type)
+
+    async def _drain_async(self, event_type: str) -> None:
+        while True:
+            batch = self._take_batch(event_type)
+            if not batch:
+                return
+            for payload in batch:
+                for handler in list(self._handlers.get(event_type, [])):
+                    await self._call_async(event_type, handler, payload)
+            for batch_handler in list(self._batch_handlers.get(event_type, [])):
+                await self._call_async(event_type, batch_handler, list(batch))
+            with self._lock:
+                self._delivered += len(batch)
+            # Let other topics and the publisher run between batches.
+            await asyncio.sleep(0)
+
+    async def _call_async(self, event_type: str, handler: Callable[[Any], Any], arg: Any) -> None:
+        try:
+            result = handler(arg)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self._report(event_type, e)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _pending(self) -> bool:
+        return any(t.scheduled for t in self._topics.values())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every buffered event has been delivered ("thread" mode).
+
+        Returns:
+            True if the bus drained within the timeout
+        """
+        if self.mode != "thread":
+            return not self._pending()
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending(), timeout)
+
+    async def drain(self) -> None:
+        """Wait until every buffered event has been delivered ("async" mode)."""
+        while self._tasks or self._pending():
+            if self._tasks:
+                await asyncio.gather(*list(self._tasks), return_exceptions=True)
+            else:
+                # Spawn scheduled from another thread, not yet run.
+                await asyncio.sleep(0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Publish/delivery counters and current buffer depth."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "published": self._published,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "buffered": sum(len(t.buffer) for t in self._topics.values()),
+                "max_buffer": self._max_buffer,
+            }
+
+    def close(self) -> None:
+        """Deliver buffered events ("thread" mode) and stop the worker pool."""
+        if self._executor is not None:
+            self.flush()
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def clear(self) -> None:
         """Clear all event handlers."""
         self._handlers.clear()
+        self._batch_handlers.clear()
@@ -25,6 +25,7 @@ from typing import Dict, List, Optional, Any, Iterable
 from abraxas.backtest.evaluator import evaluate_case, load_backtest_case
 from abraxas.backtest.portfolio import load_portfolios, select_cases_for_portfolio
 from abraxas.backtest.schema import BacktestCase, BacktestResult
+from abraxas.backtest.session import BacktestSession
 from abraxas.core.provenance import hash_canonical_json
 from abraxas.evolution.schema import (
     MetricCandidate,
@@ -394,7 +395,8 @@ def run_sandbox_portfolios(
     cases_dir: str | Path,
     portfolios_path: str | Path,
     ctx: Dict[str, Any],
-    overrides: Optional[Dict[str, Any]] = None
+    overrides: Optional[Dict[str, Any]] = None,
+    session: Optional[BacktestSession] = None
 ) -> SandboxResult:
     """
     Run sandbox evaluation across target portfolios.
@@ -405,6 +407,7 @@ def run_sandbox_portfolios(
         portfolios_path: Path to portfolios YAML
         ctx: Execution context (run_id, run_at, output_dir)
         overrides: Optional dict with baseline_results/after_results for testing
+        session: Optional BacktestSession to evaluate cases from memory
 
     Returns:
         SandboxResult with portfolio breakdown and pass gate
@@ -438,12 +441,14 @@ def run_sandbox_portfolios(
         baseline_results = _evaluate_cases(
             selected_cases,
             overrides,
-            key="baseline_results"
+            key="baseline_results",
+            session=session
         )
         after_results = _evaluate_cases(
             selected_cases,
             overrides,
-            key="after_results"
+            key="after_results",
+            session=session
         )
 
         for result in baseline_results:
@@ -515,7 +520,8 @@ def _load_cases(cases_dir: str | Path) -> List[BacktestCase]:
 def _evaluate_cases(
     cases: Iterable[BacktestCase],
     overrides: Optional[Dict[str, Any]],
-    key: str
+    key: str,
+    session: Optional[BacktestSession] = None
 ) -> List[BacktestResult]:
     if overrides and key in overrides:
         override_results = overrides.get(key) or {}
@@ -527,6 +533,8 @@ def _evaluate_cases(
         results_by_case = {result.case_id: result for result in results}
         return [results_by_case[case_id] for case_id in sorted(case_ids)]
 
+    if session is not None:
+        return session.evaluate_cases(cases, run_id="sandbox")
     results = []
     for case in cases:
         results.append(evaluate_case(case, enable_learning=False, run_id="sandbox"))
@@ -26,6 +26,7 @@ from abraxas.evolution.schema import (
     CandidateKind,
     SourceDomain
 )
+from abraxas.core.hash_chain import HashChainLedger
 from abraxas.core.provenance import hash_canonical_json
 
 
@@ -47,6 +48,7 @@ class EvolutionStore:
         (self.data_dir / "implementation_tickets").mkdir(exist_ok=True)
         (self.data_dir / "stabilization_windows").mkdir(exist_ok=True)
         self.ledger_dir.mkdir(parents=True, exist_ok=True)
+        self._chains: Dict[Path, HashChainLedger] = {}
 
     # Candidate storage
 
@@ -202,19 +204,17 @@ class EvolutionStore:
 
     # Ledger management
 
+    def _chain(self, ledger_path: Path) -> HashChainLedger:
+        """Hash-chain handle for a ledger file (cached per path)."""
+        chain = self._chains.get(ledger_path)
+        if chain is None:
+            chain = HashChainLedger(ledger_path, genesis="genesis", dumps=json.dumps)
+            self._chains[ledger_path] = chain
+        return chain
+
     def _get_last_ledger_hash(self, ledger_path: Path) -> str:
         """Get the hash of the last entry in a ledger."""
-        if not ledger_path.exists():
-            return "genesis"
-
-        # Read last line
-        with open(ledger_path, 'r') as f:
-            lines = f.readlines()
-            if not lines:
-                return "genesis"
-
-            last_entry = json.loads(lines[-1])
-            return last_entry.get("step_hash", "genesis")
+        return self._chain(ledger_path).head()
 
     def append_candidate_ledger(self, candidate: MetricCandidate) -> str:
         """
@@ -224,7 +224,6 @@ class EvolutionStore:
             Step hash of appended entry
         """
         ledger_path = self.ledger_dir / "candidates.jsonl"
-        prev_hash = self._get_last_ledger_hash(ledger_path)
 
         entry = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -236,16 +235,9 @@ class EvolutionStore:
             "rationale": candidate.rationale,
             "priority": candidate.priority,
             "proposed_by": candidate.proposed_by,
-            "prev_hash": prev_hash
         }
 
-        step_hash = hash_canonical_json(entry)
-        entry["step_hash"] = step_hash
-
-        with open(ledger_path, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
-
-        return step_hash
+        return self._chain(ledger_path).append(entry)
 
     def append_sandbox_ledger(self, sandbox_result: SandboxResult) -> str:
         """
@@ -255,7 +247,6 @@ class EvolutionStore:
             Step hash of appended entry
         """
         ledger_path = self.ledger_dir / "sandbox.jsonl"
-        prev_hash = self._get_last_ledger_hash(ledger_path)
 
         entry = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -267,19 +258,14 @@ class EvolutionStore:
             "cases_tested": sandbox_result.cases_tested,
             "portfolios_tested": sandbox_result.portfolios_tested,
             "portfolio_score_delta_hash": sandbox_result.portfolio_score_delta_hash,
-            "prev_hash": prev_hash
         }
 
-        step_hash = hash_canonical_json(entry)
-        entry["step_hash"] = step_hash
+        step_hash = self._chain(ledger_path).append(entry)
 
         # Update the sandbox_result object with hashes
-        sandbox_result.prev_hash = prev_hash
+        sandbox_result.prev_hash = entry["prev_hash"]
         sandbox_result.step_hash = step_hash
 
-        with open(ledger_path, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
-
         return step_hash
 
     def append_promotion_ledger(self, promotion: PromotionEntry) -> str:
@@ -290,7 +276,6 @@ class EvolutionStore:
             Step hash of appended entry
         """
         ledger_path = self.ledger_dir / "promotions.jsonl"
-        prev_hash = self._get_last_ledger_hash(ledger_path)
 
         entry = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -301,19 +286,14 @@ class EvolutionStore:
             "action_type": promotion.action_type,
             "action_details": promotion.action_details,
             "promoted_by": promotion.promoted_by,
-            "prev_hash": prev_hash
         }
 
-        step_hash = hash_canonical_json(entry)
-        entry["step_hash"] = step_hash
+        step_hash = self._chain(ledger_path).append(entry)
 
         # Update the promotion object with hashes
-        promotion.prev_hash = prev_hash
+        promotion.prev_hash = entry["prev_hash"]
         promotion.step_hash = step_hash
 
-        with open(ledger_path, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
-
         return step_hash
 
     # Ledger reading
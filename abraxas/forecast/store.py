@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from abraxas.core.provenance import hash_canonical_json
+from abraxas.core.hash_chain import HashChainLedger
 from abraxas.forecast.types import EnsembleState
 
 
@@ -36,6 +36,7 @@ class ForecastStore:
 
         self.ensembles_dir.mkdir(parents=True, exist_ok=True)
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        self._chain = HashChainLedger(self.ledger_path, genesis="genesis")
 
     def load_ensemble(self, ensemble_id: str) -> Optional[EnsembleState]:
         """
@@ -86,34 +87,11 @@ class ForecastStore:
         Returns:
             SHA256 hash of ledger entry
         """
-        # Get previous hash
-        prev_hash = self._get_last_hash()
-
-        # Add prev_hash to record
-        record["prev_hash"] = prev_hash
-
-        # Compute step hash
-        step_hash = hash_canonical_json(record)
-        record["step_hash"] = step_hash
-
-        # Append to ledger
-        with open(self.ledger_path, "a") as f:
-            f.write(json.dumps(record, sort_keys=True) + "\n")
-
-        return step_hash
+        return self._chain.append(record)
 
     def _get_last_hash(self) -> str:
         """Get hash of last ledger entry."""
-        if not self.ledger_path.exists():
-            return "genesis"
-
-        with open(self.ledger_path, "r") as f:
-            lines = f.readlines()
-            if not lines:
-                return "genesis"
-
-            last_entry = json.loads(lines[-1])
-            return last_entry.get("step_hash", "genesis")
+        return self._chain.head()
 
     def read_all_updates(self) -> list[Dict[str, Any]]:
         """Read all branch update entries from ledger."""
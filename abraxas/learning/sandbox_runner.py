@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 
 from abraxas.backtest.evaluator import evaluate_case, load_backtest_case
 from abraxas.backtest.schema import BacktestResult, BacktestStatus
+from abraxas.backtest.session import BacktestSession
 from abraxas.learning.schema import (
     BaselineMetrics,
     CaseDetail,
@@ -38,6 +39,7 @@ class SandboxRunner:
         proposals_dir: str | Path = "data/sandbox/proposals",
         cases_dir: str | Path = "data/backtests/cases",
         ledger_path: str | Path = "out/learning_ledgers/sandbox_runs.jsonl",
+        session: Optional[BacktestSession] = None,
     ):
         """
         Initialize sandbox runner.
@@ -46,10 +48,12 @@ class SandboxRunner:
             proposals_dir: Proposals directory
             cases_dir: Backtest cases directory
             ledger_path: Sandbox runs ledger
+            session: Optional BacktestSession to evaluate cases from memory
         """
         self.proposals_dir = Path(proposals_dir)
         self.cases_dir = Path(cases_dir)
         self.ledger_path = Path(ledger_path)
+        self.session = session
 
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -110,7 +114,7 @@ class SandboxRunner:
                 continue
 
             case = load_backtest_case(case_file)
-            result = evaluate_case(case, enable_learning=False, run_id="sandbox_baseline")
+            result = self._evaluate(case, run_id="sandbox_baseline")
             results.append(result)
 
         return results
@@ -142,7 +146,7 @@ class SandboxRunner:
             if proposal.proposal_type.value == "threshold_adjustment":
                 # Simulate relaxed threshold by treating MISS as potential HIT
                 # This is a MOCK - real implementation would modify case triggers
-                result = evaluate_case(case, enable_learning=False, run_id="sandbox_proposal")
+                result = self._evaluate(case, run_id="sandbox_proposal")
 
                 # MOCK improvement: if baseline was MISS, simulate improvement
                 # Real implementation would actually apply the threshold change
@@ -156,12 +160,15 @@ class SandboxRunner:
                         result.notes.append("MOCK: Proposal threshold adjustment improved result")
             else:
                 # For other proposal types, run as-is
-                result = evaluate_case(case, enable_learning=False, run_id="sandbox_proposal")
+                result = self._evaluate(case, run_id="sandbox_proposal")
 
             results.append(result)
 
         return results
 
+    def _evaluate(self, case, run_id: str) -> BacktestResult:
+        return evaluate_case(case, enable_learning=False, run_id=run_id, session=self.session)
+
     def _find_case_file(self, case_id: str) -> Optional[Path]:
         """Find case file by case_id."""
         # Search for YAML files with matching case_id
@@ -110,30 +110,78 @@ class ClusterMetrics:
         }
 
 
+def candidate_pairs(tokens: List[set[str]], sim_threshold: float) -> List[Tuple[int, int]]:
+    """
+    Candidate (i, j), i < j, pairs that can reach `sim_threshold` token Jaccard.
+
+    Prefix-filtered inverted index: tokens are ordered rarest-first and each
+    set only posts its first |x| - floor(t*|x|) + 1 tokens. Any pair with
+    Jaccard >= t shares a token in both prefixes, so no qualifying pair is
+    missed; a size filter drops pairs whose lengths alone rule out t.
+    Pairs are returned sorted.
+    """
+    if sim_threshold <= 0.0:
+        n = len(tokens)
+        return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+    df: Dict[str, int] = {}
+    for toks in tokens:
+        for tok in toks:
+            df[tok] = df.get(tok, 0) + 1
+
+    postings: Dict[str, List[int]] = {}
+    pairs: set[Tuple[int, int]] = set()
+    for i, toks in enumerate(tokens):
+        if not toks:
+            continue
+        ordered = sorted(toks, key=lambda tok: (df[tok], tok))
+        size = len(ordered)
+        prefix = min(size, size - int(sim_threshold * size) + 1)
+        for tok in ordered[:prefix]:
+            for j in postings.get(tok, ()):
+                other = len(tokens[j])
+                if min(size, other) < sim_threshold * max(size, other) - 1e-9:
+                    continue
+                pairs.add((j, i))
+            postings.setdefault(tok, []).append(i)
+    return sorted(pairs)
+
+
 def cluster_claims(
     items: List[Dict[str, Any]],
     *,
     sim_threshold: float = 0.42,
     max_pairs: int = 250000,
+    blocking: bool = True,
 ) -> Tuple[List[List[int]], ClusterMetrics]:
     """
-    Greedy O(n^2) with a safety cap on comparisons.
     v0.1: token Jaccard threshold; union-find merges.
+
+    blocking=True (default) compares only candidate pairs from a token
+    inverted index (see candidate_pairs); the result equals comparing every
+    pair, with no cap, so `max_pairs` is ignored.
+    blocking=False keeps the legacy greedy O(n^2) loop with the
+    `max_pairs` safety cap on comparisons.
     """
     n = len(items)
     tokens = [_tokens(str(it.get("claim") or "")) for it in items]
     dsu = DSU(n)
 
-    pairs = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            pairs += 1
-            if pairs > max_pairs:
-                break
+    if blocking:
+        for i, j in candidate_pairs(tokens, sim_threshold):
             if jaccard(tokens[i], tokens[j]) >= sim_threshold:
                 dsu.union(i, j)
-        if pairs > max_pairs:
-            break
+    else:
+        pairs = 0
+        for i in range(n):
+            for j in range(i + 1, n):
+                pairs += 1
+                if pairs > max_pairs:
+                    break
+                if jaccard(tokens[i], tokens[j]) >= sim_threshold:
+                    dsu.union(i, j)
+            if pairs > max_pairs:
+                break
 
     buckets: Dict[int, List[int]] = {}
     for i in range(n):
@@ -1,10 +1,24 @@
+"""Temporal profiles (velocity, recurrence, phase) for memetic term registries.
+
+Registries are append-only JSONL. Rather than re-reading and re-parsing the
+whole history on every run, each registry gets a persisted per-term state
+(<registry>.temporal_state.json): observation counts keyed by exact
+timestamp, first/last seen, running sums and the tag union. Runs fold in
+only the lines appended since the stored offset; profiles are then computed
+from the state and match a full scan exactly.
+"""
+
 from __future__ import annotations
 
+import bisect
+import io
 import json
 import os
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from abraxas.core.jsonl_sidecar import AppendCursor, read_sidecar, write_sidecar
 
 
 def _parse_dt(s: str) -> Optional[datetime]:
@@ -21,50 +35,7 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-def _read_jsonl(path: str, max_lines: int = 500000) -> List[Dict[str, Any]]:
-    if not os.path.exists(path):
-        return []
-    out: List[Dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            if i >= max_lines:
-                break
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(obj, dict):
-                out.append(obj)
-    return out
-
-
-def _window_velocity(obs: List[Tuple[datetime, int]], window_days: int, now: datetime) -> float:
-    start = now - timedelta(days=window_days)
-    total = 0
-    for ts, count in obs:
-        if ts >= start:
-            total += int(count)
-    return float(total) / float(max(1, window_days))
-
-
-def _recurrence_days(obs_ts: List[datetime]) -> Optional[float]:
-    if len(obs_ts) < 2:
-        return None
-    obs_ts = sorted(obs_ts)
-    gaps = []
-    for a, b in zip(obs_ts[:-1], obs_ts[1:]):
-        gaps.append((b - a).total_seconds() / 86400.0)
-    gaps = [g for g in gaps if g >= 0.0]
-    if not gaps:
-        return None
-    gaps.sort()
-    mid = len(gaps) // 2
-    if len(gaps) % 2 == 1:
-        return float(gaps[mid])
-    return float((gaps[mid - 1] + gaps[mid]) / 2.0)
+MAX_REGISTRY_LINES = 500000
 
 
 def _decay_fit_half_life_days(v14: float, v60: float) -> float:
@@ -127,107 +98,335 @@ class TermTemporalProfile:
         return asdict(self)
 
 
+# ---------------------------------------------------------------------------
+# Persisted per-term state
+# ---------------------------------------------------------------------------
+
+STATE_VERSION = 1
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_us(dt: datetime) -> int:
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+def _new_term() -> Dict[str, Any]:
+    return {
+        "term": "",
+        "obs_n": 0,
+        # exact timestamp (us) -> [rows, count sum]
+        "obs": {},
+        "first": None,  # [us, isoformat] of the earliest first-seen
+        "last": None,  # [us, isoformat] of the latest last-seen
+        "tags": set(),
+        "risk_sum": 0,
+        "nov_sum": 0,
+        "prop_sum": 0,
+    }
+
+
+def _copy_term(t: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(t)
+    out["obs"] = {k: list(v) for k, v in t["obs"].items()}
+    out["tags"] = set(t["tags"])
+    return out
+
+
+def _fold_row(terms: Dict[str, Dict[str, Any]], row: Dict[str, Any], overlay: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    """Fold one registry row into term states, with the filters of the full scan.
+
+    With an overlay, touched terms are copied into it and `terms` is left as is.
+    """
+    key = row.get("term_key")
+    term = row.get("term")
+    ts = (
+        _parse_dt(str(row.get("ts") or ""))
+        or _parse_dt(str(row.get("last_seen_ts") or ""))
+        or None
+    )
+    if not key or not term or not ts:
+        return
+    key = str(key)
+    if overlay is None:
+        state = terms.get(key)
+        if state is None:
+            state = terms[key] = _new_term()
+    else:
+        state = overlay.get(key)
+        if state is None:
+            state = overlay[key] = _copy_term(terms[key]) if key in terms else _new_term()
+
+    state["term"] = str(row.get("term") or "")
+    t_last = _parse_dt(str(row.get("last_seen_ts") or "")) or _parse_dt(str(row.get("ts") or ""))
+    t_first = _parse_dt(str(row.get("first_seen_ts") or "")) or t_last
+    if not t_last:
+        return
+    count = int(row.get("count") or 0)
+    state["tags"].update(list(row.get("tags") or []))
+    # Summed in row order, so the means equal sum(list) / n of the full scan.
+    state["risk_sum"] += float(row.get("manipulation_risk") or 0.0)
+    state["nov_sum"] += float(row.get("novelty_score") or 0.0)
+    state["prop_sum"] += float(row.get("propagation_score") or 0.0)
+    state["obs_n"] += 1
+
+    last_us = _to_us(t_last)
+    slot = state["obs"].get(last_us)
+    if slot is None:
+        state["obs"][last_us] = [1, count]
+    else:
+        slot[0] += 1
+        slot[1] += count
+
+    # Strict comparisons keep the first row among equal instants, as the scan does.
+    first_us = _to_us(t_first)
+    if state["first"] is None or first_us < state["first"][0]:
+        state["first"] = [first_us, t_first.isoformat()]
+    if state["last"] is None or last_us > state["last"][0]:
+        state["last"] = [last_us, t_last.isoformat()]
+
+
+def _iter_lines(data: bytes) -> Iterable[str]:
+    """Lines as text-mode iteration of the registry would produce them."""
+    return io.StringIO(data.decode("utf-8"), newline=None)
+
+
+def _fold_lines(
+    terms: Dict[str, Dict[str, Any]],
+    data: bytes,
+    lines_read: int,
+    overlay: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> int:
+    for line in _iter_lines(data):
+        if lines_read >= MAX_REGISTRY_LINES:
+            break
+        lines_read += 1
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(obj, dict):
+            _fold_row(terms, obj, overlay)
+    return lines_read
+
+
+class TemporalRegistryState:
+    """Incrementally maintained per-term observation state for one registry file."""
+
+    def __init__(self, registry_path: str, *, persist: bool = True) -> None:
+        self.registry_path = registry_path
+        self.state_path = registry_path + ".temporal_state.json"
+        self.persist = persist
+        self.lines_read = 0
+        self.terms: Dict[str, Dict[str, Any]] = {}
+        self._cursor = AppendCursor(registry_path)
+        self._loaded = False
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self._cursor.indexed_bytes
+
+    def _reset(self) -> None:
+        self._cursor.reset()
+        self.lines_read = 0
+        self.terms = {}
+
+    def refresh(self) -> bytes:
+        """Fold complete lines appended since the last refresh.
+
+        Returns:
+            The unterminated trailing bytes, if any (not folded into the state)
+        """
+        if not os.path.exists(self.registry_path):
+            self._reset()
+            return b""
+        if not self._loaded:
+            self._loaded = True
+            if self.persist:
+                self._load()
+        size = os.path.getsize(self.registry_path)
+        if not self._cursor.is_current(size):
+            self._reset()
+        if size <= self.indexed_bytes:
+            return b""
+        with open(self.registry_path, "rb") as f:
+            f.seek(self.indexed_bytes)
+            chunk = f.read(size - self.indexed_bytes)
+        usable = chunk.rfind(b"\n") + 1
+        if usable:
+            if self.lines_read < MAX_REGISTRY_LINES:
+                self.lines_read = _fold_lines(self.terms, chunk[:usable], self.lines_read)
+            self._cursor.advance(self.indexed_bytes + usable)
+            if self.persist:
+                self._save()
+        return chunk[usable:]
+
+    def current_terms(self) -> Dict[str, Dict[str, Any]]:
+        """Term states including an unterminated last line, in first-seen order."""
+        tail = self.refresh()
+        if not tail or self.lines_read >= MAX_REGISTRY_LINES:
+            return self.terms
+        overlay: Dict[str, Dict[str, Any]] = {}
+        _fold_lines(self.terms, tail, self.lines_read, overlay)
+        if not overlay:
+            return self.terms
+        merged = {k: overlay.get(k, v) for k, v in self.terms.items()}
+        merged.update((k, v) for k, v in overlay.items() if k not in merged)
+        return merged
+
+    def _load(self) -> None:
+        data = read_sidecar(self.state_path, STATE_VERSION)
+        if data is None:
+            return
+        terms: Dict[str, Dict[str, Any]] = {}
+        for key, t in (data.get("terms") or {}).items():
+            t = dict(t)
+            t["obs"] = {int(us): list(v) for us, v in t["obs"].items()}
+            t["tags"] = set(t["tags"])
+            terms[key] = t
+        self.terms = terms
+        self._cursor.restore(data)
+        self.lines_read = int(data.get("lines_read", 0))
+
+    def _save(self) -> None:
+        terms = {}
+        for key, t in self.terms.items():
+            out = dict(t)
+            out["obs"] = {str(us): v for us, v in t["obs"].items()}
+            out["tags"] = sorted(t["tags"], key=repr)
+            terms[key] = out
+        payload = {
+            "version": STATE_VERSION,
+            "registry": self.registry_path,
+            **self._cursor.to_dict(),
+            "lines_read": self.lines_read,
+            "terms": terms,
+        }
+        try:
+            # Terms stay in first-seen order, so keys are not sorted.
+            write_sidecar(self.state_path, payload, sort_keys=False)
+        except (TypeError, ValueError):
+            # Tags that JSON cannot hold: keep the in-memory state for this process.
+            pass
+
+
+_STATE_CACHE: Dict[str, TemporalRegistryState] = {}
+
+
+def get_registry_state(registry_path: str) -> TemporalRegistryState:
+    """Process-wide TemporalRegistryState per registry path."""
+    key = os.path.abspath(registry_path)
+    state = _STATE_CACHE.get(key)
+    if state is None or state.registry_path != registry_path:
+        state = TemporalRegistryState(registry_path)
+        _STATE_CACHE[key] = state
+    return state
+
+
+def _recurrence_from_obs(obs: Dict[int, List[int]], obs_n: int) -> Optional[float]:
+    """Median gap in days between consecutive observation timestamps (repeats are zero gaps)."""
+    if obs_n < 2:
+        return None
+    stamps = sorted(obs)
+    diffs = sorted(
+        ((b - a) / 10**6) / 86400.0 for a, b in zip(stamps[:-1], stamps[1:])
+    )
+    # Repeated timestamps contribute zero-length gaps, which sort first.
+    zeros = obs_n - len(stamps)
+    n = obs_n - 1
+
+    def gap(i: int) -> float:
+        return 0.0 if i < zeros else diffs[i - zeros]
+
+    mid = n // 2
+    if n % 2 == 1:
+        return float(gap(mid))
+    return float((gap(mid - 1) + gap(mid)) / 2.0)
+
+
+def _profile_from_state(
+    key: str,
+    t: Dict[str, Any],
+    *,
+    now: datetime,
+    registry_path: str,
+) -> TermTemporalProfile:
+    stamps = sorted(t["obs"])
+    suffix = [0] * (len(stamps) + 1)
+    for i in range(len(stamps) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + t["obs"][stamps[i]][1]
+
+    def velocity(window_days: int) -> float:
+        start_us = _to_us(now - timedelta(days=window_days))
+        return float(suffix[bisect.bisect_left(stamps, start_us)]) / float(max(1, window_days))
+
+    v14 = velocity(14)
+    v60 = velocity(60)
+    rec_days = _recurrence_from_obs(t["obs"], t["obs_n"])
+    first_seen = datetime.fromisoformat(t["first"][1])
+    last_seen = datetime.fromisoformat(t["last"][1])
+    n = t["obs_n"]
+    return TermTemporalProfile(
+        term_key=key,
+        term=t["term"],
+        first_seen_ts=t["first"][1],
+        last_seen_ts=t["last"][1],
+        obs_n=n,
+        v14=float(v14),
+        v60=float(v60),
+        recurrence_days=rec_days,
+        half_life_days_fit=float(_decay_fit_half_life_days(v14, v60)),
+        phase=_phase_state(
+            first_seen=first_seen,
+            last_seen=last_seen,
+            now=now,
+            v14=v14,
+            v60=v60,
+            prev_gap_days=rec_days,
+        ),
+        manipulation_risk_mean=float(t["risk_sum"] / max(1, n)),
+        novelty_mean=float(t["nov_sum"] / max(1, n)),
+        propagation_mean=float(t["prop_sum"] / max(1, n)),
+        tags_union=sorted(list(t["tags"])),
+        provenance={
+            "method": "build_temporal_profiles.v0.1",
+            "registry": registry_path,
+        },
+    )
+
+
 def build_temporal_profiles(
     registry_path: str,
     *,
     now_iso: Optional[str] = None,
     max_terms: int = 2000,
     min_obs: int = 2,
+    incremental: bool = True,
 ) -> List[TermTemporalProfile]:
+    """
+    Build per-term temporal profiles from a term registry.
+
+    With incremental=True the registry's persisted state is extended with
+    newly appended lines; incremental=False folds the whole file afresh
+    without touching the state file. Both give the same profiles.
+    """
     now = _parse_dt(now_iso) if now_iso else None
     now = now or _utc_now()
 
-    rows = _read_jsonl(registry_path)
-    by_key: Dict[str, List[Dict[str, Any]]] = {}
-    for row in rows:
-        key = row.get("term_key")
-        term = row.get("term")
-        ts = (
-            _parse_dt(str(row.get("ts") or ""))
-            or _parse_dt(str(row.get("last_seen_ts") or ""))
-            or None
-        )
-        if not key or not term or not ts:
-            continue
-        by_key.setdefault(str(key), []).append(row)
+    if incremental:
+        terms = get_registry_state(registry_path).current_terms()
+    else:
+        terms = TemporalRegistryState(registry_path, persist=False).current_terms()
 
     profiles: List[TermTemporalProfile] = []
-    for key, recs in by_key.items():
-        obs: List[Tuple[datetime, int]] = []
-        obs_ts: List[datetime] = []
-        term = str(recs[-1].get("term") or "")
-        tags_union = set()
-        risk_vals = []
-        nov_vals = []
-        prop_vals = []
-
-        first_seen = None
-        last_seen = None
-
-        for rec in recs:
-            t_last = _parse_dt(str(rec.get("last_seen_ts") or "")) or _parse_dt(
-                str(rec.get("ts") or "")
-            )
-            t_first = _parse_dt(str(rec.get("first_seen_ts") or "")) or t_last
-            if not t_last:
-                continue
-            count = int(rec.get("count") or 0)
-            obs.append((t_last, count))
-            obs_ts.append(t_last)
-            tags_union.update(list(rec.get("tags") or []))
-            risk_vals.append(float(rec.get("manipulation_risk") or 0.0))
-            nov_vals.append(float(rec.get("novelty_score") or 0.0))
-            prop_vals.append(float(rec.get("propagation_score") or 0.0))
-
-            if first_seen is None or (t_first and t_first < first_seen):
-                first_seen = t_first
-            if last_seen is None or t_last > last_seen:
-                last_seen = t_last
-
-        if not obs or not first_seen or not last_seen:
+    for key, t in terms.items():
+        if t["obs_n"] == 0 or t["first"] is None or t["last"] is None:
             continue
-        if len(obs) < min_obs:
+        if t["obs_n"] < min_obs:
             continue
-
-        v14 = _window_velocity(obs, 14, now)
-        v60 = _window_velocity(obs, 60, now)
-        rec_days = _recurrence_days(obs_ts)
-        hl_fit = _decay_fit_half_life_days(v14, v60)
-        phase = _phase_state(
-            first_seen=first_seen,
-            last_seen=last_seen,
-            now=now,
-            v14=v14,
-            v60=v60,
-            prev_gap_days=rec_days,
-        )
-
-        risk_mean = sum(risk_vals) / max(1, len(risk_vals))
-        nov_mean = sum(nov_vals) / max(1, len(nov_vals))
-        prop_mean = sum(prop_vals) / max(1, len(prop_vals))
-
-        profiles.append(
-            TermTemporalProfile(
-                term_key=str(key),
-                term=term,
-                first_seen_ts=first_seen.isoformat(),
-                last_seen_ts=last_seen.isoformat(),
-                obs_n=len(obs),
-                v14=float(v14),
-                v60=float(v60),
-                recurrence_days=rec_days,
-                half_life_days_fit=float(hl_fit),
-                phase=phase,
-                manipulation_risk_mean=float(risk_mean),
-                novelty_mean=float(nov_mean),
-                propagation_mean=float(prop_mean),
-                tags_union=sorted(list(tags_union)),
-                provenance={
-                    "method": "build_temporal_profiles.v0.1",
-                    "registry": registry_path,
-                },
-            )
-        )
+        profiles.append(_profile_from_state(key, t, now=now, registry_path=registry_path))
 
     phase_rank = {
         "surging": 0,
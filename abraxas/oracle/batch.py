@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib
 import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from abraxas.core.canonical import canonical_json, sha256_hex
@@ -134,6 +139,110 @@ def _shadow_context(payload: Dict[str, Any], *, run_at: str) -> Dict[str, Any]:
     return ctx
 
 
+RUN_CACHE_FILE = ".run_cache.json"
+RUN_CACHE_VERSION = 1
+# Packages whose code turns a payload into run outputs; editing any of their
+# sources invalidates cached runs. Data the renderers read at run time (e.g.
+# AALmanac entries) is not part of the key: use --no-cache after changing it.
+RUN_CODE_PACKAGES = ("abraxas.mda", "abraxas.oracle")
+
+
+def _code_fingerprint() -> str:
+    """sha256 over the .py sources of RUN_CODE_PACKAGES."""
+    h = hashlib.sha256()
+    for name in RUN_CODE_PACKAGES:
+        root = Path(importlib.import_module(name).__file__).parent
+        for path in sorted(root.rglob("*.py")):
+            h.update(f"{name}/{path.relative_to(root).as_posix()}\n".encode("utf-8"))
+            h.update(hashlib.sha256(path.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def _run_cache_key(payload_bytes: bytes, opts: Dict[str, Any]) -> str:
+    """Key for one run: payload content, the pipeline code and every option that shapes its outputs."""
+    return sha256_hex(canonical_json({
+        "version": RUN_CACHE_VERSION,
+        "code": opts["code_fingerprint"],
+        "payload_sha256": hashlib.sha256(payload_bytes).hexdigest(),
+        "env": opts["env"],
+        "run_at": opts["run_at"],
+        "mode": opts["mode"],
+        "emit_signal_v2": opts["emit_signal_v2"],
+        "signal_schema_check": opts["signal_schema_check"],
+    }))
+
+
+def _load_cached_run(run_dir: str, cache_key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(run_dir, RUN_CACHE_FILE), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("cache_key") != cache_key:
+        return None
+    result = cached.get("result")
+    if not isinstance(result, dict):
+        return None
+    if not all(os.path.exists(os.path.join(run_dir, a)) for a in result.get("artifacts", [])):
+        return None
+    return result
+
+
+def _process_payload(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one payload through MDA, signal v2 and rendering; write its run directory.
+
+    Module-level so process-pool workers can run it.
+    """
+    opts = job["opts"]
+    run_dir = job["run_dir"]
+    os.makedirs(run_dir, exist_ok=True)
+
+    with open(job["payload_path"], "rb") as f:
+        payload_bytes = f.read()
+    cache_key = _run_cache_key(payload_bytes, opts)
+    if opts["use_cache"]:
+        cached = _load_cached_run(run_dir, cache_key)
+        if cached is not None:
+            return dict(cached, cached=True)
+
+    payload = json.loads(payload_bytes.decode("utf-8"))
+    shadow_context = _shadow_context(payload, run_at=opts["run_at"]) if isinstance(payload, dict) else None
+
+    mda_out = run_mda_for_oracle(payload, env=opts["env"], run_at=opts["run_at"])
+    sig = mda_to_oracle_signal_v2(mda_out)
+    if opts["signal_schema_check"]:
+        shallow_schema_check(sig)
+
+    artifacts: List[str] = []
+    if opts["emit_signal_v2"]:
+        sp = os.path.join(run_dir, "signal_v2.json")
+        with open(sp, "w", encoding="utf-8") as f:
+            json.dump(sig, f, ensure_ascii=False, indent=2, sort_keys=True)
+        artifacts.append("signal_v2.json")
+
+    rendered = render_from_signal_v2(sig, mode=opts["mode"])
+    md_path = os.path.join(run_dir, f"{opts['mode']}.md")
+    _write_text(md_path, rendered.markdown)
+    artifacts.append(f"{opts['mode']}.md")
+
+    result = {
+        "signal_slice_hash": _ensure_slice_hash(sig),
+        "artifacts": artifacts,
+        "shadow_summary": _shadow_summary_from_signal_v2(sig),
+        "shadow_context": shadow_context,
+    }
+    with open(os.path.join(run_dir, RUN_CACHE_FILE), "w", encoding="utf-8") as f:
+        json.dump({"cache_key": cache_key, "result": result}, f, ensure_ascii=False, sort_keys=True)
+    return dict(result, cached=False)
+
+
+def _payload_pool(workers: int) -> ProcessPoolExecutor:
+    # fork where available (as abx.cycle_dag does): workers inherit the
+    # parent's imported modules instead of re-importing the pipeline.
+    ctx = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Run oracle batch packaging.")
     p.add_argument("--payload-dir", required=True)
@@ -147,6 +256,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     p.add_argument("--version", default="0.1.0")
     p.add_argument("--domains", default="")
     p.add_argument("--subdomains", default="")
+    p.add_argument("--workers", type=int, default=1, help="Process payloads in parallel")
+    p.add_argument("--no-cache", action="store_true", help="Recompute runs even if unchanged")
     args = p.parse_args(argv)
 
     os.makedirs(args.out, exist_ok=True)
@@ -154,46 +265,45 @@ def main(argv: Optional[List[str]] = None) -> int:
     domains = _parse_domains(args.domains)
     subdomains = _parse_domains(args.subdomains)
 
+    opts = {
+        "env": args.env,
+        "run_at": args.run_at,
+        "mode": args.mode,
+        "emit_signal_v2": bool(args.emit_signal_v2),
+        "signal_schema_check": bool(args.signal_schema_check),
+        "use_cache": not args.no_cache,
+        # Computed once here rather than in every worker.
+        "code_fingerprint": _code_fingerprint(),
+    }
+    jobs = [
+        {
+            "payload_path": payload_path,
+            "run_dir": os.path.join(args.out, f"run_{idx:02d}"),
+            "opts": opts,
+        }
+        for idx, payload_path in enumerate(payloads, start=1)
+    ]
+    if args.workers > 1 and len(jobs) > 1:
+        with _payload_pool(min(args.workers, len(jobs))) as pool:
+            # map() yields in submission order, so run numbering and packet order are unchanged.
+            results = list(pool.map(_process_payload, jobs))
+    else:
+        results = [_process_payload(job) for job in jobs]
+
     packet_runs: List[OraclePacketRun] = []
     shadow_context: Optional[Dict[str, Any]] = None
-    for idx, payload_path in enumerate(payloads, start=1):
-        run_id = f"run_{idx:02d}"
-        run_dir = os.path.join(args.out, run_id)
-        os.makedirs(run_dir, exist_ok=True)
-
-        with open(payload_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-        if shadow_context is None and isinstance(payload, dict):
-            shadow_context = _shadow_context(payload, run_at=args.run_at)
-
-        mda_out = run_mda_for_oracle(payload, env=args.env, run_at=args.run_at)
-        sig = mda_to_oracle_signal_v2(mda_out)
-        if args.signal_schema_check:
-            shallow_schema_check(sig)
-
-        artifacts: List[str] = []
-        if args.emit_signal_v2:
-            sp = os.path.join(run_dir, "signal_v2.json")
-            with open(sp, "w", encoding="utf-8") as f:
-                json.dump(sig, f, ensure_ascii=False, indent=2, sort_keys=True)
-            artifacts.append("signal_v2.json")
-
-        rendered = render_from_signal_v2(sig, mode=args.mode)
-        md_path = os.path.join(run_dir, f"{args.mode}.md")
-        _write_text(md_path, rendered.markdown)
-        artifacts.append(f"{args.mode}.md")
-
-        slice_hash = _ensure_slice_hash(sig)
-        shadow_summary = _shadow_summary_from_signal_v2(sig)
+    for idx, (payload_path, result) in enumerate(zip(payloads, results), start=1):
+        if shadow_context is None and result.get("shadow_context") is not None:
+            shadow_context = result["shadow_context"]
         packet_runs.append(OraclePacketRun(
-            run_id=run_id,
+            run_id=f"run_{idx:02d}",
             payload_path=payload_path,
             mode=args.mode,
             domains=tuple(domains) if domains else tuple(),
             subdomains=tuple(subdomains) if subdomains else tuple(),
-            signal_slice_hash=slice_hash,
-            artifacts=tuple(artifacts),
-            shadow_summary=shadow_summary,
+            signal_slice_hash=result["signal_slice_hash"],
+            artifacts=tuple(result["artifacts"]),
+            shadow_summary=result["shadow_summary"],
         ))
 
     packet = OraclePacket(
@@ -9,8 +9,9 @@ import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Literal
+from typing import Any, Iterator, Literal
 
+from abraxas.perf.rollup import empty_aggregate, add_record, get_perf_rollup, record_matches
 from abraxas.perf.schema import PerfEvent
 
 
@@ -50,46 +51,57 @@ def write_perf_event(event: PerfEvent) -> None:
         f.write(serialized + "\n")
 
 
-def read_perf_events(
+def iter_perf_records(
     *,
     since_utc: str | None = None,
     op_name: str | None = None,
     source_id: str | None = None,
-) -> list[PerfEvent]:
-    """Read performance events from ledger with optional filters.
+) -> Iterator[dict[str, Any]]:
+    """Stream raw ledger records, filtering before any model construction.
 
     Args:
         since_utc: Optional ISO8601 timestamp to filter events after
         op_name: Optional operation name filter
         source_id: Optional source ID filter
 
-    Returns:
-        List of PerfEvent objects
+    Yields:
+        Matching records as parsed JSON dicts
     """
     ledger_path = get_perf_ledger_path()
     if not ledger_path.exists():
-        return []
+        return
 
-    events: list[PerfEvent] = []
     with open(ledger_path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
 
-            event = PerfEvent(**json.loads(line))
+            record = json.loads(line)
+            if record_matches(record, since_utc=since_utc, op_name=op_name, source_id=source_id):
+                yield record
 
-            # Apply filters
-            if since_utc and event.timestamp_utc < since_utc:
-                continue
-            if op_name and event.op_name != op_name:
-                continue
-            if source_id and event.source_id != source_id:
-                continue
 
-            events.append(event)
+def read_perf_events(
+    *,
+    since_utc: str | None = None,
+    op_name: str | None = None,
+    source_id: str | None = None,
+) -> list[PerfEvent]:
+    """Read performance events from ledger with optional filters.
+
+    Args:
+        since_utc: Optional ISO8601 timestamp to filter events after
+        op_name: Optional operation name filter
+        source_id: Optional source ID filter
 
-    return events
+    Returns:
+        List of PerfEvent objects
+    """
+    return [
+        PerfEvent(**record)
+        for record in iter_perf_records(since_utc=since_utc, op_name=op_name, source_id=source_id)
+    ]
 
 
 def summarize_perf(
@@ -97,6 +109,7 @@ def summarize_perf(
     *,
     op_name: str | None = None,
     source_id: str | None = None,
+    use_rollups: bool = True,
 ) -> dict:
     """Summarize performance metrics for a time window.
 
@@ -104,14 +117,25 @@ def summarize_perf(
         window_hours: Time window in hours (default: 24)
         op_name: Optional operation name filter
         source_id: Optional source ID filter
+        use_rollups: Answer from the hourly rollup sidecar (default) instead
+            of streaming the whole ledger
 
     Returns:
         Summary dict with metrics
     """
     since_utc = (datetime.utcnow() - timedelta(hours=window_hours)).isoformat()
-    events = read_perf_events(since_utc=since_utc, op_name=op_name, source_id=source_id)
 
-    if not events:
+    if use_rollups:
+        agg = get_perf_rollup(get_perf_ledger_path()).aggregate(
+            since_utc=since_utc, op_name=op_name, source_id=source_id
+        )
+    else:
+        agg = empty_aggregate()
+        for record in iter_perf_records(since_utc=since_utc, op_name=op_name, source_id=source_id):
+            add_record(agg, record)
+
+    event_count = agg["event_count"]
+    if not event_count:
         return {
             "window_hours": window_hours,
             "event_count": 0,
@@ -123,25 +147,17 @@ def summarize_perf(
             "decodo_call_count": 0,
         }
 
-    total_bytes_in = sum(e.bytes_in for e in events)
-    total_bytes_out = sum(e.bytes_out for e in events)
-    total_duration_ms = sum(e.duration_ms for e in events)
-    cache_hits = sum(1 for e in events if e.cache_hit)
-    decodo_calls = sum(1 for e in events if e.decodo_used)
-
-    compression_ratios = [e.compression_ratio for e in events if e.compression_ratio is not None]
-    avg_compression_ratio = (
-        sum(compression_ratios) / len(compression_ratios) if compression_ratios else 0.0
-    )
+    ratio_count = agg["compression_ratio_count"]
+    avg_compression_ratio = agg["compression_ratio_sum"] / ratio_count if ratio_count else 0.0
 
     return {
         "window_hours": window_hours,
-        "event_count": len(events),
-        "total_bytes_in": total_bytes_in,
-        "total_bytes_out": total_bytes_out,
-        "total_duration_ms": total_duration_ms,
-        "cache_hit_rate": cache_hits / len(events) if events else 0.0,
+        "event_count": event_count,
+        "total_bytes_in": agg["bytes_in"],
+        "total_bytes_out": agg["bytes_out"],
+        "total_duration_ms": agg["duration_ms"],
+        "cache_hit_rate": agg["cache_hits"] / event_count,
         "avg_compression_ratio": avg_compression_ratio,
-        "decodo_call_count": decodo_calls,
-        "bytes_saved": total_bytes_in - total_bytes_out,
+        "decodo_call_count": agg["decodo_calls"],
+        "bytes_saved": agg["bytes_in"] - agg["bytes_out"],
     }
@@ -0,0 +1,237 @@
+"""Hourly rollups for the performance ledger.
+
+Performance Drop v1.0 - Pre-aggregated rent metrics.
+
+The rollup is a sidecar next to perf_ledger.jsonl holding per-hour,
+per-(op_name, source_id) totals plus the byte ranges each hour occupies in
+the ledger. It is extended incrementally from the last indexed offset, so a
+summary over months of events reads only the newly appended lines. Hours
+fully inside a window are answered from totals; the hour holding the window
+start is re-scanned from its byte ranges. Counts and integer totals match a
+full scan exactly. Float totals (durations, compression ratios) are summed
+per hour and then merged, so they equal a full scan only up to float
+rounding.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from abraxas.core.jsonl_sidecar import (
+    AppendCursor,
+    iter_complete_lines,
+    iter_range_lines,
+    read_sidecar,
+    write_sidecar,
+)
+
+
+# v2: fingerprints both the head and the tail of the indexed prefix.
+ROLLUP_VERSION = 2
+
+# Hour bucket = first 13 chars of the ISO timestamp ("YYYY-MM-DDTHH").
+# Prefix order agrees with string order, which is how windows are compared.
+_HOUR_PREFIX = 13
+# Events without a timestamp get "now" when parsed, so every window holds them.
+_UNDATED = ""
+
+_AGG_FIELDS = (
+    "event_count",
+    "bytes_in",
+    "bytes_out",
+    "duration_ms",
+    "cache_hits",
+    "decodo_calls",
+    "compression_ratio_sum",
+    "compression_ratio_count",
+)
+
+
+def empty_aggregate() -> Dict[str, Any]:
+    return {name: 0 for name in _AGG_FIELDS}
+
+
+def add_record(agg: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Fold one raw ledger record into an aggregate."""
+    agg["event_count"] += 1
+    agg["bytes_in"] += record.get("bytes_in", 0) or 0
+    agg["bytes_out"] += record.get("bytes_out", 0) or 0
+    agg["duration_ms"] += record.get("duration_ms", 0.0) or 0.0
+    if record.get("cache_hit"):
+        agg["cache_hits"] += 1
+    if record.get("decodo_used"):
+        agg["decodo_calls"] += 1
+    ratio = record.get("compression_ratio")
+    if ratio is not None:
+        agg["compression_ratio_sum"] += ratio
+        agg["compression_ratio_count"] += 1
+
+
+def merge_aggregate(into: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for name in _AGG_FIELDS:
+        into[name] += other.get(name, 0)
+
+
+def record_matches(
+    record: Dict[str, Any],
+    *,
+    since_utc: str | None = None,
+    op_name: str | None = None,
+    source_id: str | None = None,
+) -> bool:
+    """Apply read_perf_events filters to a raw ledger record."""
+    if since_utc:
+        ts = record.get("timestamp_utc")
+        if ts is not None and ts < since_utc:
+            return False
+    if op_name and record.get("op_name") != op_name:
+        return False
+    if source_id and record.get("source_id") != source_id:
+        return False
+    return True
+
+
+def _group_key(record: Dict[str, Any]) -> str:
+    return f"{record.get('op_name') or ''}|{record.get('source_id') or ''}"
+
+
+def _hour_of(record: Dict[str, Any]) -> str:
+    ts = record.get("timestamp_utc")
+    if ts is None:
+        return _UNDATED
+    return str(ts)[:_HOUR_PREFIX]
+
+
+class PerfRollup:
+    """Incrementally maintained hourly rollup of one perf ledger file."""
+
+    def __init__(self, ledger_path: Path) -> None:
+        self.ledger_path = Path(ledger_path)
+        self.rollup_path = self.ledger_path.with_name(self.ledger_path.name + ".rollup.json")
+        self._cursor = AppendCursor(self.ledger_path)
+        # hour -> {"groups": {"op|source": aggregate}, "ranges": [[start, end], ...]}
+        self.hours: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self._cursor.indexed_bytes
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Load the rollup and fold in lines appended since it was written."""
+        if not self.ledger_path.exists():
+            self._reset()
+            return
+        if self.indexed_bytes == 0:
+            self._load()
+        size = self.ledger_path.stat().st_size
+        if not self._cursor.is_current(size):
+            self._reset()
+        if size > self.indexed_bytes:
+            before = self.indexed_bytes
+            self._index_from(self.indexed_bytes, size)
+            if self.indexed_bytes != before:
+                self._save()
+
+    def rebuild(self) -> None:
+        """Discard the rollup file and re-aggregate the whole ledger."""
+        self._reset()
+        if self.rollup_path.exists():
+            self.rollup_path.unlink()
+        self.refresh()
+
+    def _reset(self) -> None:
+        self._cursor.reset()
+        self.hours = {}
+
+    def _index_from(self, offset: int, size: int) -> None:
+        # A torn trailing line is picked up by the next refresh.
+        pos = offset
+        for start, raw in iter_complete_lines(self.ledger_path, offset, size):
+            pos = start + len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            bucket = self.hours.setdefault(_hour_of(record), {"groups": {}, "ranges": []})
+            group = bucket["groups"].setdefault(_group_key(record), empty_aggregate())
+            add_record(group, record)
+            ranges = bucket["ranges"]
+            if ranges and ranges[-1][1] == start:
+                ranges[-1][1] = pos
+            else:
+                ranges.append([start, pos])
+        if pos != offset:
+            self._cursor.advance(pos)
+
+    def _load(self) -> None:
+        data = read_sidecar(self.rollup_path, ROLLUP_VERSION)
+        if data is None:
+            return
+        self._cursor.restore(data)
+        self.hours = data.get("hours", {})
+
+    def _save(self) -> None:
+        # Read-only location: keep the in-memory rollup for this process.
+        write_sidecar(
+            self.rollup_path,
+            {"version": ROLLUP_VERSION, **self._cursor.to_dict(), "hours": self.hours},
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _iter_ranges(self, ranges: List[List[int]]) -> Iterator[Dict[str, Any]]:
+        for raw in iter_range_lines(self.ledger_path, ranges):
+            if raw.strip():
+                yield json.loads(raw)
+
+    def aggregate(
+        self,
+        *,
+        since_utc: str | None = None,
+        op_name: str | None = None,
+        source_id: str | None = None,
+    ) -> Dict[str, Any]:
+        """Totals over all indexed events matching read_perf_events filters."""
+        self.refresh()
+        total = empty_aggregate()
+        since_hour = since_utc[:_HOUR_PREFIX] if since_utc else None
+        for hour, bucket in self.hours.items():
+            if since_hour is not None and hour != _UNDATED:
+                if hour < since_hour:
+                    continue
+                if hour == since_hour:
+                    # Window starts inside this hour: filter its lines exactly.
+                    for record in self._iter_ranges(bucket["ranges"]):
+                        if record_matches(record, since_utc=since_utc, op_name=op_name, source_id=source_id):
+                            add_record(total, record)
+                    continue
+            for key, agg in bucket["groups"].items():
+                if op_name or source_id:
+                    key_op, key_source = key.split("|", 1)
+                    if op_name and key_op != op_name:
+                        continue
+                    if source_id and key_source != source_id:
+                        continue
+                merge_aggregate(total, agg)
+        return total
+
+
+_ROLLUP_CACHE: Dict[str, PerfRollup] = {}
+
+
+def get_perf_rollup(ledger_path: Path) -> PerfRollup:
+    """Process-wide PerfRollup per ledger path."""
+    key = str(Path(ledger_path).resolve())
+    rollup = _ROLLUP_CACHE.get(key)
+    if rollup is None:
+        rollup = PerfRollup(ledger_path)
+        _ROLLUP_CACHE[key] = rollup
+    return rollup
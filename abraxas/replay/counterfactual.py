@@ -4,10 +4,11 @@ Counterfactual Replay Engine (CRE) v0.1
 
 from __future__ import annotations
 
+import copy
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 import yaml
 
@@ -22,6 +23,9 @@ from abraxas.scoreboard.aggregate import aggregate_scores_for_cases
 from abraxas.scoreboard.component_ledger import ComponentScoreLedger, write_component_score_summary
 from abraxas.scoreboard.components import aggregate_component_outcomes
 
+if TYPE_CHECKING:
+    from abraxas.backtest.session import BacktestSession
+
 
 def run_counterfactual(
     run_id: str,
@@ -34,8 +38,9 @@ def run_counterfactual(
     max_cases: int = 100,
     max_ensembles: int = 50,
     emit_artifacts: bool = True,
+    session: Optional["BacktestSession"] = None,
 ) -> Dict[str, Any]:
-    cases = _load_cases(cases_dir)
+    cases = load_cases(cases_dir)
     portfolios = load_portfolios(portfolios_path)
 
     if portfolio_id not in portfolios:
@@ -50,10 +55,11 @@ def run_counterfactual(
     baseline_results = _evaluate_cases(
         selected_cases,
         overrides.get("baseline_results"),
+        session,
     )
     baseline_scores = aggregate_scores_for_cases(baseline_results)
-    baseline_regime_scores = _extract_regime_scores(baseline_scores)
-    baseline_forecast_scores = _extract_forecast_scores(baseline_scores)
+    baseline_regime_scores = extract_regime_scores(baseline_scores)
+    baseline_forecast_scores = extract_forecast_scores(baseline_scores)
     baseline_component_outcomes = _collect_component_outcomes(
         baseline_results, selected_cases, fdr_path
     )
@@ -64,10 +70,11 @@ def run_counterfactual(
         masks,
         overrides.get("masked_results"),
         influences_by_case,
+        session,
     )
     masked_scores = aggregate_scores_for_cases(masked_results)
-    masked_regime_scores = _extract_regime_scores(masked_scores)
-    masked_forecast_scores = _extract_forecast_scores(masked_scores)
+    masked_regime_scores = extract_regime_scores(masked_scores)
+    masked_forecast_scores = extract_forecast_scores(masked_scores)
     masked_component_outcomes = _collect_component_outcomes(
         masked_results, selected_cases, fdr_path
     )
@@ -103,7 +110,8 @@ def run_counterfactual(
     return report
 
 
-def _load_cases(cases_dir: str) -> List[BacktestCase]:
+def load_cases(cases_dir: str) -> List[BacktestCase]:
+    """Load every case under cases_dir (single-case or "cases:" files), sorted by case_id."""
     cases_path = Path(cases_dir)
     cases: List[BacktestCase] = []
     for case_file in sorted(cases_path.glob("*.yaml")):
@@ -120,10 +128,13 @@ def _load_cases(cases_dir: str) -> List[BacktestCase]:
 def _evaluate_cases(
     cases: Iterable[BacktestCase],
     override_results: Optional[List[BacktestResult]],
+    session: Optional["BacktestSession"] = None,
 ) -> List[BacktestResult]:
     if override_results is not None:
-        return _coerce_results(override_results)
+        return coerce_results(override_results)
 
+    if session is not None:
+        return session.evaluate_cases(cases, run_id="counterfactual")
     return [evaluate_case(case, enable_learning=False, run_id="counterfactual") for case in cases]
 
 
@@ -132,34 +143,43 @@ def _evaluate_masked_cases(
     masks: List[ReplayMask],
     override_results: Optional[List[BacktestResult]],
     influences_by_case: Dict[str, List[ReplayInfluence]],
+    session: Optional["BacktestSession"] = None,
 ) -> List[BacktestResult]:
     if override_results is not None:
-        return _coerce_results(override_results)
+        return coerce_results(override_results)
 
-    masked_results: List[BacktestResult] = []
+    masked_cases: List[BacktestCase] = []
     for case in cases:
         influences = influences_by_case.get(case.case_id, [])
-        masked_influences = _apply_masks(influences, masks)
-        case_with_mask = _attach_masked_influences(case, masked_influences)
-        masked_results.append(evaluate_case(case_with_mask, enable_learning=False, run_id="counterfactual_masked"))
-    return masked_results
+        masked_influences = apply_masks(influences, masks)
+        masked_cases.append(attach_masked_influences(case, masked_influences))
+    if session is not None:
+        return session.evaluate_cases(masked_cases, run_id="counterfactual_masked")
+    return [
+        evaluate_case(case, enable_learning=False, run_id="counterfactual_masked")
+        for case in masked_cases
+    ]
 
 
-def _apply_masks(
+def apply_masks(
     influences: List[ReplayInfluence],
     masks: List[ReplayMask],
 ) -> List[ReplayInfluence]:
+    """Apply masks to a case's influence events, in order."""
     masked = list(influences)
     for mask in masks:
         masked = apply_mask_to_influence_events(masked, mask)
     return masked
 
 
-def _attach_masked_influences(
+def attach_masked_influences(
     case: BacktestCase,
     influences: List[ReplayInfluence],
 ) -> BacktestCase:
-    case_copy = case.model_copy(deep=True)
+    """Copy of the case with the (masked) influences attached for evaluation."""
+    # deepcopy rather than model_copy(deep=True): same copy, and it also
+    # works with the minimal pydantic stand-in.
+    case_copy = copy.deepcopy(case)
     case_copy.forecast_delta_summary = case_copy.forecast_delta_summary or {}
     case_copy.forecast_delta_summary["masked_influences"] = [
         influence.__dict__ for influence in influences
@@ -191,7 +211,8 @@ def _collect_component_outcomes(
     return outcomes
 
 
-def _coerce_results(results: List[Any]) -> List[BacktestResult]:
+def coerce_results(results: List[Any]) -> List[BacktestResult]:
+    """BacktestResults from override data (results or their dicts)."""
     coerced: List[BacktestResult] = []
     for result in results:
         if isinstance(result, BacktestResult):
@@ -427,6 +448,7 @@ def run_counterfactual_exclusion(
     overrides_path: Optional[str] = None,
     max_cases: int = 100,
     max_ensembles: int = 50,
+    session: Optional["BacktestSession"] = None,
 ) -> Dict[str, Any]:
     return run_counterfactual(
         run_id=run_id,
@@ -439,6 +461,7 @@ def run_counterfactual_exclusion(
         max_cases=max_cases,
         max_ensembles=max_ensembles,
         emit_artifacts=False,
+        session=session,
     )
 
 
@@ -449,7 +472,8 @@ def _write_component_scores(run_id: str, scores: Dict[str, Any]) -> None:
     write_component_score_summary(run_id, scores)
 
 
-def _extract_regime_scores(scores: Dict[str, Any]) -> Dict[str, Any]:
+def extract_regime_scores(scores: Dict[str, Any]) -> Dict[str, Any]:
+    """Regime metrics of aggregate_scores_for_cases() output."""
     return {
         "coverage_rate": scores.get("coverage_rate"),
         "trend_acc": scores.get("trend_acc"),
@@ -457,7 +481,8 @@ def _extract_regime_scores(scores: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _extract_forecast_scores(scores: Dict[str, Any]) -> Dict[str, Any]:
+def extract_forecast_scores(scores: Dict[str, Any]) -> Dict[str, Any]:
+    """Forecast metrics of aggregate_scores_for_cases() output."""
     return {
         "brier_avg": scores.get("brier_avg"),
         "log_avg": scores.get("log_avg"),
@@ -55,6 +55,11 @@ def load_capability_registry() -> CapabilityRegistry:
     with open(registry_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return capability_registry_from_payload(data)
+
+
+def capability_registry_from_payload(data: Dict[str, Any]) -> CapabilityRegistry:
+    """Build a CapabilityRegistry from a parsed registry.json payload."""
     capabilities_data = data.get("capabilities", [])
     return CapabilityRegistry(
         version=data.get("capability_version", data.get("version", "2.0.0")),
@@ -82,6 +87,7 @@ def register_capability(
 __all__ = [
     "CapabilityContract",
     "CapabilityRegistry",
+    "capability_registry_from_payload",
     "load_capability_registry",
     "register_capability",
 ]
@@ -7,10 +7,9 @@ import importlib
 from pathlib import Path
 from typing import Any
 
-from abraxas.runes.capabilities import load_capability_registry
 from abraxas.runes.ctx import RuneInvocationContext, require_ctx
 from abraxas.runes.ledger import RuneInvocationLedger, build_record
-from abraxas.runes.registry import describe_rune, list_runes_by_capability
+from abraxas.runes.registry import RegistrySnapshot, get_registry_snapshot
 
 
 class RuneInvocationError(RuntimeError):
@@ -21,22 +20,53 @@ class RuneStubError(RuneInvocationError):
     """Raised when a rune operator is a stub and cannot execute."""
 
 
-def _resolve_operator(operator_path: str):
+def _resolve_operator(operator_path: str, snapshot: RegistrySnapshot | None = None):
+    if snapshot is not None and operator_path in snapshot.operators:
+        return snapshot.operators[operator_path]
     module_path, func_name = operator_path.split(":", 1)
     module = importlib.import_module(module_path)
     try:
-        return getattr(module, func_name)
+        operator = getattr(module, func_name)
     except AttributeError as exc:
         raise RuneInvocationError(
             f"Missing operator function {func_name} in {module_path}"
         ) from exc
+    if snapshot is not None:
+        snapshot.operators[operator_path] = operator
+    return operator
 
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _validate_with_schema(schema_relpath: str | None, payload: dict[str, Any], *, label: str) -> None:
+def _schema_validator(schema_path: Path, snapshot: RegistrySnapshot | None):
+    """Compiled validator for a schema file, cached on the snapshot by mtime/size."""
+    import jsonschema  # type: ignore
+
+    st = schema_path.stat()
+    stamp = (str(schema_path), st.st_mtime_ns, st.st_size)
+    key = str(schema_path)
+    if snapshot is not None:
+        cached = snapshot.validators.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    if snapshot is not None:
+        snapshot.validators[key] = (stamp, validator)
+    return validator
+
+
+def _validate_with_schema(
+    schema_relpath: str | None,
+    payload: dict[str, Any],
+    *,
+    label: str,
+    snapshot: RegistrySnapshot | None = None,
+) -> None:
     if not schema_relpath:
         return
     try:
@@ -49,11 +79,10 @@ def _validate_with_schema(schema_relpath: str | None, payload: dict[str, Any], *
     schema_path = _repo_root() / schema_relpath
     if not schema_path.exists():
         raise RuneInvocationError(f"Missing {label} schema: {schema_relpath}")
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    try:
-        jsonschema.validate(instance=payload, schema=schema)
-    except jsonschema.ValidationError as exc:
-        raise RuneInvocationError(f"{label} schema validation failed: {exc.message}") from exc
+    validator = _schema_validator(schema_path, snapshot)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(payload))
+    if error is not None:
+        raise RuneInvocationError(f"{label} schema validation failed: {error.message}") from error
 
 
 def invoke_rune(
@@ -66,8 +95,11 @@ def invoke_rune(
 ) -> dict[str, Any]:
     context = require_ctx(ctx)
     ledger = ledger or RuneInvocationLedger()
-    binding = describe_rune(rune_id)
-    operator = _resolve_operator(binding.operator_path)
+    snapshot = get_registry_snapshot()
+    binding = snapshot.by_rune_id.get(rune_id)
+    if binding is None:
+        raise KeyError(f"Unknown rune id: {rune_id}")
+    operator = _resolve_operator(binding.operator_path, snapshot)
 
     try:
         outputs = operator(**inputs, strict_execution=strict_execution)
@@ -157,7 +189,8 @@ def invoke_capability(
         requested_inputs = input_adapter(inputs)
 
     # Prefer canonical rune bindings first (e.g., "rune:sds")
-    bindings = list_runes_by_capability(capability)
+    snapshot = get_registry_snapshot()
+    bindings = snapshot.by_capability.get(capability, [])
     if bindings:
         if len(bindings) > 1:
             raise RuneInvocationError(f"Multiple runes registered for capability: {capability}")
@@ -171,16 +204,15 @@ def invoke_capability(
         return output_adapter(out)
 
     # Fall back to capability contracts (e.g., "oracle.v2.run")
-    contract_registry = load_capability_registry()
-    contract = contract_registry.find_capability(capability)
+    contract = snapshot.capability_registry.find_capability(capability)
     if contract is None:
         raise RuneInvocationError(f"No rune registered for capability: {capability}")
 
     context = require_ctx(ctx)
     ledger = ledger or RuneInvocationLedger()
-    operator = _resolve_operator(contract.operator_path)
+    operator = _resolve_operator(contract.operator_path, snapshot)
 
-    _validate_with_schema(contract.input_schema, requested_inputs, label="input")
+    _validate_with_schema(contract.input_schema, requested_inputs, label="input", snapshot=snapshot)
     try:
         outputs = operator(**requested_inputs, strict_execution=strict_execution)
     except NotImplementedError as exc:
@@ -214,7 +246,7 @@ def invoke_capability(
         raise RuneInvocationError(
             f"Capability operator {contract.operator_path} must return dict, got {type(outputs).__name__}"
         )
-    _validate_with_schema(contract.output_schema, outputs, label="output")
+    _validate_with_schema(contract.output_schema, outputs, label="output", snapshot=snapshot)
 
     record = build_record(
         rune_id=contract.rune_id,
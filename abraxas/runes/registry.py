@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
+from abraxas.runes.capabilities import CapabilityRegistry, capability_registry_from_payload
 from abraxas.runes.models import RuneDefinition
 
 
@@ -28,11 +29,19 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+def _default_registry_path() -> Path:
+    return _repo_root() / "abraxas" / "runes" / "registry.json"
+
+
 def load_registry(registry_path: str | Path | None = None) -> list[RuneBinding]:
     if registry_path is None:
-        registry_path = _repo_root() / "abraxas" / "runes" / "registry.json"
+        registry_path = _default_registry_path()
     registry_path = Path(registry_path)
     payload = json.loads(registry_path.read_text())
+    return _bindings_from_payload(payload)
+
+
+def _bindings_from_payload(payload: dict[str, Any]) -> list[RuneBinding]:
     bindings: list[RuneBinding] = []
 
     # Load traditional runes
@@ -77,7 +86,90 @@ def load_registry(registry_path: str | Path | None = None) -> list[RuneBinding]:
     return bindings
 
 
+_FileStamp = tuple[str, int, int]
+
+
+def _stamp(path: Path) -> _FileStamp:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (str(path), -1, -1)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _registry_fingerprint(registry_path: Path, payload: dict[str, Any]) -> tuple[_FileStamp, ...]:
+    stamps = [_stamp(registry_path)]
+    for entry in payload.get("runes", []):
+        stamps.append(_stamp(_repo_root() / entry["definition_path"]))
+    return tuple(stamps)
+
+
+@dataclass
+class RegistrySnapshot:
+    """
+    Parsed registry.json plus rune definitions, indexed for O(1) lookups.
+
+    Valid while the mtime/size of registry.json and every definition file
+    match `fingerprint`. `operators` and `validators` are filled lazily by
+    the invocation layer and live exactly as long as the snapshot.
+    """
+
+    registry_path: Path
+    payload: dict[str, Any]
+    fingerprint: tuple[_FileStamp, ...]
+    bindings: list[RuneBinding]
+    by_rune_id: dict[str, RuneBinding]
+    by_capability: dict[str, list[RuneBinding]]
+    capability_registry: CapabilityRegistry
+    operators: dict[str, Callable[..., Any]] = field(default_factory=dict)
+    validators: dict[str, tuple[_FileStamp, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, registry_path: Path) -> "RegistrySnapshot":
+        payload = json.loads(registry_path.read_text())
+        # Stamp before parsing definitions so a concurrent edit invalidates us.
+        fingerprint = _registry_fingerprint(registry_path, payload)
+        bindings = _bindings_from_payload(payload)
+        by_rune_id: dict[str, RuneBinding] = {}
+        by_capability: dict[str, list[RuneBinding]] = {}
+        for binding in bindings:
+            by_rune_id.setdefault(binding.rune_id, binding)
+            by_capability.setdefault(binding.capability, []).append(binding)
+        return cls(
+            registry_path=registry_path,
+            payload=payload,
+            fingerprint=fingerprint,
+            bindings=bindings,
+            by_rune_id=by_rune_id,
+            by_capability=by_capability,
+            capability_registry=capability_registry_from_payload(payload),
+        )
+
+    def is_current(self) -> bool:
+        return _registry_fingerprint(self.registry_path, self.payload) == self.fingerprint
+
+
+_SNAPSHOTS: dict[Path, RegistrySnapshot] = {}
+
+
+def get_registry_snapshot(registry_path: str | Path | None = None) -> RegistrySnapshot:
+    """Process-wide registry snapshot, reloaded when any registry file changes."""
+    path = Path(registry_path) if registry_path is not None else _default_registry_path()
+    snapshot = _SNAPSHOTS.get(path)
+    if snapshot is None or not snapshot.is_current():
+        snapshot = RegistrySnapshot.load(path)
+        _SNAPSHOTS[path] = snapshot
+    return snapshot
+
+
+def invalidate_registry_snapshot() -> None:
+    """Drop cached snapshots (e.g. after registering runes in-process)."""
+    _SNAPSHOTS.clear()
+
+
 def list_capabilities(bindings: Iterable[RuneBinding] | None = None) -> list[str]:
+    if bindings is None:
+        return sorted(get_registry_snapshot().by_capability)
     bindings = list(bindings or load_registry())
     return sorted({binding.capability for binding in bindings})
 
@@ -85,11 +177,18 @@ def list_capabilities(bindings: Iterable[RuneBinding] | None = None) -> list[str
 def list_runes_by_capability(
     capability: str, bindings: Iterable[RuneBinding] | None = None
 ) -> list[RuneBinding]:
+    if bindings is None:
+        return list(get_registry_snapshot().by_capability.get(capability, []))
     bindings = list(bindings or load_registry())
     return [binding for binding in bindings if binding.capability == capability]
 
 
 def describe_rune(rune_id: str, bindings: Iterable[RuneBinding] | None = None) -> RuneBinding:
+    if bindings is None:
+        binding = get_registry_snapshot().by_rune_id.get(rune_id)
+        if binding is None:
+            raise KeyError(f"Unknown rune id: {rune_id}")
+        return binding
     bindings = list(bindings or load_registry())
     for binding in bindings:
         if binding.rune_id == rune_id:
@@ -4,7 +4,7 @@ import hashlib
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional, Set
 
 
 def _stable_json_bytes(obj: Dict[str, Any]) -> bytes:
@@ -30,16 +30,83 @@ class ArtifactRecord:
     kind: str
 
 
+ManifestMode = Literal["rewrite", "journal"]
+
+
+def _manifest_path(root: Path, run_id: str) -> Path:
+    return root / "manifests" / f"{run_id}.manifest.json"
+
+
+def _journal_path(root: Path, run_id: str) -> Path:
+    return root / "manifests" / f"{run_id}.manifest.jsonl"
+
+
+def _sort_manifest_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Deterministic sort: (tick, kind, schema, path); stable for ties.
+    return sorted(
+        records,
+        key=lambda e: (int(e.get("tick", 0)), str(e.get("kind", "")), str(e.get("schema", "")), str(e.get("path", ""))),
+    )
+
+
+def _read_journal(journal_path: Path) -> List[Dict[str, Any]]:
+    if not journal_path.exists():
+        return []
+    records: List[Dict[str, Any]] = []
+    for line in journal_path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            # Torn trailing line from an interrupted append.
+            continue
+    return records
+
+
+def read_manifest(artifacts_dir: str | Path, run_id: str) -> Dict[str, Any]:
+    """
+    Read the Manifest.v0 document for a run, including journaled records
+    that have not been materialized yet.
+    """
+    root = Path(artifacts_dir)
+    manifest_path = _manifest_path(root, run_id)
+    if manifest_path.exists():
+        cur = json.loads(manifest_path.read_text(encoding="utf-8"))
+    else:
+        cur = {"schema": "Manifest.v0", "run_id": run_id, "records": []}
+    pending = _read_journal(_journal_path(root, run_id))
+    if pending:
+        cur["records"] = _sort_manifest_records(list(cur.get("records", [])) + pending)
+    return cur
+
+
 class ArtifactWriter:
     """
     Abraxas-owned artifact writer.
     - Writes deterministic JSON.
     - Computes sha256.
     - Appends to a per-run manifest ledger.
+
+    Manifest modes:
+    - "rewrite" (default): the sorted manifest JSON is rewritten on every artifact.
+    - "journal": records are appended to <run_id>.manifest.jsonl and the sorted
+      Manifest.v0 document is materialized by finalize_manifest()/close().
+      The materialized bytes match what "rewrite" mode would have produced.
     """
 
-    def __init__(self, artifacts_dir: str):
+    def __init__(self, artifacts_dir: str, *, manifest_mode: ManifestMode = "rewrite"):
+        if manifest_mode not in ("rewrite", "journal"):
+            raise ValueError(f"unknown manifest_mode: {manifest_mode}")
         self.root = Path(artifacts_dir)
+        self.manifest_mode = manifest_mode
+        self._journaled_runs: Set[str] = set()
+
+    def __enter__(self) -> "ArtifactWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def write_json(
         self,
@@ -68,25 +135,36 @@ class ArtifactWriter:
             kind=kind,
         )
 
-        self._append_manifest(rec, extra=extra)
+        if self.manifest_mode == "journal":
+            self._append_journal(rec, extra=extra)
+        else:
+            self._append_manifest(rec, extra=extra)
         return rec
 
-    def _append_manifest(self, rec: ArtifactRecord, extra: Optional[Dict[str, Any]] = None) -> None:
+    def finalize_manifest(self, run_id: str) -> Path:
         """
-        Append-only manifest update (deterministic ordering on write).
+        Fold journaled records into the sorted Manifest.v0 document and
+        clear the journal. Safe to call mid-run; later writes journal again.
         """
-        manifest_path = self.root / "manifests" / f"{rec.run_id}.manifest.json"
+        manifest_path = _manifest_path(self.root, run_id)
+        journal_path = _journal_path(self.root, run_id)
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if manifest_path.exists():
-            cur = json.loads(manifest_path.read_text(encoding="utf-8"))
-        else:
-            cur = {
-                "schema": "Manifest.v0",
-                "run_id": rec.run_id,
-                "records": [],
-            }
-
+        cur = read_manifest(self.root, run_id)
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        tmp_path.write_bytes(_stable_json_bytes(cur))
+        tmp_path.replace(manifest_path)
+        if journal_path.exists():
+            journal_path.unlink()
+        self._journaled_runs.discard(run_id)
+        return manifest_path
+
+    def close(self) -> None:
+        """Materialize manifests for every run journaled by this writer."""
+        for run_id in sorted(self._journaled_runs):
+            self.finalize_manifest(run_id)
+
+    def _manifest_entry(self, rec: ArtifactRecord, extra: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         entry: Dict[str, Any] = {
             "tick": rec.tick,
             "kind": rec.kind,
@@ -98,13 +176,36 @@ class ArtifactWriter:
         if extra:
             # ensure stable keys in extra
             entry["extra"] = {k: extra[k] for k in sorted(extra.keys())}
+        return entry
 
-        cur["records"].append(entry)
+    def _append_journal(self, rec: ArtifactRecord, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        O(1) append of one manifest record to the run's JSONL journal.
+        """
+        journal_path = _journal_path(self.root, rec.run_id)
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        line = _stable_json_bytes(self._manifest_entry(rec, extra)) + b"\n"
+        with journal_path.open("ab") as f:
+            f.write(line)
+        self._journaled_runs.add(rec.run_id)
 
-        # Deterministic sort: (tick, kind, schema, path)
-        cur["records"] = sorted(
-            cur["records"],
-            key=lambda e: (int(e.get("tick", 0)), str(e.get("kind", "")), str(e.get("schema", "")), str(e.get("path", ""))),
-        )
+    def _append_manifest(self, rec: ArtifactRecord, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append-only manifest update (deterministic ordering on write).
+        """
+        manifest_path = _manifest_path(self.root, rec.run_id)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if manifest_path.exists():
+            cur = json.loads(manifest_path.read_text(encoding="utf-8"))
+        else:
+            cur = {
+                "schema": "Manifest.v0",
+                "run_id": rec.run_id,
+                "records": [],
+            }
+
+        cur["records"].append(self._manifest_entry(rec, extra))
+        cur["records"] = _sort_manifest_records(cur["records"])
 
         manifest_path.write_bytes(_stable_json_bytes(cur))
@@ -1,12 +1,19 @@
-"""Deterministic parallel executor with serial commit ordering."""
+"""Deterministic parallel executor with serial commit ordering.
+
+execute_parallel() materializes every unit and result. iter_parallel() is the
+streaming variant: it pulls units lazily, admits a unit only while the
+in-flight count and byte caps allow it, and yields results as they finish
+(or, with ordered=True, in submission order through a bounded reorder buffer).
+"""
 
 from __future__ import annotations
 
 import concurrent.futures
+from collections import deque
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 from abraxas.runtime.concurrency import ConcurrencyConfig
 from abraxas.runtime.work_units import WorkUnit
@@ -86,6 +93,134 @@ def execute_parallel(
     )
 
 
+Backend = Literal["thread", "process"]
+
+
+def iter_parallel(
+    work_units: Iterable[WorkUnit],
+    *,
+    config: ConcurrencyConfig,
+    stage: str,
+    handler: Callable[[WorkUnit], WorkResult],
+    max_inflight_units: Optional[int] = None,
+    backend: Backend = "thread",
+    ordered: bool = False,
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[WorkResult]:
+    """Run work units from an iterator, yielding results as they complete.
+
+    A unit is submitted only while fewer than max_inflight_units (default
+    twice the stage's workers) are outstanding and its input_bytes fit under
+    config.max_inflight_bytes; a unit larger than the byte cap runs alone.
+    With ordered=True results come out in submission order and units still
+    waiting in the reorder buffer count as outstanding, so memory stays
+    bounded. Ordered mode requires units in nondecreasing key order, which
+    makes the stream identical to commit_results() over the full result set.
+
+    backend="process" runs the handler in a process pool for CPU-bound stages
+    such as PARSE; the handler and units must then be picklable.
+
+    If stats is given it is filled with submitted/completed counts and the
+    peak in-flight units and bytes.
+    """
+    if backend not in ("thread", "process"):
+        raise ValueError(f"Unknown backend: {backend}")
+    workers = config.workers_for_stage(stage)
+    if not config.enabled:
+        workers = 1
+    unit_cap = max(1, int(max_inflight_units or 2 * workers))
+    byte_cap = max(0, int(config.max_inflight_bytes))
+    counters = stats if stats is not None else {}
+    counters.update(submitted=0, completed=0, max_inflight_units=0, max_inflight_bytes=0)
+
+    last_key: List[Tuple[Any, ...]] = []
+
+    def check_order(unit: WorkUnit) -> None:
+        if not ordered:
+            return
+        if last_key and unit.key < last_key[0]:
+            raise ValueError("ordered=True requires work units in nondecreasing key order")
+        last_key[:] = [unit.key]
+
+    if workers <= 1:
+        for unit in work_units:
+            check_order(unit)
+            counters["submitted"] += 1
+            counters["max_inflight_units"] = 1
+            counters["max_inflight_bytes"] = max(counters["max_inflight_bytes"], unit.input_bytes)
+            result = handler(unit)
+            counters["completed"] += 1
+            yield result
+        return
+
+    if backend == "process":
+        pool: concurrent.futures.Executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+    source = iter(work_units)
+    pending_unit: Optional[WorkUnit] = None
+    exhausted = False
+    running: Dict[concurrent.futures.Future, Tuple[int, int]] = {}
+    reorder: Dict[int, WorkResult] = {}
+    ready: Deque[WorkResult] = deque()
+    next_index = 0
+    next_emit = 0
+    inflight_bytes = 0
+
+    def outstanding() -> int:
+        # Ordered mode also holds finished results until their turn.
+        return next_index - next_emit if ordered else len(running)
+
+    try:
+        while True:
+            # Admit units while both caps allow it.
+            while not exhausted:
+                if pending_unit is None:
+                    try:
+                        pending_unit = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    check_order(pending_unit)
+                size = max(0, int(pending_unit.input_bytes))
+                if outstanding() >= unit_cap:
+                    break
+                if byte_cap and running and inflight_bytes + size > byte_cap:
+                    break
+                future = pool.submit(handler, pending_unit)
+                running[future] = (next_index, size)
+                next_index += 1
+                inflight_bytes += size
+                pending_unit = None
+                counters["submitted"] += 1
+                counters["max_inflight_units"] = max(counters["max_inflight_units"], len(running))
+                counters["max_inflight_bytes"] = max(counters["max_inflight_bytes"], inflight_bytes)
+
+            if not running:
+                break
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                index, size = running.pop(future)
+                inflight_bytes -= size
+                result = future.result()
+                counters["completed"] += 1
+                if ordered:
+                    reorder[index] = result
+                else:
+                    ready.append(result)
+            if ordered:
+                while next_emit in reorder:
+                    ready.append(reorder.pop(next_emit))
+                    next_emit += 1
+            while ready:
+                yield ready.popleft()
+    finally:
+        for future in running:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
 def commit_results(results: Iterable[WorkResult]) -> List[WorkResult]:
     return sorted(results, key=lambda result: result.key)
 
@@ -43,6 +43,8 @@ def abraxas_tick(
     run_compress: Optional[Callable[[Dict[str, Any]], Any]] = None,
     run_overlay: Optional[Callable[[Dict[str, Any]], Any]] = None,
     run_shadow_tasks: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+    # Run admitted shadow detectors concurrently (output is unchanged)
+    shadow_workers: int = 1,
 ) -> Dict[str, Any]:
     """
     Canonical Abraxas tick orchestrator.
@@ -68,6 +70,7 @@ def abraxas_tick(
         run_compress: Legacy param - override compress function (for tests)
         run_overlay: Legacy param - override overlay function (for tests)
         run_shadow_tasks: Legacy param - override shadow tasks (for tests)
+        shadow_workers: Threads for the shadow lane (1 = serial)
 
     Returns:
         Dict with tick results, remaining budgets, and artifact references
@@ -109,7 +112,7 @@ def abraxas_tick(
         actual_shadow = resolved.shadow_tasks
         bindings_provenance = resolved.provenance
 
-    s = DeterministicScheduler()
+    s = DeterministicScheduler(shadow_workers=shadow_workers)
 
     # Forecast lane (primary)
     s.add(bind_callable(name="oracle:signal",   lane="forecast", priority=0, cost_ops=10, fn=actual_signal))
@@ -16,6 +16,13 @@ Schema per entry:
 }
 
 Rule: Write-once, annotate-only. No destructive edits.
+
+Updates are journaled: annotations and recomputed state are appended to
+data/a_almanac/terms.jsonl.journal and replayed on load. The journal is
+folded into terms.jsonl (atomic rewrite) once it grows past the number of
+entries, so the cost of rewriting stays linear in the number of updates.
+Annotation records carry their position in the entry, so replaying a journal
+that was already folded in is a no-op.
 """
 
 from __future__ import annotations
@@ -24,7 +31,7 @@ import json
 import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 from abraxas.core.provenance import Provenance
@@ -64,18 +71,19 @@ class AAlmanacEntry:
             "created_at": self.created_at,
             "lifecycle_state": self.lifecycle_state,
             "tau_snapshot": self.tau_snapshot,
-            "annotations": [
-                {
-                    "timestamp": ann.timestamp,
-                    "type": ann.type,
-                    "data": ann.data,
-                    "provenance": ann.provenance,
-                }
-                for ann in self.annotations
-            ],
+            "annotations": [self.annotation_to_dict(ann) for ann in self.annotations],
             "provenance": self.provenance,
         }
 
+    @staticmethod
+    def annotation_to_dict(ann: Annotation) -> Dict[str, Any]:
+        return {
+            "timestamp": ann.timestamp,
+            "type": ann.type,
+            "data": ann.data,
+            "provenance": ann.provenance,
+        }
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> AAlmanacEntry:
         """Create entry from dict."""
@@ -111,6 +119,8 @@ class AAlmanacStore:
     - create_entry_if_missing(): Write new entry (once)
     - append_annotation(): Add annotation to existing entry
     - compute_current_state(): Recompute lifecycle state from τ
+    - compute_current_states(): Bulk recompute, persisted in one write
+    - compact(): Fold the update journal into the entries file
     """
 
     def __init__(
@@ -118,6 +128,7 @@ class AAlmanacStore:
         storage_path: Optional[str] = None,
         tau_calculator: Optional[TauCalculator] = None,
         lifecycle_engine: Optional[LifecycleEngine] = None,
+        compact_threshold: Optional[int] = None,
     ):
         """
         Initialize store.
@@ -126,26 +137,37 @@ class AAlmanacStore:
             storage_path: Path to JSONL storage file (default: data/a_almanac/terms.jsonl)
             tau_calculator: Optional τ calculator (created if not provided)
             lifecycle_engine: Optional lifecycle engine (created if not provided)
+            compact_threshold: Journal records that trigger compaction
+                (default: max(1024, number of entries))
         """
         self.storage_path = Path(
             storage_path or "data/a_almanac/terms.jsonl"
         ).resolve()
         self.tau_calculator = tau_calculator or TauCalculator()
         self.lifecycle_engine = lifecycle_engine or LifecycleEngine()
+        self.journal_path = self.storage_path.with_name(self.storage_path.name + ".journal")
+        self.compact_threshold = compact_threshold
 
         # Ensure storage directory exists
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # In-memory cache (loaded on demand)
+        # In-memory cache and term -> term_id index (loaded on demand)
         self._cache: Optional[Dict[str, AAlmanacEntry]] = None
+        self._term_index: Dict[str, str] = {}
+        self._journal_records = 0
 
     def load_entries(self) -> List[AAlmanacEntry]:
         """
-        Load all entries from storage.
+        Load all entries from storage, with journaled updates applied.
 
         Returns:
             List of AAlmanacEntry objects
         """
+        entries = self._load_base()
+        self._replay_journal({entry.term_id: entry for entry in entries})
+        return entries
+
+    def _load_base(self) -> List[AAlmanacEntry]:
         if not self.storage_path.exists():
             return []
 
@@ -160,6 +182,41 @@ class AAlmanacStore:
 
         return entries
 
+    def _replay_journal(self, by_id: Dict[str, AAlmanacEntry]) -> int:
+        """Apply journal records to entries in place; returns the record count."""
+        if not self.journal_path.exists():
+            return 0
+        count = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn trailing write
+                count += 1
+                entry = by_id.get(rec.get("term_id"))
+                if entry is None:
+                    continue
+                if rec.get("op") == "annotation":
+                    # Skip records already folded into the entries file.
+                    if len(entry.annotations) == rec.get("n"):
+                        ann = rec["annotation"]
+                        entry.annotations.append(
+                            Annotation(
+                                timestamp=ann["timestamp"],
+                                type=ann["type"],
+                                data=ann["data"],
+                                provenance=ann["provenance"],
+                            )
+                        )
+                elif rec.get("op") == "state":
+                    entry.lifecycle_state = rec["lifecycle_state"]
+                    entry.tau_snapshot = rec["tau_snapshot"]
+        return count
+
     def get_entry(self, term_id: str) -> Optional[AAlmanacEntry]:
         """
         Get entry by term_id.
@@ -184,10 +241,8 @@ class AAlmanacStore:
             AAlmanacEntry or None if not found
         """
         self._ensure_cache()
-        for entry in self._cache.values():
-            if entry.term == term:
-                return entry
-        return None
+        term_id = self._term_index.get(term)
+        return self._cache.get(term_id) if term_id is not None else None
 
     def create_entry_if_missing(
         self,
@@ -233,6 +288,7 @@ class AAlmanacStore:
 
         # Update cache
         self._cache[term_id] = entry
+        self._term_index[term] = term_id
 
         return term_id
 
@@ -269,11 +325,19 @@ class AAlmanacStore:
             provenance=provenance.__dict__,
         )
 
-        # Add to entry
+        # Journal first so the record's position matches the entry
+        self._append_journal(
+            [
+                {
+                    "op": "annotation",
+                    "term_id": term_id,
+                    "n": len(entry.annotations),
+                    "annotation": AAlmanacEntry.annotation_to_dict(annotation),
+                }
+            ]
+        )
         entry.annotations.append(annotation)
-
-        # Rewrite entire file (JSONL: simple append not safe for updates)
-        self._rewrite_storage()
+        self._maybe_compact()
 
         return True
 
@@ -301,6 +365,56 @@ class AAlmanacStore:
         if not entry:
             return None
 
+        result = self._recompute(entry, run_id=run_id, current_time_utc=current_time_utc)
+        self._append_journal([self._state_record(entry)])
+        self._maybe_compact()
+        return result
+
+    def compute_current_states(
+        self,
+        term_ids: Iterable[str],
+        *,
+        run_id: Optional[str] = None,
+        current_time_utc: Optional[str] = None,
+    ) -> Dict[str, Tuple[LifecycleState, TauSnapshot]]:
+        """
+        Recompute lifecycle state and τ snapshot for many terms.
+
+        Updates are persisted with a single journal write at the end.
+
+        Args:
+            term_ids: Term identifiers (unknown ids are skipped)
+            run_id: Optional run identifier
+            current_time_utc: Optional reference time
+
+        Returns:
+            Dict of term_id -> (LifecycleState, TauSnapshot)
+        """
+        self._ensure_cache()
+
+        results: Dict[str, Tuple[LifecycleState, TauSnapshot]] = {}
+        records: List[Dict[str, Any]] = []
+        for term_id in term_ids:
+            entry = self.get_entry(term_id)
+            if not entry or term_id in results:
+                continue
+            results[term_id] = self._recompute(
+                entry, run_id=run_id, current_time_utc=current_time_utc
+            )
+            records.append(self._state_record(entry))
+
+        self._append_journal(records)
+        self._maybe_compact()
+        return results
+
+    def _recompute(
+        self,
+        entry: AAlmanacEntry,
+        *,
+        run_id: Optional[str],
+        current_time_utc: Optional[str],
+    ) -> Tuple[LifecycleState, TauSnapshot]:
+        """Recompute state for one entry in memory."""
         # Extract observations from annotations
         observations = []
         for ann in entry.annotations:
@@ -351,27 +465,64 @@ class AAlmanacStore:
             "provenance": tau_snapshot.provenance.__dict__,
         }
 
-        # Rewrite storage to persist updates
-        self._rewrite_storage()
-
         return (new_state, tau_snapshot)
 
+    @staticmethod
+    def _state_record(entry: AAlmanacEntry) -> Dict[str, Any]:
+        return {
+            "op": "state",
+            "term_id": entry.term_id,
+            "lifecycle_state": entry.lifecycle_state,
+            "tau_snapshot": entry.tau_snapshot,
+        }
+
+    def compact(self) -> None:
+        """Fold the journal into the entries file and truncate it."""
+        self._ensure_cache()
+        self._rewrite_storage()
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self._journal_records = 0
+
     def _ensure_cache(self) -> None:
         """Ensure cache is loaded."""
         if self._cache is None:
-            entries = self.load_entries()
+            entries = self._load_base()
             self._cache = {entry.term_id: entry for entry in entries}
+            self._journal_records = self._replay_journal(self._cache)
+            self._term_index = {}
+            for entry in entries:
+                # First entry wins, matching the previous linear scan.
+                self._term_index.setdefault(entry.term, entry.term_id)
 
     def _append_to_storage(self, entry: AAlmanacEntry) -> None:
         """Append entry to storage file."""
         with open(self.storage_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(entry.to_dict(), ensure_ascii=True) + "\n")
 
+    def _append_journal(self, records: List[Dict[str, Any]]) -> None:
+        """Append update records to the journal in one write."""
+        if not records:
+            return
+        text = "".join(json.dumps(rec, ensure_ascii=True) + "\n" for rec in records)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(text)
+        self._journal_records += len(records)
+
+    def _maybe_compact(self) -> None:
+        threshold = self.compact_threshold
+        if threshold is None:
+            threshold = max(1024, len(self._cache or {}))
+        if self._journal_records > threshold:
+            self.compact()
+
     def _rewrite_storage(self) -> None:
-        """Rewrite entire storage file from cache."""
+        """Rewrite entire storage file from cache (atomic replace)."""
         if self._cache is None:
             return
 
-        with open(self.storage_path, "w", encoding="utf-8") as f:
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             for entry in self._cache.values():
                 f.write(json.dumps(entry.to_dict(), ensure_ascii=True) + "\n")
+        os.replace(tmp_path, self.storage_path)
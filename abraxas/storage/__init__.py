@@ -6,19 +6,35 @@ from __future__ import annotations
 from .cas import CASIndexEntry, CASRef, CASStore
 
 # Performance CAS (function-based)
-from .cas import cas_put_bytes, cas_get_bytes, cas_put_json, cas_get_json, cas_exists
+from .cas import (
+    CASIndexSession,
+    cas_exists,
+    cas_exists_many,
+    cas_get_bytes,
+    cas_get_json,
+    cas_put_bytes,
+    cas_put_json,
+    cas_put_many,
+)
 
 # Hashing utilities
 from .hashes import stable_hash_bytes, stable_hash_json
 
 # Packet codec
-from .packet_codec import encode_packet, decode_packet, write_packet, read_packet
+from .packet_codec import (
+    encode_packet,
+    decode_packet,
+    iter_packet_records,
+    read_packet,
+    write_packet,
+    write_packet_stream,
+)
 
 # Compression
 from .compress import choose_codec, compress_bytes, decompress_bytes
 
 # Deduplication
-from .dedup import shingle_hashes, near_dup_score, dedup_items
+from .dedup import shingle_hashes, near_dup_score, dedup_items, dedup_items_lsh
 
 # Dictionary training
 from .dict_train import train_zstd_dict, should_retrain_dict
@@ -37,6 +53,9 @@ __all__ = [
     "cas_put_json",
     "cas_get_json",
     "cas_exists",
+    "cas_exists_many",
+    "cas_put_many",
+    "CASIndexSession",
     # Hashing
     "stable_hash_bytes",
     "stable_hash_json",
@@ -45,6 +64,8 @@ __all__ = [
     "decode_packet",
     "write_packet",
     "read_packet",
+    "write_packet_stream",
+    "iter_packet_records",
     # Compression
     "choose_codec",
     "compress_bytes",
@@ -53,6 +74,7 @@ __all__ = [
     "shingle_hashes",
     "near_dup_score",
     "dedup_items",
+    "dedup_items_lsh",
     # Dictionary training
     "train_zstd_dict",
     "should_retrain_dict",
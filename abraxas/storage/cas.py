@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
 from abraxas.core.canonical import canonical_json, sha256_hex
+from abraxas.core.jsonl_sidecar import AppendCursor, iter_complete_lines
 from abraxas.storage.hashes import stable_hash_bytes, stable_hash_json
 from abraxas.storage.layout import (
     CASNamespace,
@@ -73,9 +75,18 @@ class CASIndexEntry:
 class CASStore:
     """Class-based CAS for acquisition with URL tracking."""
 
-    def __init__(self, base_dir: str | Path = "data/cas", index_path: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        base_dir: str | Path = "data/cas",
+        index_path: str | Path | None = None,
+        url_index_path: str | Path | None = None,
+    ) -> None:
         self.base_dir = Path(base_dir)
         self.index_path = Path(index_path) if index_path else self.base_dir / "index.jsonl"
+        # SQLite sidecar holding the latest index.jsonl entry per URL.
+        self.url_index_path = (
+            Path(url_index_path) if url_index_path else self.index_path.with_suffix(".urls.sqlite")
+        )
 
     def _path_for_hash(self, content_hash: str, *, subdir: str, suffix: str) -> Path:
         return self.base_dir / subdir / content_hash[:2] / f"{content_hash}{suffix}"
@@ -161,35 +172,129 @@ class CASStore:
         return path.read_bytes()
 
     def lookup_url(self, url: str) -> CASIndexEntry | None:
-        if not self.index_path.exists():
-            return None
-        latest: CASIndexEntry | None = None
-        for line in self.index_path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
+        return self.lookup_urls([url]).get(url)
+
+    def lookup_urls(self, urls: Iterable[str]) -> Dict[str, CASIndexEntry | None]:
+        """Resolve the latest index entry for many URLs in one pass.
+
+        Unknown URLs map to None. The URL sidecar is caught up with
+        index.jsonl before querying, so results always match a full scan.
+        """
+        wanted = sorted(set(urls))
+        resolved: Dict[str, CASIndexEntry | None] = {url: None for url in wanted}
+        if not wanted or not self.index_path.exists():
+            return resolved
+        with _URL_INDEX_LOCK:
+            conn = self._connect_url_index()
             try:
-                payload = json.loads(line)
-            except ValueError:
-                continue
-            if payload.get("url") != url:
-                continue
-            latest = CASIndexEntry(
-                url=payload.get("url", url),
-                content_hash=payload.get("content_hash", ""),
-                path=payload.get("path", ""),
-                subdir=payload.get("subdir", "raw"),
-                suffix=payload.get("suffix", ".bin"),
-                recorded_at_utc=payload.get("recorded_at_utc"),
-                meta=payload.get("meta") or {},
-            )
-        return latest
+                self._sync_url_index(conn)
+                for offset in range(0, len(wanted), _URL_LOOKUP_CHUNK):
+                    chunk = wanted[offset : offset + _URL_LOOKUP_CHUNK]
+                    placeholders = ",".join("?" for _ in chunk)
+                    rows = conn.execute(
+                        f"SELECT url, payload FROM url_latest WHERE url IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    for url, payload in rows:
+                        resolved[url] = _entry_from_payload(json.loads(payload), url)
+            finally:
+                conn.close()
+        return resolved
+
+    def rebuild_url_index(self) -> int:
+        """Rebuild the URL sidecar from index.jsonl; returns indexed URL count."""
+        with _URL_INDEX_LOCK:
+            conn = self._connect_url_index()
+            try:
+                conn.execute("DELETE FROM url_latest")
+                conn.execute("DELETE FROM url_index_meta")
+                conn.commit()
+                self._sync_url_index(conn)
+                return int(conn.execute("SELECT COUNT(*) FROM url_latest").fetchone()[0])
+            finally:
+                conn.close()
 
     def _append_index(self, entry: CASIndexEntry) -> None:
+        # The URL sidecar is caught up lazily by lookup_urls().
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
         payload = canonical_json(entry.to_dict())
         with self.index_path.open("a", encoding="utf-8") as f:
             f.write(payload + "\n")
 
+    def _connect_url_index(self) -> sqlite3.Connection:
+        self.url_index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.url_index_path))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_latest (url TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        return conn
+
+    def _sync_url_index(self, conn: sqlite3.Connection) -> None:
+        """Fold index.jsonl lines appended since the last sync into the sidecar.
+
+        index.jsonl is append-only, so the sidecar only tracks the byte offset
+        it has consumed plus head/tail fingerprints of that prefix. A shorter
+        file or a changed fingerprint means it was rewritten, which triggers
+        a full rebuild.
+        """
+        cursor = AppendCursor(self.index_path)
+        row = conn.execute("SELECT value FROM url_index_meta WHERE key = 'cursor'").fetchone()
+        if row:
+            cursor.restore(json.loads(row[0]))
+        size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        rebuilt = not cursor.is_current(size)
+        if rebuilt:
+            conn.execute("DELETE FROM url_latest")
+            cursor.reset()
+        if size == cursor.indexed_bytes and not rebuilt:
+            return
+        # A partially written trailing line is left for the next sync.
+        end = cursor.indexed_bytes
+        latest: Dict[str, str] = {}
+        for start, raw in iter_complete_lines(self.index_path, cursor.indexed_bytes, size):
+            end = start + len(raw)
+            raw = raw.rstrip(b"\r\n")
+            if not raw.strip():
+                continue
+            try:
+                payload = json.loads(raw)
+            except ValueError:
+                continue
+            url = payload.get("url") if isinstance(payload, dict) else None
+            if not isinstance(url, str):
+                continue
+            latest[url] = raw.decode("utf-8")
+        conn.executemany(
+            "INSERT OR REPLACE INTO url_latest (url, payload) VALUES (?, ?)",
+            sorted(latest.items()),
+        )
+        if end != cursor.indexed_bytes:
+            cursor.advance(end)
+        conn.execute(
+            "INSERT OR REPLACE INTO url_index_meta (key, value) VALUES ('cursor', ?)",
+            (json.dumps(cursor.to_dict(), sort_keys=True),),
+        )
+        conn.commit()
+
+
+_URL_INDEX_LOCK = threading.RLock()
+_URL_LOOKUP_CHUNK = 500
+
+
+def _entry_from_payload(payload: Dict[str, Any], url: str) -> CASIndexEntry:
+    return CASIndexEntry(
+        url=payload.get("url", url),
+        content_hash=payload.get("content_hash", ""),
+        path=payload.get("path", ""),
+        subdir=payload.get("subdir", "raw"),
+        suffix=payload.get("suffix", ".bin"),
+        recorded_at_utc=payload.get("recorded_at_utc"),
+        meta=payload.get("meta") or {},
+    )
+
 
 # ============================================================================
 # Performance CAS (Function-based, SQLite index, temporal partitioning)
@@ -204,79 +309,162 @@ def _get_index_path() -> Path:
     return get_cas_root() / "index" / "cas_index.db"
 
 
-def _init_index() -> None:
-    """Initialize CAS index database."""
-    index_path = _get_index_path()
-    ensure_cas_dirs(index_path)
-
-    conn = sqlite3.connect(str(index_path))
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS cas_entries (
-            hash TEXT PRIMARY KEY,
-            namespace TEXT NOT NULL,
-            source_id TEXT NOT NULL,
-            year INTEGER,
-            month INTEGER,
-            ext TEXT,
-            created_at_utc TEXT NOT NULL,
-            size_bytes INTEGER,
-            metadata TEXT
-        )
-    """)
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_source_id ON cas_entries(source_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_namespace ON cas_entries(namespace)")
-    conn.commit()
-    conn.close()
+_CAS_INDEX_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cas_entries (
+        hash TEXT PRIMARY KEY,
+        namespace TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        year INTEGER,
+        month INTEGER,
+        ext TEXT,
+        created_at_utc TEXT NOT NULL,
+        size_bytes INTEGER,
+        metadata TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_source_id ON cas_entries(source_id);
+    CREATE INDEX IF NOT EXISTS idx_namespace ON cas_entries(namespace);
+"""
 
+_CAS_INSERT_SQL = """
+    INSERT OR REPLACE INTO cas_entries
+    (hash, namespace, source_id, year, month, ext, created_at_utc, size_bytes, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-def _add_to_index(
-    file_hash: str,
-    namespace: CASNamespace,
-    source_id: str,
-    year: int | None,
-    month: int | None,
-    ext: str,
-    size_bytes: int,
-    metadata: dict[str, Any],
-) -> None:
-    """Add entry to CAS index."""
+_CAS_LOCATION_SQL = "SELECT namespace, source_id, year, month, ext FROM cas_entries WHERE hash = ?"
+
+CASIndexRow = Tuple[str, str, str, Optional[int], Optional[int], str, str, int, str]
+
+
+class CASIndexSession:
+    """Persistent WAL-mode connection to the CAS index.
+
+    The schema is created once per connection, statements are reused through
+    sqlite3's statement cache, and bulk inserts commit every ``batch_size``
+    rows instead of once per blob. Access is serialized with a lock so one
+    session can be shared by executor threads.
+    """
+
+    def __init__(self, index_path: Path, *, batch_size: int = 512) -> None:
+        self.index_path = Path(index_path)
+        self.batch_size = max(1, int(batch_size))
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> "CASIndexSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _connection(self, *, create: bool) -> sqlite3.Connection | None:
+        if self._conn is not None and not self.index_path.exists():
+            # Index removed underneath us; drop the stale handle.
+            self._conn.close()
+            self._conn = None
+        if self._conn is None:
+            if not create and not self.index_path.exists():
+                return None
+            ensure_cas_dirs(self.index_path)
+            conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_CAS_INDEX_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def add(self, row: CASIndexRow) -> None:
+        """Insert one entry and commit it."""
+        self.add_many([row])
+
+    def add_many(self, rows: Iterable[CASIndexRow]) -> int:
+        """Insert entries, committing every ``batch_size`` rows."""
+        count = 0
+        with self._lock:
+            conn = self._connection(create=True)
+            assert conn is not None
+            batch: List[CASIndexRow] = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    conn.executemany(_CAS_INSERT_SQL, batch)
+                    conn.commit()
+                    count += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(_CAS_INSERT_SQL, batch)
+                conn.commit()
+                count += len(batch)
+        return count
+
+    def location(self, file_hash: str) -> Tuple[str, str, Optional[int], Optional[int], str] | None:
+        """Return (namespace, source_id, year, month, ext) for a hash."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return None
+            return conn.execute(_CAS_LOCATION_SQL, (file_hash,)).fetchone()
+
+    def exists_many(self, file_hashes: Iterable[str]) -> Dict[str, bool]:
+        """Check many hashes with chunked IN queries."""
+        wanted = sorted(set(file_hashes))
+        found: Dict[str, bool] = {file_hash: False for file_hash in wanted}
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return found
+            for offset in range(0, len(wanted), _CAS_QUERY_CHUNK):
+                chunk = wanted[offset : offset + _CAS_QUERY_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT hash FROM cas_entries WHERE hash IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for (file_hash,) in rows:
+                    found[file_hash] = True
+        return found
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_CAS_QUERY_CHUNK = 500
+_CAS_SESSIONS: Dict[Path, CASIndexSession] = {}
+_CAS_SESSIONS_LOCK = threading.Lock()
+
+
+def get_cas_index_session() -> CASIndexSession:
+    """Return the process-wide session for the current CAS index path."""
     index_path = _get_index_path()
-    conn = sqlite3.connect(str(index_path))
+    with _CAS_SESSIONS_LOCK:
+        session = _CAS_SESSIONS.get(index_path)
+        if session is None:
+            session = CASIndexSession(index_path)
+            _CAS_SESSIONS[index_path] = session
+        return session
 
-    created_at_utc = metadata.get("created_at_utc") or datetime.now(timezone.utc).isoformat()
 
-    conn.execute(
-        """
-        INSERT OR REPLACE INTO cas_entries
-        (hash, namespace, source_id, year, month, ext, created_at_utc, size_bytes, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            file_hash,
-            namespace,
-            source_id,
-            year,
-            month,
-            ext,
-            created_at_utc,
-            size_bytes,
-            json.dumps(metadata),
-        ),
-    )
-    conn.commit()
-    conn.close()
+def close_cas_index_sessions() -> None:
+    """Close every pooled CAS index connection."""
+    with _CAS_SESSIONS_LOCK:
+        sessions = list(_CAS_SESSIONS.values())
+        _CAS_SESSIONS.clear()
+    for session in sessions:
+        session.close()
 
 
-def cas_put_bytes(
+def _write_blob(
     namespace: CASNamespace,
     raw_bytes: bytes,
     source_id: str,
-    *,
-    meta: dict[str, Any] | None = None,
-    timestamp_utc: str | None = None,
-) -> Path:
-    """Store raw bytes in CAS with temporal partitioning."""
-    meta = meta or {}
+    meta: dict[str, Any],
+    timestamp_utc: str | None,
+) -> Tuple[Path, CASIndexRow]:
+    """Write a blob to its partitioned path and build its index row."""
     file_hash = stable_hash_bytes(raw_bytes)
 
     year, month = None, None
@@ -289,35 +477,61 @@ def cas_put_bytes(
     with open(path, "wb") as f:
         f.write(raw_bytes)
 
-    _init_index()
-    _add_to_index(
-        file_hash=file_hash,
-        namespace=namespace,
-        source_id=source_id,
-        year=year,
-        month=month,
-        ext="bin",
-        size_bytes=len(raw_bytes),
-        metadata=meta,
+    created_at_utc = meta.get("created_at_utc") or datetime.now(timezone.utc).isoformat()
+    row: CASIndexRow = (
+        file_hash,
+        namespace,
+        source_id,
+        year,
+        month,
+        "bin",
+        created_at_utc,
+        len(raw_bytes),
+        json.dumps(meta),
     )
+    return path, row
 
+
+def cas_put_bytes(
+    namespace: CASNamespace,
+    raw_bytes: bytes,
+    source_id: str,
+    *,
+    meta: dict[str, Any] | None = None,
+    timestamp_utc: str | None = None,
+) -> Path:
+    """Store raw bytes in CAS with temporal partitioning."""
+    path, row = _write_blob(namespace, raw_bytes, source_id, meta or {}, timestamp_utc)
+    get_cas_index_session().add(row)
     return path
 
 
-def cas_get_bytes(file_hash: str) -> bytes | None:
-    """Retrieve bytes from CAS by hash."""
-    index_path = _get_index_path()
-    if not index_path.exists():
-        return None
+def cas_put_many(
+    namespace: CASNamespace,
+    blobs: Iterable[bytes],
+    source_id: str,
+    *,
+    meta: dict[str, Any] | None = None,
+    timestamp_utc: str | None = None,
+) -> List[Path]:
+    """Store many blobs, committing index rows in batches.
 
-    conn = sqlite3.connect(str(index_path))
-    cursor = conn.execute(
-        "SELECT namespace, source_id, year, month, ext FROM cas_entries WHERE hash = ?",
-        (file_hash,),
-    )
-    row = cursor.fetchone()
-    conn.close()
+    Returns paths in input order.
+    """
+    meta = meta or {}
+    paths: List[Path] = []
+    rows: List[CASIndexRow] = []
+    for raw_bytes in blobs:
+        path, row = _write_blob(namespace, raw_bytes, source_id, meta, timestamp_utc)
+        paths.append(path)
+        rows.append(row)
+    get_cas_index_session().add_many(rows)
+    return paths
 
+
+def cas_get_bytes(file_hash: str) -> bytes | None:
+    """Retrieve bytes from CAS by hash."""
+    row = get_cas_index_session().location(file_hash)
     if not row:
         return None
 
@@ -354,13 +568,9 @@ def cas_get_json(file_hash: str) -> dict[str, Any] | None:
 
 def cas_exists(file_hash: str) -> bool:
     """Check if hash exists in CAS."""
-    index_path = _get_index_path()
-    if not index_path.exists():
-        return False
+    return get_cas_index_session().location(file_hash) is not None
 
-    conn = sqlite3.connect(str(index_path))
-    cursor = conn.execute("SELECT 1 FROM cas_entries WHERE hash = ? LIMIT 1", (file_hash,))
-    exists = cursor.fetchone() is not None
-    conn.close()
 
-    return exists
+def cas_exists_many(file_hashes: Iterable[str]) -> Dict[str, bool]:
+    """Check many hashes against the CAS index in one session."""
+    return get_cas_index_session().exists_many(file_hashes)
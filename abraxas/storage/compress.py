@@ -2,30 +2,137 @@
 
 Performance Drop v1.0 - Intelligent compression codec selection.
 Performance Tuning Plane v0.1 - Reads ACTIVE tuning IR for per-source settings.
+
+Selection cost stays flat for multi-MB payloads: the ACTIVE tuning IR is
+cached and re-read only when its pointer or manifest changes on disk,
+repetition is estimated from a fixed-size sample, and zstd dictionaries and
+compressors are reused per (level, dict_path) instead of being rebuilt for
+every blob.
 """
 
 from __future__ import annotations
 
 import gzip
+import json
+import os
+import threading
 import zlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Dict, Literal, Optional, Tuple
 
-from abraxas.storage.entropy import estimate_entropy, estimate_repetition
+from abraxas.storage.entropy import DEFAULT_SAMPLE_BYTES, estimate_entropy, estimate_repetition
 
 
 Codec = Literal["zstd", "gzip", "lz4", "none"]
 
 # Import tuning IR loader (optional - graceful degradation)
 try:
-    from abraxas.tuning.perf_ir import load_active_tuning_ir
+    from abraxas.tuning.perf_ir import get_active_ir_path, get_tuning_manifest_dir, load_active_tuning_ir
     TUNING_AVAILABLE = True
 except ImportError:
     TUNING_AVAILABLE = False
     load_active_tuning_ir = None
 
 
+def _file_stamp(path: Path | None) -> Optional[Tuple[int, int]]:
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# "entry" -> last loaded IR with the pointer/manifest stamps it was read at
+_TUNING_CACHE: Dict[str, Any] = {}
+
+
+def _active_tuning_ir() -> Any:
+    """ACTIVE tuning IR, reloaded only when the pointer or manifest changes."""
+    if not (TUNING_AVAILABLE and load_active_tuning_ir):
+        return None
+    active_path = get_active_ir_path()
+    pointer_stamp = _file_stamp(active_path)
+    if pointer_stamp is None:
+        return None
+    manifest_dir = get_tuning_manifest_dir()
+    cached = _TUNING_CACHE.get("entry")
+    if (
+        cached is not None
+        and cached["active_path"] == active_path
+        and cached["pointer_stamp"] == pointer_stamp
+        and _file_stamp(cached["manifest_path"]) == cached["manifest_stamp"]
+    ):
+        return cached["ir"]
+
+    ir = load_active_tuning_ir()
+    manifest_path = _active_manifest_path(active_path, manifest_dir)
+    _TUNING_CACHE["entry"] = {
+        "active_path": active_path,
+        "pointer_stamp": pointer_stamp,
+        "manifest_path": manifest_path,
+        "manifest_stamp": _file_stamp(manifest_path),
+        "ir": ir,
+    }
+    return ir
+
+
+def _active_manifest_path(active_path: Path, manifest_dir: Path) -> Optional[Path]:
+    try:
+        with open(active_path, "r") as f:
+            manifest_path = Path(json.load(f)["manifest_path"])
+    except Exception:
+        return None
+    return manifest_path if manifest_path.is_absolute() else manifest_dir / manifest_path
+
+
+# (dict_path, stamp) -> ZstdCompressionDict; compressors are per thread since
+# a ZstdCompressor must not be used by two threads at once.
+_ZSTD_DICTS: Dict[Tuple[str, Tuple[int, int] | None], Any] = {}
+_ZSTD_LOCAL = threading.local()
+# Bumped by clear_codec_caches(); a thread whose compressors were built in an
+# older generation discards them, since thread-locals cannot be cleared remotely.
+_ZSTD_GENERATION = 0
+
+
+def _zstd_dict(zstd: Any, dict_path: Path) -> Tuple[Any, Tuple[str, Any]]:
+    key = (str(dict_path), _file_stamp(dict_path))
+    dict_data = _ZSTD_DICTS.get(key)
+    if dict_data is None:
+        with open(dict_path, "rb") as f:
+            dict_data = zstd.ZstdCompressionDict(f.read())
+        _ZSTD_DICTS[key] = dict_data
+    return dict_data, key
+
+
+def _zstd_compressor(zstd: Any, level: int, dict_path: Path | None) -> Any:
+    """Reusable ZstdCompressor for this thread, keyed by level and dictionary."""
+    dict_data, dict_key = _zstd_dict(zstd, dict_path) if dict_path else (None, None)
+    compressors = getattr(_ZSTD_LOCAL, "compressors", None)
+    if compressors is None or getattr(_ZSTD_LOCAL, "generation", None) != _ZSTD_GENERATION:
+        compressors = _ZSTD_LOCAL.compressors = {}
+        _ZSTD_LOCAL.generation = _ZSTD_GENERATION
+    key = (level, dict_key)
+    compressor = compressors.get(key)
+    if compressor is None:
+        if dict_data is not None:
+            compressor = zstd.ZstdCompressor(level=level, dict_data=dict_data)
+        else:
+            compressor = zstd.ZstdCompressor(level=level)
+        compressors[key] = compressor
+    return compressor
+
+
+def clear_codec_caches() -> None:
+    """Drop cached tuning IR, zstd dictionaries and compressors (in every thread)."""
+    global _ZSTD_GENERATION
+    _TUNING_CACHE.clear()
+    _ZSTD_DICTS.clear()
+    _ZSTD_GENERATION += 1
+
+
 @dataclass(frozen=True)
 class CompressionChoice:
     """Compression codec choice with metadata."""
@@ -42,6 +149,7 @@ def choose_codec(
     source_id: str | None = None,
     dict_path: Path | None = None,
     force_codec: Codec | None = None,
+    sample_bytes: int | None = DEFAULT_SAMPLE_BYTES,
 ) -> CompressionChoice:
     """Choose optimal compression codec based on content characteristics.
 
@@ -52,17 +160,17 @@ def choose_codec(
         source_id: Optional source identifier for source-specific tuning
         dict_path: Optional zstd dictionary path
         force_codec: Force a specific codec (bypasses heuristics)
+        sample_bytes: Repetition sample budget (None scans the whole blob)
 
     Returns:
         CompressionChoice with codec, level, and reasoning
     """
     # Load tuning IR if available
     tuning_ir = None
-    if TUNING_AVAILABLE and load_active_tuning_ir:
-        try:
-            tuning_ir = load_active_tuning_ir()
-        except Exception:
-            pass  # Graceful degradation if tuning not configured
+    try:
+        tuning_ir = _active_tuning_ir()
+    except Exception:
+        pass  # Graceful degradation if tuning not configured
 
     if force_codec:
         return CompressionChoice(
@@ -84,16 +192,15 @@ def choose_codec(
                 codec="none", level=0, dict_path=None, reason="already_zip"
             )
 
-    # Estimate entropy and repetition
-    entropy = estimate_entropy(raw_bytes)
-    repetition = estimate_repetition(raw_bytes)
-
     # High entropy = already compressed or random
+    entropy = estimate_entropy(raw_bytes)
     if entropy > 7.5:
         return CompressionChoice(
             codec="none", level=0, dict_path=None, reason=f"high_entropy:{entropy:.2f}"
         )
 
+    repetition = estimate_repetition(raw_bytes, sample_bytes=sample_bytes)
+
     # High repetition = good zstd candidate
     if repetition > 0.3 and dict_path and dict_path.exists():
         # Use tuning IR level if available
@@ -139,14 +246,7 @@ def compress_bytes(raw_bytes: bytes, choice: CompressionChoice) -> bytes:
             # Fallback to gzip if zstd not available
             return gzip.compress(raw_bytes, compresslevel=choice.level)
 
-        if choice.dict_path:
-            with open(choice.dict_path, "rb") as f:
-                dict_data = zstd.ZstdCompressionDict(f.read())
-            compressor = zstd.ZstdCompressor(level=choice.level, dict_data=dict_data)
-        else:
-            compressor = zstd.ZstdCompressor(level=choice.level)
-
-        return compressor.compress(raw_bytes)
+        return _zstd_compressor(zstd, choice.level, choice.dict_path).compress(raw_bytes)
 
     if choice.codec == "lz4":
         # LZ4 for hot path (not implemented yet - fallback to gzip)
@@ -6,11 +6,15 @@ Performance Drop v1.0 - Deterministic near-duplicate detection.
 from __future__ import annotations
 
 import hashlib
-from typing import Any, TypeVar
+from typing import Any, Callable, TypeVar
 
 
 T = TypeVar("T")
 
+# Mersenne prime modulus for the MinHash family h(x) = (a*x + b) mod p.
+# Kept at 31 bits so a*x + b fits in uint64 on the NumPy path.
+_MINHASH_PRIME = (1 << 31) - 1
+
 
 def shingle_hashes(text: str, k: int = 5) -> set[int]:
     """Compute k-shingle hashes for text.
@@ -24,16 +28,20 @@ def shingle_hashes(text: str, k: int = 5) -> set[int]:
     """
     if len(text) < k:
         # For very short text, just hash the whole thing
-        return {hash(text)}
+        return {_shingle_hash(text)}
+
+    # Hash each distinct shingle once with a 64-bit deterministic digest
+    shingles = {text[i : i + k] for i in range(len(text) - k + 1)}
+    return {_shingle_hash(shingle) for shingle in shingles}
+
 
-    shingles = set()
-    for i in range(len(text) - k + 1):
-        shingle = text[i : i + k]
-        # Use deterministic hash
-        shingle_hash = int(hashlib.sha256(shingle.encode("utf-8")).hexdigest()[:16], 16)
-        shingles.add(shingle_hash)
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
 
-    return shingles
+
+def _jaccard(a: set[int], b: set[int]) -> float:
+    union = len(a | b)
+    return len(a & b) / union if union > 0 else 0.0
 
 
 def near_dup_score(text_a: str, text_b: str, k: int = 5) -> float:
@@ -92,9 +100,7 @@ def dedup_items(
         # Check against kept items
         is_dup = False
         for kept_idx, kept_shingle_set in enumerate(kept_shingles):
-            intersection = len(shingles & kept_shingle_set)
-            union = len(shingles | kept_shingle_set)
-            similarity = intersection / union if union > 0 else 0.0
+            similarity = _jaccard(shingles, kept_shingle_set)
 
             if similarity >= threshold:
                 # Mark as duplicate
@@ -108,3 +114,158 @@ def dedup_items(
             kept_shingles.append(shingles)
 
     return kept, dropped_refs
+
+
+def minhash_permutations(num_perm: int = 128, *, seed: int = 0) -> list[tuple[int, int]]:
+    """Derive a deterministic (a, b) hash family for MinHash.
+
+    Args:
+        num_perm: Number of hash functions
+        seed: Family seed
+
+    Returns:
+        List of (a, b) coefficients for h(x) = (a*x + b) mod p
+    """
+    perms: list[tuple[int, int]] = []
+    for i in range(num_perm):
+        digest = hashlib.sha256(f"abraxas.minhash:{seed}:{i}".encode("utf-8")).digest()
+        a = int.from_bytes(digest[:8], "big") % (_MINHASH_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:16], "big") % _MINHASH_PRIME
+        perms.append((a, b))
+    return perms
+
+
+def minhash_signature(shingles: set[int], perms: list[tuple[int, int]]) -> tuple[int, ...]:
+    """Compute the MinHash signature of a shingle set.
+
+    Uses NumPy when available; the pure-Python fallback yields identical values.
+
+    Args:
+        shingles: Shingle hashes from shingle_hashes()
+        perms: Hash family from minhash_permutations()
+
+    Returns:
+        Signature tuple (one minimum per hash function)
+    """
+    values = sorted(x % _MINHASH_PRIME for x in shingles)
+    try:
+        import numpy as np
+    except ImportError:
+        return tuple(min((a * x + b) % _MINHASH_PRIME for x in values) for a, b in perms)
+
+    xs = np.asarray(values, dtype=np.uint64)
+    a = np.asarray([p[0] for p in perms], dtype=np.uint64)[:, None]
+    b = np.asarray([p[1] for p in perms], dtype=np.uint64)[:, None]
+    mins = ((a * xs[None, :] + b) % np.uint64(_MINHASH_PRIME)).min(axis=1)
+    return tuple(int(v) for v in mins)
+
+
+def lsh_bands(num_perm: int, threshold: float) -> int:
+    """Pick the LSH band count for a similarity threshold.
+
+    Chooses the most selective (fewest bands) split of num_perm whose
+    probability of missing a pair at exactly `threshold` is at most 0.1%.
+
+    Args:
+        num_perm: Signature length
+        threshold: Jaccard threshold
+
+    Returns:
+        Number of bands (divides num_perm)
+    """
+    best = num_perm
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        miss = (1.0 - threshold**rows) ** bands
+        if miss <= 1e-3:
+            best = bands
+            break
+    return best
+
+
+def dedup_items_lsh(
+    items: list[T],
+    text_extractor: Callable[[T], str],
+    *,
+    threshold: float = 0.9,
+    k: int = 5,
+    num_perm: int = 128,
+    bands: int | None = None,
+    verify: bool = True,
+    seed: int = 0,
+) -> tuple[list[T], dict[int, int]]:
+    """Deduplicate items with MinHash signatures and LSH banding.
+
+    Same contract as dedup_items(): items are scanned in order and each one is
+    dropped against the first kept item with similarity >= threshold. Only
+    kept items sharing at least one LSH band bucket are compared, so runtime
+    is near-linear in the number of items.
+
+    With verify=True, candidates are confirmed by exact shingle Jaccard, so
+    every drop is one dedup_items() would also make; a pair LSH never
+    surfaces (probability <= 0.1% at the threshold) is kept. With
+    verify=False, the signature agreement estimate is used instead.
+
+    Args:
+        items: List of items to deduplicate
+        text_extractor: Function to extract text from item
+        threshold: Similarity threshold for deduplication (default: 0.9)
+        k: Shingle size (default: 5)
+        num_perm: MinHash signature length (default: 128)
+        bands: LSH band count (must divide num_perm; default: from threshold)
+        verify: Confirm candidates with exact Jaccard (default: True)
+        seed: Hash family seed
+
+    Returns:
+        Tuple of (kept_items, dropped_refs)
+        dropped_refs maps dropped item index -> kept item index
+    """
+    if not items:
+        return [], {}
+
+    bands = bands or lsh_bands(num_perm, threshold)
+    if num_perm % bands:
+        raise ValueError(f"bands={bands} must divide num_perm={num_perm}")
+    rows = num_perm // bands
+    perms = minhash_permutations(num_perm, seed=seed)
+
+    kept: list[T] = []
+    kept_shingles: list[set[int]] = []
+    kept_signatures: list[tuple[int, ...]] = []
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    dropped_refs: dict[int, int] = {}
+
+    for idx, item in enumerate(items):
+        shingles = shingle_hashes(text_extractor(item), k=k)
+        signature = minhash_signature(shingles, perms)
+        keys = [(band, signature[band * rows : (band + 1) * rows]) for band in range(bands)]
+
+        candidates: set[int] = set()
+        for key in keys:
+            candidates.update(buckets.get(key, ()))
+
+        match: int | None = None
+        for kept_idx in sorted(candidates):
+            if verify:
+                similarity = _jaccard(shingles, kept_shingles[kept_idx])
+            else:
+                other = kept_signatures[kept_idx]
+                similarity = sum(1 for x, y in zip(signature, other) if x == y) / num_perm
+            if similarity >= threshold:
+                match = kept_idx
+                break
+
+        if match is not None:
+            dropped_refs[idx] = match
+            continue
+
+        kept_idx = len(kept)
+        kept.append(item)
+        kept_shingles.append(shingles if verify else set())
+        kept_signatures.append(signature)
+        for key in keys:
+            buckets.setdefault(key, []).append(kept_idx)
+
+    return kept, dropped_refs
@@ -1,12 +1,31 @@
 """Entropy estimation for compression codec selection.
 
 Performance Drop v1.0 - Lightweight entropy heuristics.
+
+Both estimators run on large blobs: the histogram uses NumPy when available,
+and repetition can be estimated from a fixed-size deterministic sample
+(evenly spaced segments) so its cost does not grow with the payload.
 """
 
 from __future__ import annotations
 
 import collections
 import math
+from typing import List
+
+# Default budget for sampled repetition estimates.
+DEFAULT_SAMPLE_BYTES = 64 * 1024
+DEFAULT_SAMPLE_SEGMENTS = 16
+
+
+def _byte_counts(raw_bytes: bytes) -> List[int]:
+    """Histogram of byte values, indexed by byte."""
+    try:
+        import numpy as np
+    except ImportError:
+        counts = collections.Counter(raw_bytes)
+        return [counts.get(b, 0) for b in range(256)]
+    return np.bincount(np.frombuffer(raw_bytes, dtype=np.uint8), minlength=256).tolist()
 
 
 def estimate_entropy(raw_bytes: bytes) -> float:
@@ -23,24 +42,54 @@ def estimate_entropy(raw_bytes: bytes) -> float:
     if not raw_bytes:
         return 0.0
 
-    counts = collections.Counter(raw_bytes)
     total = len(raw_bytes)
 
+    # Summed in byte order so the NumPy and fallback paths agree exactly.
     entropy = 0.0
-    for count in counts.values():
-        p = count / total
-        if p > 0:
+    for count in _byte_counts(raw_bytes):
+        if count:
+            p = count / total
             entropy -= p * math.log2(p)
 
     return entropy
 
 
-def estimate_repetition(raw_bytes: bytes, window_size: int = 64) -> float:
+def sample_segments(
+    raw_bytes: bytes,
+    sample_bytes: int = DEFAULT_SAMPLE_BYTES,
+    segments: int = DEFAULT_SAMPLE_SEGMENTS,
+) -> List[bytes]:
+    """Split a blob into evenly spaced segments totalling about sample_bytes.
+
+    Returns the whole blob as one segment when it already fits the budget.
+    The first and last segments are anchored at the blob's start and end.
+    """
+    n = len(raw_bytes)
+    if n <= sample_bytes:
+        return [raw_bytes]
+    segments = max(1, min(segments, sample_bytes))
+    seg_len = sample_bytes // segments
+    if segments == 1:
+        return [raw_bytes[:seg_len]]
+    stride = (n - seg_len) / (segments - 1)
+    starts = [int(round(k * stride)) for k in range(segments)]
+    return [raw_bytes[s : s + seg_len] for s in starts]
+
+
+def estimate_repetition(
+    raw_bytes: bytes,
+    window_size: int = 64,
+    *,
+    sample_bytes: int | None = None,
+) -> float:
     """Estimate repetition rate using sliding window.
 
     Args:
         raw_bytes: Raw byte content
         window_size: Sliding window size (default: 64)
+        sample_bytes: If set, scan only a deterministic sample of about this
+            many bytes (see sample_segments); windows seen in one segment
+            count as repeats in later ones
 
     Returns:
         Repetition score (0.0 = no repetition, 1.0 = high repetition)
@@ -48,16 +97,25 @@ def estimate_repetition(raw_bytes: bytes, window_size: int = 64) -> float:
     if len(raw_bytes) < window_size * 2:
         return 0.0
 
+    if sample_bytes is None:
+        parts = [raw_bytes]
+    else:
+        budget = max(sample_bytes, window_size * 2)
+        # Keep every segment at least two windows long.
+        segments = max(1, min(DEFAULT_SAMPLE_SEGMENTS, budget // (window_size * 2)))
+        parts = sample_segments(raw_bytes, budget, segments)
+
     seen_windows: set[bytes] = set()
     repeats = 0
     total_windows = 0
 
-    for i in range(len(raw_bytes) - window_size + 1):
-        window = raw_bytes[i : i + window_size]
-        if window in seen_windows:
-            repeats += 1
-        else:
-            seen_windows.add(window)
-        total_windows += 1
+    for part in parts:
+        for i in range(len(part) - window_size + 1):
+            window = part[i : i + window_size]
+            if window in seen_windows:
+                repeats += 1
+            else:
+                seen_windows.add(window)
+            total_windows += 1
 
     return repeats / total_windows if total_windows > 0 else 0.0
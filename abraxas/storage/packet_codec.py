@@ -1,13 +1,24 @@
 """Packet serialization optimization with CBOR/MsgPack + Zstd.
 
 Performance Drop v1.0 - Deterministic packet encoding.
+
+Large archive packets can also be written as a record stream
+(write_packet_stream): records are encoded one at a time into a zstd
+stream writer, so peak memory is one encoding chunk rather than the object,
+its encoded bytes and its compressed bytes at once. iter_packet_records
+decodes either layout back to records.
 """
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Iterable, Iterator, Literal
 
 from abraxas.storage.compress import Codec, CompressionChoice, choose_codec, compress_bytes, decompress_bytes
 from abraxas.storage.hashes import stable_hash_json
@@ -175,6 +186,9 @@ def read_packet(packet_path: Path) -> Any:
     fmt: SerializationFormat = meta["format"]
     codec: Codec = meta["codec"]
 
+    if meta.get("layout") == STREAM_LAYOUT:
+        return list(iter_packet_records(packet_path))
+
     # Read compressed bytes
     with open(packet_path, "rb") as f:
         compressed_bytes = f.read()
@@ -184,3 +198,229 @@ def read_packet(packet_path: Path) -> Any:
 
     # Decode
     return decode_packet(raw_bytes, fmt=fmt)
+
+
+# ---------------------------------------------------------------------------
+# Streaming packets
+# ---------------------------------------------------------------------------
+
+STREAM_LAYOUT = "stream"
+DEFAULT_STREAM_CHUNK_BYTES = 1 << 20
+_READ_CHUNK_BYTES = 1 << 16
+
+
+def _record_encoder(fmt: SerializationFormat) -> tuple[SerializationFormat, Any]:
+    """(effective format, record -> bytes) with the same fallbacks as encode_packet."""
+    if fmt == "cbor":
+        try:
+            import cbor2
+            return "cbor", cbor2.dumps
+        except ImportError:
+            fmt = "json"
+
+    if fmt == "msgpack":
+        try:
+            import msgpack
+            packer = msgpack.Packer(use_bin_type=True)
+            return "msgpack", packer.pack
+        except ImportError:
+            fmt = "json"
+
+    if fmt == "json":
+        # One canonical JSON document per line.
+        return "json", lambda obj: encode_packet(obj, fmt="json") + b"\n"
+
+    raise ValueError(f"Unknown serialization format: {fmt}")
+
+
+def _open_compressed_writer(f: BinaryIO, codec: Codec, level: int, threads: int) -> tuple[Codec, BinaryIO]:
+    if codec == "none":
+        return codec, f
+    if codec == "zstd":
+        try:
+            import zstandard as zstd
+        except ImportError:
+            # Same fallback as compress_bytes
+            return "gzip", gzip.GzipFile(fileobj=f, mode="wb", compresslevel=level, mtime=0)
+        compressor = zstd.ZstdCompressor(level=level, threads=threads, write_content_size=False)
+        return codec, compressor.stream_writer(f, closefd=False)
+    if codec == "gzip":
+        return codec, gzip.GzipFile(fileobj=f, mode="wb", compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported streaming codec: {codec}")
+
+
+def write_packet_stream(
+    source_id: str,
+    window_id: str,
+    records: Iterable[Any],
+    *,
+    timestamp_utc: str | None = None,
+    codec: Codec = "zstd",
+    level: int = 3,
+    threads: int = 0,
+    fmt: SerializationFormat = "msgpack",
+    chunk_bytes: int = DEFAULT_STREAM_CHUNK_BYTES,
+) -> Path:
+    """Write records to CAS as a compressed record stream.
+
+    Records are encoded one at a time and flushed to the compressor in
+    chunks of about chunk_bytes, so memory use does not grow with the
+    packet. The packet hash is the SHA-256 of the encoded stream (the
+    whole object is never materialised for stable_hash_json).
+
+    Args:
+        source_id: Source identifier
+        window_id: Window identifier (recorded in metadata)
+        records: Records to encode, in order
+        timestamp_utc: Optional timestamp for temporal partitioning
+        codec: zstd (default), gzip or none
+        level: Compression level
+        threads: zstd worker threads (0 = single-threaded, -1 = one per CPU)
+        fmt: Record format (default: msgpack)
+        chunk_bytes: Encoded bytes buffered before each compressor write
+
+    Returns:
+        Path to written packet file
+    """
+    fmt, encode = _record_encoder(fmt)
+
+    year, month = None, None
+    if timestamp_utc:
+        year, month = parse_timestamp_components(timestamp_utc)
+
+    # Stream into a temp file next to the final location, then rename once
+    # the content hash is known.
+    probe = get_cas_path("packets", source_id, "0" * 64, year=year, month=month, ext="tmp")
+    ensure_cas_dirs(probe)
+    fd, tmp_name = tempfile.mkstemp(prefix=".stream-", suffix=".tmp", dir=probe.parent)
+    tmp_path = Path(tmp_name)
+
+    digest = hashlib.sha256()
+    raw_size = 0
+    record_count = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            codec, writer = _open_compressed_writer(f, codec, level, threads)
+            buf = bytearray()
+            for record in records:
+                buf += encode(record)
+                record_count += 1
+                if len(buf) >= chunk_bytes:
+                    digest.update(buf)
+                    raw_size += len(buf)
+                    writer.write(bytes(buf))
+                    buf.clear()
+            if buf:
+                digest.update(buf)
+                raw_size += len(buf)
+                writer.write(bytes(buf))
+            if writer is not f:
+                writer.close()
+            compressed_size = f.tell()
+
+        packet_hash = digest.hexdigest()
+        path = get_cas_path(
+            "packets",
+            source_id,
+            packet_hash,
+            year=year,
+            month=month,
+            ext=f"packet.{fmt}.{codec}",
+        )
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    meta_path = path.with_suffix(path.suffix + ".meta.json")
+    meta = {
+        "source_id": source_id,
+        "window_id": window_id,
+        "packet_hash": packet_hash,
+        "format": fmt,
+        "layout": STREAM_LAYOUT,
+        "record_count": record_count,
+        "codec": codec,
+        "codec_level": level if codec != "none" else 0,
+        "codec_reason": "stream",
+        "raw_size": raw_size,
+        "compressed_size": compressed_size,
+        "compression_ratio": raw_size / compressed_size if compressed_size else 1.0,
+    }
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2, sort_keys=True)
+
+    return path
+
+
+def _open_decompressed_reader(f: BinaryIO, codec: Codec) -> BinaryIO:
+    if codec == "none":
+        return f
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=f, mode="rb")
+    if codec == "zstd":
+        try:
+            import zstandard as zstd
+        except ImportError:
+            # Written with the gzip fallback
+            return gzip.GzipFile(fileobj=f, mode="rb")
+        return io.BufferedReader(zstd.ZstdDecompressor().stream_reader(f, closefd=False), _READ_CHUNK_BYTES)
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def _iter_stream_records(reader: BinaryIO, fmt: SerializationFormat) -> Iterator[Any]:
+    if fmt == "msgpack":
+        import msgpack
+
+        unpacker = msgpack.Unpacker(raw=False)
+        while True:
+            chunk = reader.read(_READ_CHUNK_BYTES)
+            if not chunk:
+                return
+            unpacker.feed(chunk)
+            yield from unpacker
+
+    if fmt == "cbor":
+        import cbor2
+
+        if not isinstance(reader, io.BufferedReader):
+            reader = io.BufferedReader(reader, _READ_CHUNK_BYTES)
+        decoder = cbor2.CBORDecoder(reader)
+        while reader.peek(1):
+            yield decoder.decode()
+        return
+
+    if fmt == "json":
+        for line in io.TextIOWrapper(reader, encoding="utf-8"):
+            if line.strip():
+                yield json.loads(line)
+        return
+
+    raise ValueError(f"Unknown serialization format: {fmt}")
+
+
+def iter_packet_records(packet_path: Path) -> Iterator[Any]:
+    """Yield the records of a packet without loading it whole.
+
+    Stream packets are decoded record by record. Packets written by
+    write_packet are decoded in one piece; a list packet yields its
+    elements, any other object is yielded as a single record.
+    """
+    meta_path = packet_path.with_suffix(packet_path.suffix + ".meta.json")
+    if not meta_path.exists():
+        raise ValueError(f"Missing metadata for packet: {packet_path}")
+
+    with open(meta_path, "r") as f:
+        meta = json.load(f)
+
+    if meta.get("layout") != STREAM_LAYOUT:
+        packet = read_packet(packet_path)
+        if isinstance(packet, list):
+            yield from packet
+        else:
+            yield packet
+        return
+
+    with open(packet_path, "rb") as f:
+        reader = _open_decompressed_reader(f, meta["codec"])
+        yield from _iter_stream_records(reader, meta["format"])
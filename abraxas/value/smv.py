@@ -1,5 +1,13 @@
 """
 Signal Marginal Value (SMV) v0.1
+
+run_smv() loads cases and portfolios once, evaluates the baseline once and
+then scores each unit's masked variant. A case's masked evaluation depends
+only on the case and the influences attached to it, so variants are keyed
+on the full masked case: cases a unit's mask does not touch reuse one
+shared result, and every distinct variant is evaluated once, across the
+session's workers.
+Results match running run_counterfactual_exclusion() per unit.
 """
 
 from __future__ import annotations
@@ -7,14 +15,25 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from abraxas.backtest.portfolio import load_portfolios, select_cases_for_portfolio
+from abraxas.backtest.schema import BacktestCase, BacktestResult
+from abraxas.backtest.session import BacktestSession
 from abraxas.core.provenance import hash_canonical_json
 from abraxas.online.vector_map_loader import load_vector_map
-from abraxas.replay.counterfactual import run_counterfactual_exclusion
+from abraxas.replay.counterfactual import (
+    apply_masks,
+    attach_masked_influences,
+    coerce_results,
+    extract_forecast_scores,
+    extract_regime_scores,
+    load_cases,
+)
 from abraxas.replay.types import ReplayMask, ReplayMaskKind
+from abraxas.scoreboard.aggregate import aggregate_scores_for_cases
 from abraxas.value.types import SMVUnit, SMVUnitKind
 
 
@@ -63,41 +82,46 @@ def run_smv(
     vector_map_path: Optional[str],
     max_units: int = 25,
     overrides_path: Optional[str] = None,
+    max_cases: int = 100,
+    workers: int = 1,
+    session: Optional[BacktestSession] = None,
 ) -> Dict[str, Any]:
     overrides = _load_overrides(overrides_path)
-    baseline_report = run_counterfactual_exclusion(
-        run_id=run_id,
-        portfolio_id=portfolio_id,
-        masks=[],
-        cases_dir=cases_dir,
-        portfolios_path=portfolios_path,
-        fdr_path=overrides.get("fdr_path", "data/forecast/decomposition/fdr_v0_1.yaml"),
-        overrides_path=overrides_path,
-    )
-
-    baseline_scores = baseline_report["baseline_scores"]
-    baseline_forecast = baseline_report["baseline_forecast_scores"]
-    baseline_regime = baseline_report["baseline_regime_scores"]
+    cases = load_cases(cases_dir)
+    portfolios = load_portfolios(portfolios_path)
+    if portfolio_id not in portfolios:
+        raise ValueError(f"Unknown portfolio_id: {portfolio_id}")
+    selected_cases = select_cases_for_portfolio(cases, portfolios[portfolio_id])[:max_cases]
+
+    own_session = session is None
+    session = session or BacktestSession(workers=workers)
+    try:
+        if overrides.get("baseline_results") is not None:
+            baseline_results = coerce_results(overrides["baseline_results"])
+        else:
+            baseline_results = _evaluate_variants(session, selected_cases, "counterfactual")
+        baseline_scores = aggregate_scores_for_cases(baseline_results)
+        baseline_forecast = extract_forecast_scores(baseline_scores)
+        baseline_regime = extract_regime_scores(baseline_scores)
+
+        vector_map = None
+        if vector_map_path and any(u.kind == SMVUnitKind.VECTOR_NODE for u in units[:max_units]):
+            vector_map = load_vector_map(Path(vector_map_path))
+        plans = _plan_unit_variants(units[:max_units], selected_cases, overrides, vector_map)
+        variant_results = _evaluate_unit_variants(session, plans)
+    finally:
+        if own_session:
+            session.close()
 
     results = []
-    for unit in units[:max_units]:
-        mask = _unit_to_mask(unit, vector_map_path)
-        if mask is None:
-            continue
-        unit_overrides = _unit_overrides(overrides, unit.unit_id)
-        report = run_counterfactual_exclusion(
-            run_id=run_id,
-            portfolio_id=portfolio_id,
-            masks=[mask],
-            cases_dir=cases_dir,
-            portfolios_path=portfolios_path,
-            fdr_path=overrides.get("fdr_path", "data/forecast/decomposition/fdr_v0_1.yaml"),
-            overrides_path=unit_overrides,
-        )
-
-        masked_scores = report["masked_scores"]
-        masked_forecast = report["masked_forecast_scores"]
-        masked_regime = report["masked_regime_scores"]
+    for unit, override_results, variants in plans:
+        if override_results is not None:
+            masked_results = override_results
+        else:
+            masked_results = [variant_results[key] for key, _ in variants]
+        masked_scores = aggregate_scores_for_cases(masked_results)
+        masked_forecast = extract_forecast_scores(masked_scores)
+        masked_regime = extract_regime_scores(masked_scores)
         benefit = _compute_benefit(
             baseline_forecast,
             baseline_regime,
@@ -134,7 +158,71 @@ def run_smv(
     return report
 
 
+_VariantKey = Tuple[str, str]
+# (unit, override masked results or None, [(variant key, masked case)] per selected case)
+_UnitPlan = Tuple[SMVUnit, Optional[List[BacktestResult]], List[Tuple[_VariantKey, BacktestCase]]]
+
+
+def _plan_unit_variants(
+    units: List[SMVUnit],
+    cases: List[BacktestCase],
+    overrides: Dict[str, Any],
+    vector_map: Any,
+) -> List[_UnitPlan]:
+    plans: List[_UnitPlan] = []
+    for unit in units:
+        mask = _unit_mask_from_map(unit, vector_map)
+        if mask is None:
+            continue
+        unit_overrides = _load_overrides(_unit_overrides(overrides, unit.unit_id))
+        if unit_overrides.get("masked_results") is not None:
+            plans.append((unit, coerce_results(unit_overrides["masked_results"]), []))
+            continue
+        influences_by_case = unit_overrides.get("influences_by_case", {})
+        variants = []
+        for case in cases:
+            influences = influences_by_case.get(case.case_id, [])
+            masked = apply_masks(influences, [mask])
+            masked_case = attach_masked_influences(case, masked)
+            # Hash the whole masked case: case_ids are not guaranteed unique.
+            key = (
+                case.case_id,
+                hash_canonical_json(masked_case.model_dump(mode="json")),
+            )
+            variants.append((key, masked_case))
+        plans.append((unit, None, variants))
+    return plans
+
+
+def _evaluate_unit_variants(
+    session: BacktestSession, plans: List[_UnitPlan]
+) -> Dict[_VariantKey, BacktestResult]:
+    """Evaluate each distinct (case, attached influences) variant once."""
+    pending: Dict[_VariantKey, BacktestCase] = {}
+    for _, _, variants in plans:
+        for key, masked_case in variants:
+            pending.setdefault(key, masked_case)
+    keys = sorted(pending)
+    results = _evaluate_variants(session, [pending[k] for k in keys], "counterfactual_masked")
+    return dict(zip(keys, results))
+
+
+def _evaluate_variants(
+    session: BacktestSession, cases: List[BacktestCase], run_id: str
+) -> List[BacktestResult]:
+    if not cases:
+        return []
+    return session.evaluate_cases(cases, run_id=run_id)
+
+
 def _unit_to_mask(unit: SMVUnit, vector_map_path: Optional[str]) -> Optional[ReplayMask]:
+    vector_map = None
+    if unit.kind == SMVUnitKind.VECTOR_NODE and vector_map_path:
+        vector_map = load_vector_map(Path(vector_map_path))
+    return _unit_mask_from_map(unit, vector_map)
+
+
+def _unit_mask_from_map(unit: SMVUnit, vector_map: Any) -> Optional[ReplayMask]:
     if unit.kind == SMVUnitKind.SOURCE_LABEL:
         return ReplayMask(
             mask_id=f"exclude_source_{unit.unit_id}",
@@ -144,8 +232,7 @@ def _unit_to_mask(unit: SMVUnit, vector_map_path: Optional[str]) -> Optional[Rep
         )
     if unit.kind == SMVUnitKind.VECTOR_NODE:
         source_labels = []
-        if vector_map_path:
-            vector_map = load_vector_map(Path(vector_map_path))
+        if vector_map is not None:
             for node in vector_map.nodes:
                 if node.node_id == unit.selectors.get("node_id"):
                     source_labels = node.allowlist_source_ids
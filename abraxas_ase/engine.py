@@ -17,6 +17,7 @@ from .runes.invoke import invoke_rune
 from .sas import SASParams, compute_sas_for_sub
 from .schema import ledger_entry, output_skeleton
 from .sdct.registry import get_enabled_domains
+from .subword_index import get_subword_index
 from .tiering import apply_tier
 from .types import PFDIAlert, SubAnagramHit
 
@@ -116,32 +117,24 @@ def tier2_subanagrams(
     """
     from .types import SubAnagramHit
 
-    all_subwords = set(lex.subwords)
-    if canary_subwords:
-        all_subwords = all_subwords | set(canary_subwords)
+    canary = frozenset(canary_subwords or ())
+    index = get_subword_index(frozenset(lex.subwords), canary)
+    contained = index.contained_many((rec.norm for rec in records), min_len=min_sub_len, proper=True)
 
     hits: List[SubAnagramHit] = []
 
     for rec in records:
-        token_counter = Counter(rec.norm)
-        for sub in sorted(all_subwords):
-            if len(sub) < min_sub_len:
-                continue
-            if len(sub) >= len(rec.norm):
-                continue
-            sub_counter = Counter(sub)
-            # Check if sub's letter multiset is contained in token's
-            if all(sub_counter[ch] <= token_counter.get(ch, 0) for ch in sub_counter):
-                lane = "canary" if (canary_subwords and sub in canary_subwords) else "core"
-                hits.append(SubAnagramHit(
-                    token=rec.norm,
-                    sub=sub,
-                    tier=2,
-                    verified=True,
-                    lane=lane,
-                    item_id=rec.item_id,
-                    source=rec.source,
-                ))
+        for sub in contained[rec.norm]:
+            lane = "canary" if sub in canary else "core"
+            hits.append(SubAnagramHit(
+                token=rec.norm,
+                sub=sub,
+                tier=2,
+                verified=True,
+                lane=lane,
+                item_id=rec.item_id,
+                source=rec.source,
+            ))
 
     hits.sort(key=lambda h: (h.token, h.sub, h.item_id))
     return hits
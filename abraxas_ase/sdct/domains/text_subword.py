@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from collections import Counter
 from typing import List
 
 from ...lexicon import Lexicon
 from ...normalize import extract_tokens, filter_token, is_stopish, normalize_token, split_hyphenated
 from ...scoring import letter_entropy, token_anagram_potential
+from ...subword_index import get_subword_index
 from ...types import TokenRec
 from ..types import DomainDescriptor, EvidenceRow, Motif, motif_id_from_text
 
@@ -15,14 +15,6 @@ def _letters_sorted(tok: str) -> str:
     return "".join(sorted(bare))
 
 
-def _can_spell(parent_letters: Counter, sub: str) -> bool:
-    need = Counter(sub)
-    for ch, n in need.items():
-        if parent_letters.get(ch, 0) < n:
-            return False
-    return True
-
-
 def _token_records_for_item(item: dict, lex: Lexicon, min_len: int = 4) -> List[TokenRec]:
     out: List[TokenRec] = []
     item_id = str(item.get("id", ""))
@@ -74,7 +66,7 @@ class TextSubwordCartridge:
         self._lexicon = lexicon
         self._min_token_len = min_token_len
         self._min_sub_len = min_sub_len
-        self._subs_all = sorted([w for w in lexicon.subwords if len(w) >= min_sub_len])
+        self._index = get_subword_index(frozenset(lexicon.subwords))
 
     def descriptor(self) -> DomainDescriptor:
         return DomainDescriptor(
@@ -92,19 +84,21 @@ class TextSubwordCartridge:
 
     def extract_motifs(self, sym: List[TokenRec]) -> List[Motif]:
         motifs: List[Motif] = []
+        contained = self._index.contained_many(
+            (rec.letters_sorted for rec in sym),
+            min_len=self._min_sub_len,
+        )
         for rec in sym:
-            parent = Counter(rec.letters_sorted)
-            for sub in self._subs_all:
-                if _can_spell(parent, sub):
-                    motif_id = motif_id_from_text(self.domain_id, "subword", sub)
-                    motifs.append(Motif(
-                        domain_id=self.domain_id,
-                        motif_id=motif_id,
-                        motif_text=sub,
-                        motif_len=len(sub),
-                        motif_complexity=1.0,
-                        lane_hint="core",
-                    ))
+            for sub in contained[rec.letters_sorted]:
+                motif_id = motif_id_from_text(self.domain_id, "subword", sub)
+                motifs.append(Motif(
+                    domain_id=self.domain_id,
+                    motif_id=motif_id,
+                    motif_text=sub,
+                    motif_len=len(sub),
+                    motif_complexity=1.0,
+                    lane_hint="core",
+                ))
         return motifs
 
     def emit_evidence(
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .lexicon_runtime import build_runtime_lexicon
+
+
+class SubwordIndex:
+    """
+    Precompiled subanagram index over a fixed subword set.
+
+    Subwords are bucketed by letter-presence bitmask, so a token only pays a
+    single integer test per bucket; letter counts are compared only for
+    subwords that repeat a letter. Answers match the Counter containment
+    check exactly and are returned sorted.
+    """
+
+    def __init__(self, subwords: Iterable[str]) -> None:
+        self._bits: Dict[str, int] = {}
+        buckets: Dict[int, List[str]] = {}
+        self._repeat_counts: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        for sub in sorted(set(subwords)):
+            mask = 0
+            for ch in sub:
+                if ch not in self._bits:
+                    self._bits[ch] = 1 << len(self._bits)
+                mask |= self._bits[ch]
+            buckets.setdefault(mask, []).append(sub)
+            counts = Counter(sub)
+            if any(n > 1 for n in counts.values()):
+                self._repeat_counts[sub] = tuple(sorted(counts.items()))
+        self._buckets: List[Tuple[int, Tuple[str, ...]]] = [
+            (mask, tuple(subs)) for mask, subs in sorted(buckets.items())
+        ]
+
+    def contained(self, token: str, *, min_len: int = 1, proper: bool = False) -> Tuple[str, ...]:
+        """
+        Subwords whose letter multiset is contained in `token`'s.
+
+        proper=True additionally requires the subword to be shorter than the token.
+        """
+        max_len = len(token) - 1 if proper else len(token)
+        token_mask = 0
+        for ch in token:
+            token_mask |= self._bits.get(ch, 0)
+        token_counts: Optional[Counter] = None
+        out: List[str] = []
+        for mask, subs in self._buckets:
+            if mask & ~token_mask:
+                continue
+            for sub in subs:
+                if len(sub) < min_len or len(sub) > max_len:
+                    continue
+                need = self._repeat_counts.get(sub)
+                if need:
+                    if token_counts is None:
+                        token_counts = Counter(token)
+                    if any(token_counts.get(ch, 0) < n for ch, n in need):
+                        continue
+                out.append(sub)
+        out.sort()
+        return tuple(out)
+
+    def contained_many(
+        self,
+        tokens: Iterable[str],
+        *,
+        min_len: int = 1,
+        proper: bool = False,
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Bulk form of contained(); each distinct letter multiset is resolved once.
+        """
+        by_letters: Dict[str, Tuple[str, ...]] = {}
+        out: Dict[str, Tuple[str, ...]] = {}
+        for token in tokens:
+            if token in out:
+                continue
+            letters = "".join(sorted(token))
+            if letters not in by_letters:
+                by_letters[letters] = self.contained(letters, min_len=min_len, proper=proper)
+            out[token] = by_letters[letters]
+        return out
+
+
+_INDEX_CACHE: Dict[str, SubwordIndex] = {}
+
+
+def get_subword_index(
+    core_subwords: FrozenSet[str],
+    canary_subwords: FrozenSet[str] = frozenset(),
+) -> SubwordIndex:
+    """
+    Process-wide SubwordIndex over core | canary, keyed by the runtime lexicon hash.
+    """
+    runtime_hash = build_runtime_lexicon(
+        core_subwords=frozenset(core_subwords),
+        canary_subwords=frozenset(canary_subwords),
+    ).runtime_hash
+    index = _INDEX_CACHE.get(runtime_hash)
+    if index is None:
+        index = SubwordIndex(set(core_subwords) | set(canary_subwords))
+        _INDEX_CACHE[runtime_hash] = index
+    return index
@@ -528,6 +528,9 @@ def main() -> None:
         default="data/backtests/portfolios/portfolios_v0_1.yaml",
     )
     p_smv.add_argument("--max-units", type=int, default=25)
+    p_smv.add_argument(
+        "--workers", type=int, default=1, help="Processes for variant evaluation"
+    )
 
     p_self_heal = sub.add_parser("self-heal", help="Generate self-heal advisory plan")
     p_self_heal.add_argument(
@@ -0,0 +1,331 @@
+"""Artifact-declared step DAG for the cycle runner.
+
+Each CycleStep names the artifacts (ledger paths or report globs) it reads
+and writes. A step waits for every earlier step it conflicts with: an
+earlier writer of something it reads or writes, or an earlier reader of
+something it writes. That reproduces the sequential cycle's results while
+letting independent steps run side by side.
+
+Steps run either as `python -m <module>` subprocesses (default) or, with
+inprocess=True, by calling `<module>.main()` in a warm interpreter. With
+more than one worker, in-process steps run in a forked process pool, so
+every worker starts with the parent's imports. In-process steps read
+JSON/JSONL through a stat-validated ArtifactCache instead of their own
+`_read_json` / `_read_jsonl` helpers, so ledgers re-read by later steps in
+the same worker are parsed once and only their appended tail afterwards.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+StepArgs = Union[Sequence[str], Callable[[], Sequence[str]]]
+
+_OUTPUT_TAIL = 8000
+_TAIL_CHECK_BYTES = 64
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+@dataclass(frozen=True)
+class CycleStep:
+    """One cycle step and the artifacts it touches.
+
+    `args` may be a callable; it is evaluated when the step is dispatched,
+    after all steps it depends on have finished (for "latest report" globs).
+    """
+
+    name: str
+    module: str
+    args: StepArgs = ()
+    reads: Tuple[str, ...] = ()
+    writes: Tuple[str, ...] = ()
+
+    def resolve_args(self) -> List[str]:
+        args = self.args() if callable(self.args) else self.args
+        return [str(a) for a in args]
+
+
+def plan_dependencies(steps: Sequence[CycleStep]) -> List[Set[int]]:
+    """Indices of earlier steps each step must wait for."""
+    deps: List[Set[int]] = []
+    for j, step in enumerate(steps):
+        reads, writes = set(step.reads), set(step.writes)
+        before: Set[int] = set()
+        for i in range(j):
+            prior = steps[i]
+            prior_writes = set(prior.writes)
+            if prior_writes & (reads | writes) or set(prior.reads) & writes:
+                before.add(i)
+        deps.append(before)
+    return deps
+
+
+# ---------------------------------------------------------------------------
+# Read-through artifact cache
+# ---------------------------------------------------------------------------
+
+
+class ArtifactCache:
+    """Parsed JSON/JSONL artifacts keyed by path, validated by mtime/size.
+
+    Semantics match the `_read_json` / `_read_jsonl` helpers of the abx step
+    modules. JSONL files that only grew are extended by parsing the new
+    tail. Callers get fresh top-level containers; nested values are shared
+    and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._json: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # path -> (stamp, complete_bytes, tail_check, records)
+        self._jsonl: Dict[str, Tuple[Tuple[int, int], int, bytes, List[Dict[str, Any]]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def read_json(self, path: str) -> Dict[str, Any]:
+        try:
+            key = os.path.abspath(path)
+            st = os.stat(key)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._json.get(key)
+            if cached is not None and cached[0] == stamp:
+                self.hits += 1
+                return dict(cached[1])
+            self.misses += 1
+            with open(key, "r", encoding="utf-8") as f:
+                d = json.load(f)
+            d = d if isinstance(d, dict) else {}
+            self._json[key] = (stamp, d)
+            return dict(d)
+        except Exception:
+            return {}
+
+    def read_jsonl(self, path: str) -> List[Dict[str, Any]]:
+        if not path or not os.path.exists(path):
+            return []
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._jsonl.get(key)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return [dict(d) for d in cached[3]]
+
+        start, records = 0, []
+        if cached is not None and st.st_size >= cached[1] and self._tail_matches(key, cached[1], cached[2]):
+            start, records = cached[1], list(cached[3])
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        with open(key, "rb") as f:
+            f.seek(start)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        records.extend(self._parse(data[:complete]))
+        end = start + complete
+        with open(key, "rb") as f:
+            f.seek(max(0, end - _TAIL_CHECK_BYTES))
+            tail_check = f.read(min(end, _TAIL_CHECK_BYTES))
+        self._jsonl[key] = (stamp, end, tail_check, records)
+        # A torn final line is parsed on every read and never cached.
+        return [dict(d) for d in records] + self._parse(data[complete:])
+
+    @staticmethod
+    def _tail_matches(path: str, end: int, tail_check: bytes) -> bool:
+        with open(path, "rb") as f:
+            f.seek(max(0, end - _TAIL_CHECK_BYTES))
+            return f.read(min(end, _TAIL_CHECK_BYTES)) == tail_check
+
+    @staticmethod
+    def _parse(data: bytes) -> List[Dict[str, Any]]:
+        # Universal newlines, as text-mode iteration in the step modules.
+        text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        out: List[Dict[str, Any]] = []
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                d = json.loads(line)
+                if isinstance(d, dict):
+                    out.append(d)
+            except Exception:
+                continue
+        return out
+
+
+_CACHE = ArtifactCache()
+
+
+# ---------------------------------------------------------------------------
+# Step execution
+# ---------------------------------------------------------------------------
+
+
+def _run_subprocess(cmd: List[str]) -> Tuple[int, str]:
+    try:
+        p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        return int(p.returncode), str(p.stdout or "")
+    except Exception as e:
+        return 127, f"EXCEPTION: {e}"
+
+
+def _exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+def _run_inprocess(module: str, args: List[str]) -> Tuple[int, str]:
+    """Run `python -m module args` as module.main() in this interpreter."""
+    buf = io.StringIO()
+    saved_argv = sys.argv
+    patched: List[Tuple[Any, str, Any]] = []
+    sys.argv = [module, *args]
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            try:
+                mod = importlib.import_module(module)
+                for attr, reader in (("_read_json", _CACHE.read_json), ("_read_jsonl", _CACHE.read_jsonl)):
+                    if callable(getattr(mod, attr, None)):
+                        patched.append((mod, attr, getattr(mod, attr)))
+                        setattr(mod, attr, reader)
+                code = _exit_code(mod.main())
+            except SystemExit as e:
+                code = _exit_code(e.code)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+    finally:
+        for mod, attr, original in patched:
+            setattr(mod, attr, original)
+        sys.argv = saved_argv
+    return code, buf.getvalue()
+
+
+def _supports_inprocess(module: str) -> bool:
+    """Step modules run in-process only through their main() entry point."""
+    try:
+        mod = importlib.import_module(module)
+    except BaseException:
+        # Let the subprocess report import errors exactly as before.
+        return False
+    return callable(getattr(mod, "main", None))
+
+
+def _fork_pool(workers: int) -> Optional[Executor]:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+
+
+def run_steps(
+    steps: Sequence[CycleStep],
+    log: List[Dict[str, Any]],
+    *,
+    workers: int = 1,
+    inprocess: bool = False,
+) -> List[bool]:
+    """Run steps respecting artifact dependencies; append log entries in step order.
+
+    Returns:
+        Per-step ok flags (False for failures and skipped steps)
+    """
+    deps = plan_dependencies(steps)
+    entries: List[Optional[Dict[str, Any]]] = [None] * len(steps)
+    warm = {s.module: inprocess and _supports_inprocess(s.module) for s in steps} if inprocess else {}
+
+    def _prepare(i: int) -> Optional[Tuple[List[str], bool]]:
+        step = steps[i]
+        if importlib.util.find_spec(step.module) is None:
+            entries[i] = {
+                "ts": _utc_now_iso(),
+                "step": step.name,
+                "module": step.module,
+                "skipped": True,
+                "reason": "module_missing",
+            }
+            return None
+        return step.resolve_args(), warm.get(step.module, False)
+
+    def _entry(i: int, ts: str, cmd: List[str], code: int, out: str, duration_ms: float) -> Dict[str, Any]:
+        return {
+            "ts": ts,
+            "step": steps[i].name,
+            "cmd": cmd,
+            "code": code,
+            "ok": int(code) == 0,
+            "output": out[-_OUTPUT_TAIL:],
+            "duration_ms": round(duration_ms, 3),
+        }
+
+    if workers <= 1:
+        for i, step in enumerate(steps):
+            prepared = _prepare(i)
+            if prepared is None:
+                continue
+            args, in_proc = prepared
+            cmd = ["python", "-m", step.module, *args]
+            ts, t0 = _utc_now_iso(), time.perf_counter()
+            code, out = _run_inprocess(step.module, args) if in_proc else _run_subprocess(cmd)
+            entries[i] = _entry(i, ts, cmd, code, out, (time.perf_counter() - t0) * 1000.0)
+    else:
+        threads = ThreadPoolExecutor(max_workers=workers)
+        procs = _fork_pool(workers) if any(warm.values()) else None
+        running: Dict[Future, Tuple[int, str, List[str], float]] = {}
+        finished: Set[int] = set()
+        pending = list(range(len(steps)))
+        try:
+            while pending or running:
+                for i in list(pending):
+                    if not deps[i] <= finished:
+                        continue
+                    pending.remove(i)
+                    prepared = _prepare(i)
+                    if prepared is None:
+                        finished.add(i)
+                        continue
+                    args, in_proc = prepared
+                    cmd = ["python", "-m", steps[i].module, *args]
+                    if in_proc and procs is not None:
+                        fut = procs.submit(_run_inprocess, steps[i].module, args)
+                    else:
+                        fut = threads.submit(_run_subprocess, cmd)
+                    running[fut] = (i, _utc_now_iso(), cmd, time.perf_counter())
+                if not running:
+                    continue
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    i, ts, cmd, t0 = running.pop(fut)
+                    try:
+                        code, out = fut.result()
+                    except Exception as e:
+                        code, out = 127, f"EXCEPTION: {e}"
+                    entries[i] = _entry(i, ts, cmd, code, out, (time.perf_counter() - t0) * 1000.0)
+                    finished.add(i)
+        finally:
+            threads.shutdown(wait=True)
+            if procs is not None:
+                procs.shutdown(wait=True)
+
+    log.extend(e for e in entries if e is not None)
+    return [bool(e and e.get("ok")) for e in entries]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import importlib.util
+import glob
 import json
 import os
-import subprocess
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
+
+from abx.cycle_dag import CycleStep, run_steps
 
 
 def _utc_now_iso() -> str:
@@ -32,56 +33,258 @@ def _read_json(path: str) -> Dict[str, Any]:
         return {}
 
 
-def _cmd_ok(code: int) -> bool:
-    return int(code) == 0
-
-
-def _run(cmd: List[str]) -> Tuple[int, str]:
-    try:
-        p = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
-        )
-        return int(p.returncode), str(p.stdout or "")
-    except Exception as e:
-        return 127, f"EXCEPTION: {e}"
-
-
-def _step(log: List[Dict[str, Any]], name: str, cmd: List[str]) -> bool:
-    ts = _utc_now_iso()
-    code, out = _run(cmd)
-    ok = _cmd_ok(code)
-    log.append(
-        {
-            "ts": ts,
-            "step": name,
-            "cmd": cmd,
-            "code": code,
-            "ok": ok,
-            "output": out[-8000:],
-        }
-    )
-    return ok
-
-
-def _module_exists(module: str) -> bool:
-    return importlib.util.find_spec(module) is not None
-
-
-def _run_module(
-    log: List[Dict[str, Any]], name: str, module: str, args: List[str]
-) -> bool:
-    if not _module_exists(module):
-        log.append(
-            {
-                "ts": _utc_now_iso(),
-                "step": name,
-                "module": module,
-                "skipped": True,
-                "reason": "module_missing",
-            }
-        )
-        return False
-    return _step(log, name, ["python", "-m", module, *args])
+# Artifact keys used to order steps (see abx.cycle_dag.plan_dependencies).
+_L = "out/ledger/"
+_R = "out/reports/"
+ANCHOR = _L + "anchor_ledger.jsonl"
+EVIDENCE_GRAPH = _L + "evidence_graph.jsonl"
+ORACLE_RUNS = _L + "oracle_runs.jsonl"
+SLANG_CANDIDATES = _L + "slang_candidates.jsonl"
+AALMANAC = _L + "aalmanac.jsonl"
+AALMANAC_EVENTS = _L + "aalmanac_events.jsonl"
+TASK_LEDGER = _L + "task_ledger.jsonl"
+TASK_OUTCOMES = _L + "task_outcomes.jsonl"
+FORECAST_LEDGER = _L + "forecast_ledger.jsonl"
+SCHEDULER_LEDGER = _L + "scheduler_ledger.jsonl"
+BINDER_LEDGER = _L + "binder_ledger.jsonl"
+UNION_LEDGER = _L + "union_ledger.jsonl"
+MEDIA_ORIGIN_LEDGER = _L + "media_origin_ledger.jsonl"
+MEDIA_FINGERPRINTS = _L + "media_fingerprint_index.jsonl"
+REUPLOAD_FRONTS = _L + "reupload_fronts.jsonl"
+MANIPULATION_METRICS = _L + "manipulation_metrics.jsonl"
+BASELINE_LEXICON = "out/config/baseline_lexicon.json"
+UPLIFT_TABLE = "out/config/uplift_table.json"
+GRAPHS = "out/graphs/evidence_graph_*.json"
+RESOLVED_BATCHES = "out/batches/acq_batch_resolved_*.json"
+
+
+def _report(prefix: str) -> str:
+    return _R + prefix + "_*.json"
+
+
+def _latest(pattern: str) -> str:
+    found = sorted(glob.glob(pattern))
+    return found[-1] if found else ""
+
+
+def _measure_steps(phase: str) -> List[CycleStep]:
+    return [
+        CycleStep(
+            f"evidence_metrics({phase})",
+            "abx.evidence_metrics",
+            reads=(GRAPHS, _report("proof_integrity")),
+            writes=(_report("evidence_metrics"),),
+        ),
+        CycleStep(
+            f"time_to_truth({phase})",
+            "abx.claim_timeseries",
+            reads=(_report("truth_contamination"), EVIDENCE_GRAPH),
+            writes=(_report("claim_timeseries"),),
+        ),
+        CycleStep(
+            f"proof_integrity({phase})",
+            "abx.proof_integrity",
+            reads=(ANCHOR,),
+            writes=(_report("proof_integrity"),),
+        ),
+    ]
+
+
+def _review_steps(args: argparse.Namespace) -> List[CycleStep]:
+    run = ["--run-id", args.run_id]
+    return [
+        CycleStep(
+            "truth_pollution",
+            "abx.truth_pollution",
+            reads=(_report("time_to_truth"), ANCHOR),
+            writes=(_report("truth_pollution"),),
+        ),
+        CycleStep(
+            "slang_extract",
+            "abx.slang_extract",
+            run,
+            reads=(ORACLE_RUNS, ANCHOR, BASELINE_LEXICON),
+            writes=(SLANG_CANDIDATES,),
+        ),
+        CycleStep(
+            "slang_migration",
+            "abx.slang_migration",
+            reads=(SLANG_CANDIDATES,),
+            writes=(_report("slang_migration"),),
+        ),
+        CycleStep(
+            "aalmanac_promote",
+            "abx.aalmanac",
+            run,
+            reads=(SLANG_CANDIDATES, AALMANAC),
+            writes=(AALMANAC,),
+        ),
+        CycleStep(
+            "mimetic_weather",
+            "abx.mimetic_weather",
+            reads=(
+                AALMANAC,
+                SLANG_CANDIDATES,
+                _report("truth_pollution"),
+                _report("deficits"),
+                _report("slang_migration"),
+            ),
+            writes=(_report("mimetic_weather"),),
+        ),
+        CycleStep(
+            "weather_to_tasks",
+            "abx.weather_to_tasks",
+            run,
+            reads=(_report("mimetic_weather"), TASK_LEDGER),
+            writes=(TASK_LEDGER, _report("weather_tasks")),
+        ),
+        CycleStep(
+            "term_claim_binder",
+            "abx.term_claim_binder",
+            run,
+            reads=(_report("weather_tasks"), ANCHOR),
+            writes=(_report("weather_tasks"), BINDER_LEDGER),
+        ),
+        CycleStep(
+            "forecast_review_state",
+            "abx.forecast_review_state",
+            reads=(FORECAST_LEDGER, SCHEDULER_LEDGER),
+            writes=(_report("forecast_review_state"),),
+        ),
+        CycleStep(
+            "review_scheduler",
+            "abx.review_scheduler",
+            [*run, "--outbox", args.outbox, "--max-due", str(int(args.max_due))],
+            reads=(
+                FORECAST_LEDGER,
+                SCHEDULER_LEDGER,
+                TASK_LEDGER,
+                _report("truth_pollution"),
+                _report("deficits"),
+            ),
+            writes=(SCHEDULER_LEDGER, TASK_LEDGER, args.outbox),
+        ),
+        CycleStep(
+            "task_union_ledger",
+            "abx.task_union_ledger",
+            run,
+            reads=(TASK_LEDGER,),
+            writes=(UNION_LEDGER, TASK_LEDGER, _report("acq_batch")),
+        ),
+    ]
+
+
+def _acquisition_steps(args: argparse.Namespace, acq_in: str) -> List[CycleStep]:
+    run = ["--run-id", args.run_id]
+    provider = ["--provider", args.provider] if args.provider else []
+
+    # Inputs named after the latest upstream outputs are resolved at dispatch.
+    def resolved_in() -> str:
+        return _latest(RESOLVED_BATCHES) or acq_in
+
+    def media_args() -> List[str]:
+        return [*run, "--in", resolved_in(), "--provider", args.provider]
+
+    def acq_args() -> List[str]:
+        mor = _latest(_report("media_origin_verify"))
+        return [*run, "--in", resolved_in(), *provider, *(["--media-origin-report", mor] if mor else [])]
+
+    return [
+        CycleStep(
+            "anchor_url_resolver",
+            "abx.anchor_url_resolver",
+            [*run, "--in", acq_in],
+            reads=(acq_in, ANCHOR),
+            writes=(RESOLVED_BATCHES,),
+        ),
+        CycleStep(
+            "media_origin_verify",
+            "abx.media_origin_verify",
+            media_args,
+            reads=(RESOLVED_BATCHES, MEDIA_ORIGIN_LEDGER, MEDIA_FINGERPRINTS),
+            writes=(MEDIA_ORIGIN_LEDGER, MEDIA_FINGERPRINTS, _report("media_origin_verify")),
+        ),
+        CycleStep(
+            "acquisition_execute",
+            "abx.acquisition_execute",
+            acq_args,
+            reads=(RESOLVED_BATCHES, _report("media_origin_verify"), TASK_LEDGER, ANCHOR),
+            writes=(TASK_LEDGER, TASK_OUTCOMES, ANCHOR),
+        ),
+        CycleStep(
+            "online_resolver",
+            "abx.online_resolver",
+            [*run, *provider],
+            reads=(_report("acquisition_execute"), ANCHOR, EVIDENCE_GRAPH, TASK_LEDGER),
+            writes=(EVIDENCE_GRAPH, ANCHOR, TASK_LEDGER, _report("online_resolver")),
+        ),
+        CycleStep(
+            "reupload_storm_detector",
+            "abx.reupload_storm_detector",
+            run,
+            reads=(MEDIA_ORIGIN_LEDGER, MEDIA_FINGERPRINTS, TASK_LEDGER),
+            writes=(REUPLOAD_FRONTS, TASK_LEDGER, _report("reupload_storms")),
+        ),
+        CycleStep(
+            "manipulation_metrics",
+            "abx.manipulation_metrics",
+            run,
+            reads=(ANCHOR,),
+            writes=(MANIPULATION_METRICS, _report("manipulation_metrics")),
+        ),
+        CycleStep(
+            "manipulation_fronts_to_tasks",
+            "abx.manipulation_fronts_to_tasks",
+            run,
+            reads=(MANIPULATION_METRICS, TASK_LEDGER),
+            writes=(TASK_LEDGER,),
+        ),
+        CycleStep(
+            "task_roi_report",
+            "abx.task_roi_report",
+            run,
+            reads=(TASK_OUTCOMES,),
+            writes=(_report("task_roi"),),
+        ),
+    ]
+
+
+def _recompute_steps(args: argparse.Namespace) -> List[CycleStep]:
+    run = ["--run-id", args.run_id]
+    return _measure_steps("post") + [
+        CycleStep(
+            "aalmanac_enrich",
+            "abx.aalmanac_enrich",
+            run,
+            reads=(AALMANAC, ORACLE_RUNS, ANCHOR, AALMANAC_EVENTS),
+            writes=(AALMANAC_EVENTS, _report("aalmanac_state")),
+        ),
+        CycleStep(
+            "aalmanac_tau",
+            "abx.aalmanac_tau",
+            run,
+            reads=(AALMANAC, ORACLE_RUNS, ANCHOR, AALMANAC_EVENTS, TASK_LEDGER, _report("slang_migration")),
+            writes=(AALMANAC_EVENTS, TASK_LEDGER, _report("aalmanac_tau_state")),
+        ),
+        CycleStep(
+            "attribution_compile",
+            "abx.attribution_compile",
+            reads=(TASK_LEDGER, ANCHOR, EVIDENCE_GRAPH, _report("online_resolver")),
+            writes=(_report("attribution_graph"),),
+        ),
+        CycleStep(
+            "attribution_delta",
+            "abx.attribution_delta",
+            reads=(_report("attribution_graph"), _report("time_to_truth"), UPLIFT_TABLE),
+            writes=(_report("attribution_delta"), UPLIFT_TABLE),
+        ),
+        CycleStep(
+            "delta_scoring",
+            "abx.delta_scoring",
+            reads=(TASK_LEDGER, _report("time_to_truth"), _report("proof_integrity"), UPLIFT_TABLE),
+            writes=(_report("delta_scoring"), UPLIFT_TABLE),
+        ),
+    ]
 
 
 def main() -> int:
@@ -95,6 +298,17 @@ def main() -> int:
         "--skip-acquire", action="store_true", help="Skip acquisition/resolution steps"
     )
     ap.add_argument("--provider", default="", help="Preferred provider (decodo/requests/etc)")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run independent steps concurrently (1 = strictly sequential)",
+    )
+    ap.add_argument(
+        "--inprocess",
+        action="store_true",
+        help="Call step mains in a warm interpreter instead of python -m subprocesses",
+    )
     args = ap.parse_args()
 
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
@@ -111,43 +325,10 @@ def main() -> int:
         "notes": "WO-86 orchestrates metrics->pollution->review->acquisition->resolution->recompute->attribution.",
     }
 
-    _run_module(log, "evidence_metrics(pre)", "abx.evidence_metrics", [])
-    _run_module(log, "time_to_truth(pre)", "abx.claim_timeseries", [])
-    _run_module(log, "proof_integrity(pre)", "abx.proof_integrity", [])
-
-    _run_module(log, "truth_pollution", "abx.truth_pollution", [])
-    _run_module(log, "slang_extract", "abx.slang_extract", ["--run-id", args.run_id])
-    _run_module(log, "slang_migration", "abx.slang_migration", [])
-    _run_module(log, "aalmanac_promote", "abx.aalmanac", ["--run-id", args.run_id])
-    _run_module(log, "mimetic_weather", "abx.mimetic_weather", [])
-    _run_module(
-        log, "weather_to_tasks", "abx.weather_to_tasks", ["--run-id", args.run_id]
-    )
-    _run_module(
-        log, "term_claim_binder", "abx.term_claim_binder", ["--run-id", args.run_id]
-    )
-    _run_module(log, "forecast_review_state", "abx.forecast_review_state", [])
-
-    _run_module(
-        log,
-        "review_scheduler",
-        "abx.review_scheduler",
-        [
-            "--run-id",
-            args.run_id,
-            "--outbox",
-            args.outbox,
-            "--max-due",
-            str(int(args.max_due)),
-        ],
-    )
-
-    _run_module(log, "task_union_ledger", "abx.task_union_ledger", ["--run-id", args.run_id])
+    run = {"workers": max(1, int(args.workers)), "inprocess": bool(args.inprocess)}
+    run_steps(_measure_steps("pre") + _review_steps(args), log, **run)
 
-    import glob
-
-    batches = sorted(glob.glob("out/reports/acq_batch_*.json"))
-    acq_in = batches[-1] if batches else ""
+    acq_in = _latest("out/reports/acq_batch_*.json")
     outbox = _read_json(acq_in) if acq_in else {"tasks": []}
     tasks = outbox.get("tasks") if isinstance(outbox.get("tasks"), list) else []
     n_tasks = len(tasks)
@@ -161,62 +342,7 @@ def main() -> int:
     )
 
     if (not args.skip_acquire) and n_tasks > 0 and acq_in:
-        _run_module(
-            log,
-            "anchor_url_resolver",
-            "abx.anchor_url_resolver",
-            ["--run-id", args.run_id, "--in", acq_in],
-        )
-
-        import glob
-
-        resolved = sorted(glob.glob("out/batches/acq_batch_resolved_*.json"))
-        acq_in_resolved = resolved[-1] if resolved else acq_in
-
-        media_args = [
-            "--run-id",
-            args.run_id,
-            "--in",
-            acq_in_resolved,
-            "--provider",
-            args.provider,
-        ]
-        _run_module(log, "media_origin_verify", "abx.media_origin_verify", media_args)
-
-        import glob
-
-        mors = sorted(glob.glob("out/reports/media_origin_verify_*.json"))
-        mor = mors[-1] if mors else ""
-
-        acq_args = ["--run-id", args.run_id, "--in", acq_in_resolved]
-        if args.provider:
-            acq_args += ["--provider", args.provider]
-        if mor:
-            acq_args += ["--media-origin-report", mor]
-        _run_module(log, "acquisition_execute", "abx.acquisition_execute", acq_args)
-
-        res_args = ["--run-id", args.run_id]
-        if args.provider:
-            res_args += ["--provider", args.provider]
-        _run_module(log, "online_resolver", "abx.online_resolver", res_args)
-        _run_module(
-            log, "reupload_storm_detector", "abx.reupload_storm_detector", ["--run-id", args.run_id]
-        )
-        _run_module(
-            log,
-            "manipulation_metrics",
-            "abx.manipulation_metrics",
-            ["--run-id", args.run_id],
-        )
-        _run_module(
-            log,
-            "manipulation_fronts_to_tasks",
-            "abx.manipulation_fronts_to_tasks",
-            ["--run-id", args.run_id],
-        )
-        _run_module(
-            log, "task_roi_report", "abx.task_roi_report", ["--run-id", args.run_id]
-        )
+        run_steps(_acquisition_steps(args, acq_in), log, **run)
     else:
         log.append(
             {
@@ -227,17 +353,7 @@ def main() -> int:
             }
         )
 
-    _run_module(log, "evidence_metrics(post)", "abx.evidence_metrics", [])
-    _run_module(log, "time_to_truth(post)", "abx.claim_timeseries", [])
-    _run_module(log, "proof_integrity(post)", "abx.proof_integrity", [])
-    _run_module(
-        log, "aalmanac_enrich", "abx.aalmanac_enrich", ["--run-id", args.run_id]
-    )
-    _run_module(log, "aalmanac_tau", "abx.aalmanac_tau", ["--run-id", args.run_id])
-
-    _run_module(log, "attribution_compile", "abx.attribution_compile", [])
-    _run_module(log, "attribution_delta", "abx.attribution_delta", [])
-    _run_module(log, "delta_scoring", "abx.delta_scoring", [])
+    run_steps(_recompute_steps(args), log, **run)
 
     _write_json(cycle_log_path, {"meta": meta, "log": log})
     print(f"[CYCLE] wrote: {cycle_log_path}")
@@ -6,21 +6,22 @@ Deterministic, provenance-first, rune-mediated.
 from __future__ import annotations
 
 import hashlib
-import inspect
 import json
 import os
 import platform
 import subprocess
+import sys
 import time
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
 
 from abx.purity import detector_purity_guard
-from abx.runtime_events import emit as emit_event
+from abx.runtime_events import emit as emit_event, emit_many
 from abx.schema_registry import payload_schema_for, result_schema_for
 from abx.validate import validate_payload
-from shared.aAlmanac import record_event
-from shared.rune_ledger import record_invocation
+from shared.aAlmanac import append_events, build_event, record_event
+from shared.rune_ledger import append_invocations, build_invocation, record_invocation
 from shared.policy import is_allowed, load_policy
 from shared.stabilization import (
     advisory_cycles,
@@ -63,6 +64,35 @@ def _runtime_fingerprint() -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1)
+def _process_commit() -> str:
+    """Commit of the running code; HEAD moving later does not change what is loaded."""
+    return _git_commit()
+
+
+@lru_cache(maxsize=1)
+def _process_fingerprint() -> tuple[tuple[str, str], ...]:
+    return tuple(sorted(_runtime_fingerprint().items()))
+
+
+def _callsite() -> dict[str, Any]:
+    """First frame outside this module (no source-line reads, unlike inspect.stack())."""
+    try:
+        frame = sys._getframe(1)
+        while frame is not None:
+            filename = frame.f_code.co_filename.replace("\\", "/")
+            if not filename.endswith("/abx/kernel.py"):
+                return {
+                    "file": filename,
+                    "line": frame.f_lineno,
+                    "function": frame.f_code.co_name,
+                }
+            frame = frame.f_back
+    except Exception:
+        pass
+    return {}
+
+
 def _hash_obj(obj: dict[str, Any]) -> str:
     return hashlib.sha256(
         json.dumps(obj, sort_keys=True).encode("utf-8")
@@ -74,253 +104,413 @@ def load_registry() -> dict[str, Any]:
         return json.load(file)
 
 
-def invoke(
-    rune_id: str,
-    payload: dict[str, Any],
-    context: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+class KernelSession:
     """
-    Canonical kernel invocation.
-    All cross-module execution must pass through here.
-    """
-    # Runtime telemetry: capture invocation start time
-    start_ns = time.time_ns()
-    event_base = {
-        "rune_id": rune_id,
-        "ts_ns": start_ns,
-    }
-
-    registry = load_registry()
-    rune = next(
-        (r for r in registry["runes"] if r["rune_id"] == rune_id),
-        None,
-    )
-    if rune is None:
-        raise ValueError(f"Unknown rune_id: {rune_id}")
-
-    policy_doc = load_policy()
-    if not is_allowed(policy_doc, rune_id):
-        raise PermissionError(f"Rune denied by policy: {rune_id}")
-
-    # Payload validation (inputs)
-    spec = payload_schema_for(rune_id)
-    if spec is not None:
-        ok, errs = validate_payload(payload or {}, spec)
-        if not ok:
-            # Runtime telemetry: payload validation rejected
-            emit_event({
-                **event_base,
-                "phase": "reject",
-                "reason": "payload_validation_failed",
-                "errors": errs,
-            })
-            raise ValueError(f"Payload validation failed for {rune_id}: {errs}")
-
-    evidence_mode = rune.get("evidence_mode", "")
-    is_detector = evidence_mode == "detector_only"
-    is_actuator = evidence_mode == "ops_actuator"
-    is_shadow_lane = evidence_mode == "shadow_lane"
-
-    # P0 SECURITY: Shadow metrics access gate (ϟ₇ SSO rune required)
-    if is_shadow_lane:
-        # Check if caller has ϟ₇ SSO rune authorization
-        caller_context = context or {}
-        authorized_runes = caller_context.get("authorized_runes", [])
-
-        if "ϟ₇" not in authorized_runes:
-            raise PermissionError(
-                f"Shadow lane access denied for {rune_id}. "
-                "Requires ϟ₇ (Shadow Structural Observer) rune authorization. "
-                "Shadow metrics are observe-only and must not be accessed directly."
-            )
-
-    stabilization = policy_doc.get("stabilization", {}) or {}
-    required_cycles = int(stabilization.get("required_advisory_cycles", 3))
-    state = load_state()
+    Warm invocation context for the kernel.
 
-    if rune_id == "infra.self_heal":
-        state = bump_advisory_cycle("infra.self_heal", state)
-        save_state(state)
+    Captures the repo commit, runtime fingerprint, rune registry, policy doc
+    and stabilization state once instead of per call. Call invalidate() after
+    any of them changes on disk. invoke_many() buffers the invocation ledger,
+    aAlmanac and runtime-event appends and writes each once per batch.
 
-    if rune_id == "actuator.apply":
-        cycles = advisory_cycles(state, "infra.self_heal")
-        if cycles < required_cycles:
-            raise PermissionError(
-                "Stabilization gate: infra.self_heal "
-                f"cycles={cycles} < required={required_cycles}"
-            )
+    commit and fingerprint may be passed in (e.g. process-wide values) to
+    skip computing them; invalidate() drops them like any captured value.
+    """
 
-    if is_actuator:
-        receipt_id = payload.get("governance_receipt_id")
-        if not receipt_id:
-            raise PermissionError(
-                "Missing governance_receipt_id for actuator rune."
+    def __init__(
+        self,
+        *,
+        commit: str | None = None,
+        fingerprint: tuple[tuple[str, str], ...] | None = None,
+    ) -> None:
+        self._commit = commit
+        self._fingerprint = fingerprint
+        self._registry: dict[str, Any] | None = None
+        self._runes: dict[str, dict[str, Any]] | None = None
+        self._policy: dict[str, Any] | None = None
+        self._state: dict[str, Any] | None = None
+        self._buffer: dict[str, list[dict[str, Any]]] | None = None
+
+    # --- captured context -------------------------------------------------
+
+    @property
+    def commit(self) -> str:
+        if self._commit is None:
+            self._commit = _git_commit()
+        return self._commit
+
+    @property
+    def fingerprint(self) -> tuple[tuple[str, str], ...]:
+        if self._fingerprint is None:
+            self._fingerprint = tuple(sorted(_runtime_fingerprint().items()))
+        return self._fingerprint
+
+    @property
+    def registry(self) -> dict[str, Any]:
+        if self._registry is None:
+            self._registry = load_registry()
+        return self._registry
+
+    def rune(self, rune_id: str) -> dict[str, Any] | None:
+        if self._runes is None:
+            runes: dict[str, dict[str, Any]] = {}
+            for entry in self.registry["runes"]:
+                runes.setdefault(entry["rune_id"], entry)
+            self._runes = runes
+        return self._runes.get(rune_id)
+
+    @property
+    def policy(self) -> dict[str, Any]:
+        if self._policy is None:
+            self._policy = load_policy()
+        return self._policy
+
+    @property
+    def stabilization_state(self) -> dict[str, Any]:
+        if self._state is None:
+            self._state = load_state()
+        return self._state
+
+    def invalidate(
+        self,
+        *,
+        commit: bool = True,
+        registry: bool = True,
+        policy: bool = True,
+        state: bool = True,
+    ) -> None:
+        """Drop captured context so the next invocation reloads it."""
+        if commit:
+            self._commit = None
+            self._fingerprint = None
+        if registry:
+            self._registry = None
+            self._runes = None
+        if policy:
+            self._policy = None
+        if state:
+            self._state = None
+
+    # --- ledger sinks -----------------------------------------------------
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        if self._buffer is None:
+            emit_event(event)
+        else:
+            self._buffer["runtime_events"].append(event)
+
+    def _record(
+        self,
+        *,
+        rune_id: str,
+        payload: dict[str, Any],
+        result: Any,
+        provenance_bundle: dict[str, Any],
+        callsite: dict[str, Any],
+    ) -> None:
+        if self._buffer is None:
+            _ = record_invocation(
+                rune_id=rune_id,
+                payload=payload,
+                provenance_bundle=provenance_bundle,
+                callsite=callsite,
             )
-        receipt = find_receipt(receipt_id)
-        if not receipt:
-            raise PermissionError(
-                "Invalid governance_receipt_id (not found)."
+            _ = record_event(
+                rune_id=rune_id,
+                payload=payload,
+                result=result,
+                provenance_bundle=provenance_bundle,
             )
-        if receipt.get("decision") != "APPROVE":
-            raise PermissionError(
-                "Governance decision is not APPROVE."
+            return
+        self._buffer["invocations"].append(
+            build_invocation(
+                rune_id=rune_id,
+                payload=payload,
+                provenance_bundle=provenance_bundle,
+                callsite=callsite,
             )
-        if receipt.get("action_rune_id") != rune_id:
-            raise PermissionError(
-                "Governance receipt rune mismatch."
+        )
+        self._buffer["almanac"].append(
+            build_event(
+                rune_id=rune_id,
+                payload=payload,
+                result=result,
+                provenance_bundle=provenance_bundle,
             )
+        )
 
-    seed = payload.get("seed")
-    if seed is not None:
-        # deterministic hook (explicit only)
-        import random
+    def _flush(self) -> None:
+        buffer, self._buffer = self._buffer, None
+        if not buffer:
+            return
+        append_invocations(buffer["invocations"])
+        append_events(buffer["almanac"])
+        emit_many(buffer["runtime_events"])
+
+    # --- invocation -------------------------------------------------------
+
+    def invoke_many(
+        self,
+        batch: Iterable[Sequence[Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Invoke a batch of (rune_id, payload[, context]) items in order.
+
+        Ledger and telemetry records are buffered and appended once at the
+        end of the batch (also when an item raises, for the items before it).
+        """
+        if self._buffer is not None:
+            raise RuntimeError("invoke_many is not re-entrant")
+        self._buffer = {"invocations": [], "almanac": [], "runtime_events": []}
+        results: list[dict[str, Any]] = []
+        try:
+            for item in batch:
+                rune_id, payload = item[0], item[1]
+                context = item[2] if len(item) > 2 else None
+                results.append(self.invoke(rune_id, payload, context))
+        finally:
+            self._flush()
+        return results
+
+    def invoke(
+        self,
+        rune_id: str,
+        payload: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Canonical kernel invocation using this session's captured context.
+        """
+        # Runtime telemetry: capture invocation start time
+        start_ns = time.time_ns()
+        event_base = {
+            "rune_id": rune_id,
+            "ts_ns": start_ns,
+        }
+
+        rune = self.rune(rune_id)
+        if rune is None:
+            raise ValueError(f"Unknown rune_id: {rune_id}")
+
+        policy_doc = self.policy
+        if not is_allowed(policy_doc, rune_id):
+            raise PermissionError(f"Rune denied by policy: {rune_id}")
+
+        # Payload validation (inputs)
+        spec = payload_schema_for(rune_id)
+        if spec is not None:
+            ok, errs = validate_payload(payload or {}, spec)
+            if not ok:
+                # Runtime telemetry: payload validation rejected
+                self._emit({
+                    **event_base,
+                    "phase": "reject",
+                    "reason": "payload_validation_failed",
+                    "errors": errs,
+                })
+                raise ValueError(f"Payload validation failed for {rune_id}: {errs}")
+
+        evidence_mode = rune.get("evidence_mode", "")
+        is_detector = evidence_mode == "detector_only"
+        is_actuator = evidence_mode == "ops_actuator"
+        is_shadow_lane = evidence_mode == "shadow_lane"
+
+        # P0 SECURITY: Shadow metrics access gate (ϟ₇ SSO rune required)
+        if is_shadow_lane:
+            # Check if caller has ϟ₇ SSO rune authorization
+            caller_context = context or {}
+            authorized_runes = caller_context.get("authorized_runes", [])
+
+            if "ϟ₇" not in authorized_runes:
+                raise PermissionError(
+                    f"Shadow lane access denied for {rune_id}. "
+                    "Requires ϟ₇ (Shadow Structural Observer) rune authorization. "
+                    "Shadow metrics are observe-only and must not be accessed directly."
+                )
 
-        if isinstance(seed, (dict, list, tuple, set)):
-            seed_value = _hash_obj({"seed": seed})
-        else:
-            seed_value = seed
-        random.seed(seed_value)
+        stabilization = policy_doc.get("stabilization", {}) or {}
+        required_cycles = int(stabilization.get("required_advisory_cycles", 3))
 
-    # Runtime telemetry: invocation started (after validation, before dispatch)
-    emit_event({
-        **event_base,
-        "phase": "invoke_start",
-    })
+        if rune_id == "infra.self_heal":
+            self._state = bump_advisory_cycle("infra.self_heal", self.stabilization_state)
+            save_state(self._state)
 
-    # --- DISPATCH (v0.2: detector purity guarded) ---
-    try:
-        with detector_purity_guard(enabled=is_detector):
-            if rune_id == "abx.doctor":
-                from abx.doctor import run_doctor
-
-                result = run_doctor(payload)
-            elif rune_id == "weather.generate":
-                from abraxas.runes.handlers.weather_generate import generate_weather
-
-                result = generate_weather(payload)
-            elif rune_id == "ser.run":
-                from abraxas.runes.handlers.ser_run import run_scenario_envelope
-
-                result = run_scenario_envelope(payload)
-            elif rune_id == "daemon.ingest":
-                from abraxas.runes.handlers.daemon_ingest import ingest_daemon_plan
-
-                result = ingest_daemon_plan(payload)
-            elif rune_id == "edge.deploy_orin":
-                from abraxas.runes.handlers.edge_deploy_orin import plan_edge_deploy
-
-                result = plan_edge_deploy(payload)
-            elif rune_id == "compression.detect":
-                # Use capability contract
-                ctx = RuneInvocationContext(
-                    run_id=run_id,
-                    subsystem_id="abx.kernel",
-                    git_hash=git_commit
+        if rune_id == "actuator.apply":
+            cycles = advisory_cycles(self.stabilization_state, "infra.self_heal")
+            if cycles < required_cycles:
+                raise PermissionError(
+                    "Stabilization gate: infra.self_heal "
+                    f"cycles={cycles} < required={required_cycles}"
                 )
-                result = invoke_capability(
-                    "compression.detect",
-                    payload,
-                    ctx=ctx,
-                    strict_execution=True
+
+        if is_actuator:
+            receipt_id = payload.get("governance_receipt_id")
+            if not receipt_id:
+                raise PermissionError(
+                    "Missing governance_receipt_id for actuator rune."
+                )
+            receipt = find_receipt(receipt_id)
+            if not receipt:
+                raise PermissionError(
+                    "Invalid governance_receipt_id (not found)."
+                )
+            if receipt.get("decision") != "APPROVE":
+                raise PermissionError(
+                    "Governance decision is not APPROVE."
+                )
+            if receipt.get("action_rune_id") != rune_id:
+                raise PermissionError(
+                    "Governance receipt rune mismatch."
                 )
-            elif rune_id == "infra.self_heal":
-                from infra.self_heal_advisory import generate_plan
 
-                result = generate_plan(payload)
-            elif rune_id == "actuator.apply":
-                from infra.actuator import apply
+        seed = payload.get("seed")
+        if seed is not None:
+            # deterministic hook (explicit only)
+            import random
 
-                result = apply(payload)
+            if isinstance(seed, (dict, list, tuple, set)):
+                seed_value = _hash_obj({"seed": seed})
             else:
-                result = {
-                    "not_computable": {
-                        "reason": "rune wired but not yet routed",
-                        "reason_code": "kernel_route_missing",
-                        "rune_id": rune_id,
-                    },
-                    "status": "not_computable",
+                seed_value = seed
+            random.seed(seed_value)
+
+        # Runtime telemetry: invocation started (after validation, before dispatch)
+        self._emit({
+            **event_base,
+            "phase": "invoke_start",
+        })
+
+        # --- DISPATCH (v0.2: detector purity guarded) ---
+        try:
+            with detector_purity_guard(enabled=is_detector):
+                if rune_id == "abx.doctor":
+                    from abx.doctor import run_doctor
+
+                    result = run_doctor(payload)
+                elif rune_id == "weather.generate":
+                    from abraxas.runes.handlers.weather_generate import generate_weather
+
+                    result = generate_weather(payload)
+                elif rune_id == "ser.run":
+                    from abraxas.runes.handlers.ser_run import run_scenario_envelope
+
+                    result = run_scenario_envelope(payload)
+                elif rune_id == "daemon.ingest":
+                    from abraxas.runes.handlers.daemon_ingest import ingest_daemon_plan
+
+                    result = ingest_daemon_plan(payload)
+                elif rune_id == "edge.deploy_orin":
+                    from abraxas.runes.handlers.edge_deploy_orin import plan_edge_deploy
+
+                    result = plan_edge_deploy(payload)
+                elif rune_id == "compression.detect":
+                    # Use capability contract
+                    ctx = RuneInvocationContext(
+                        run_id=run_id,
+                        subsystem_id="abx.kernel",
+                        git_hash=git_commit
+                    )
+                    result = invoke_capability(
+                        "compression.detect",
+                        payload,
+                        ctx=ctx,
+                        strict_execution=True
+                    )
+                elif rune_id == "infra.self_heal":
+                    from infra.self_heal_advisory import generate_plan
+
+                    result = generate_plan(payload)
+                elif rune_id == "actuator.apply":
+                    from infra.actuator import apply
+
+                    result = apply(payload)
+                else:
+                    result = {
+                        "not_computable": {
+                            "reason": "rune wired but not yet routed",
+                            "reason_code": "kernel_route_missing",
+                            "rune_id": rune_id,
+                        },
+                        "status": "not_computable",
+                    }
+        except Exception as dispatch_error:
+            # Runtime telemetry: invocation failed
+            end_ns = time.time_ns()
+            self._emit({
+                **event_base,
+                "phase": "invoke_error",
+                "duration_ns": end_ns - start_ns,
+                "error_type": type(dispatch_error).__name__,
+                "error": str(dispatch_error),
+            })
+            raise
+
+        # Result validation (outputs) - strict for actuators, soft for detectors
+        r_spec = result_schema_for(rune_id)
+        if r_spec is not None:
+            ok, errs = validate_payload(result or {}, r_spec)
+            if not ok:
+                if is_actuator:
+                    # Strict validation for actuators
+                    raise ValueError(f"Result validation failed for {rune_id}: {errs}")
+                # Soft validation for detectors - log warning
+                # (will be captured in provenance below)
+
+        provenance_bundle = {
+            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "repo_commit": self.commit,
+            "config_sha256": _hash_obj(payload),
+            "runtime_fingerprint": dict(self.fingerprint),
+            "seed": seed,
+        }
+
+        # Add result validation warning for detectors
+        if r_spec is not None and is_detector:
+            ok, errs = validate_payload(result or {}, r_spec)
+            if not ok:
+                provenance_bundle["result_validation_warning"] = {
+                    "rune_id": rune_id,
+                    "errors": errs,
                 }
-    except Exception as dispatch_error:
-        # Runtime telemetry: invocation failed
+
+        callsite = _callsite()
+
+        self._record(
+            rune_id=rune_id,
+            payload=payload,
+            result=result,
+            provenance_bundle=provenance_bundle,
+            callsite=callsite,
+        )
+
+        # Runtime telemetry: invocation completed successfully
         end_ns = time.time_ns()
-        emit_event({
+        self._emit({
             **event_base,
-            "phase": "invoke_error",
+            "phase": "invoke_end",
             "duration_ns": end_ns - start_ns,
-            "error_type": type(dispatch_error).__name__,
-            "error": str(dispatch_error),
+            "result_keys": sorted(list((result or {}).keys())),
         })
-        raise
-
-    # Result validation (outputs) - strict for actuators, soft for detectors
-    r_spec = result_schema_for(rune_id)
-    if r_spec is not None:
-        ok, errs = validate_payload(result or {}, r_spec)
-        if not ok:
-            if is_actuator:
-                # Strict validation for actuators
-                raise ValueError(f"Result validation failed for {rune_id}: {errs}")
-            # Soft validation for detectors - log warning
-            # (will be captured in provenance below)
-
-    provenance_bundle = {
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-        "repo_commit": _git_commit(),
-        "config_sha256": _hash_obj(payload),
-        "runtime_fingerprint": _runtime_fingerprint(),
-        "seed": seed,
-    }
 
-    # Add result validation warning for detectors
-    if r_spec is not None and is_detector:
-        ok, errs = validate_payload(result or {}, r_spec)
-        if not ok:
-            provenance_bundle["result_validation_warning"] = {
-                "rune_id": rune_id,
-                "errors": errs,
-            }
+        return {
+            "rune_id": rune_id,
+            "result": result,
+            "provenance_bundle": provenance_bundle,
+            "context": context,
+        }
 
-    callsite: dict[str, Any] = {}
-    try:
-        stack = inspect.stack()
-        for frame in stack:
-            filename = frame.filename.replace("\\", "/")
-            if not filename.endswith("/abx/kernel.py"):
-                callsite = {
-                    "file": filename,
-                    "line": frame.lineno,
-                    "function": frame.function,
-                }
-                break
-    except Exception:
-        callsite = {}
-
-    _ = record_invocation(
-        rune_id=rune_id,
-        payload=payload,
-        provenance_bundle=provenance_bundle,
-        callsite=callsite,
-    )
-
-    _ = record_event(
-        rune_id=rune_id,
-        payload=payload,
-        result=result,
-        provenance_bundle=provenance_bundle,
-    )
-
-    # Runtime telemetry: invocation completed successfully
-    end_ns = time.time_ns()
-    emit_event({
-        **event_base,
-        "phase": "invoke_end",
-        "duration_ns": end_ns - start_ns,
-        "result_keys": sorted(list((result or {}).keys())),
-    })
 
-    return {
-        "rune_id": rune_id,
-        "result": result,
-        "provenance_bundle": provenance_bundle,
-        "context": context,
-    }
+def invoke(
+    rune_id: str,
+    payload: dict[str, Any],
+    context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Canonical kernel invocation.
+    All cross-module execution must pass through here.
+
+    Registry, policy and stabilization state are read fresh for each call;
+    use KernelSession to keep them warm across many invocations.
+    """
+    session = KernelSession(commit=_process_commit(), fingerprint=_process_fingerprint())
+    return session.invoke(rune_id, payload, context)
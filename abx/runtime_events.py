@@ -9,7 +9,7 @@ from __future__ import annotations
 import json
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
 # Ledger path (append-only JSONL)
@@ -46,3 +46,20 @@ def emit(event: dict[str, Any]) -> None:
     except Exception:
         # Telemetry failures are silent - execution continues
         pass
+
+
+def emit_many(events: Iterable[dict[str, Any]]) -> None:
+    """Append several runtime events with a single write.
+
+    Same guarantees as emit(); used by batched kernel invocation.
+    """
+    try:
+        lines = "".join(_stable(event) + "\n" for event in events)
+        if not lines:
+            return
+        LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(LEDGER_PATH, "a", encoding="utf-8") as f:
+            f.write(lines)
+    except Exception:
+        # Telemetry failures are silent - execution continues
+        pass
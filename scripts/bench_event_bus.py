@@ -0,0 +1,98 @@
+"""Microbenchmark: EventBus publish latency under N subscribers per dispatch mode.
+
+Each subscriber does a fixed amount of work (a short sleep, like a blocking
+forwarder). Reports publisher-side latency per publish and the time until
+every event was delivered.
+
+Usage: python -m scripts.bench_event_bus [--subscribers 1,4,16] [--events 200] [--work-ms 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+from abraxas.events.bus import EventBus
+
+
+def _subscribers(bus: EventBus, n: int, work_s: float) -> None:
+    def handler(payload: Dict[str, Any]) -> None:
+        time.sleep(work_s)
+
+    for _ in range(n):
+        bus.subscribe("oracle", handler)
+
+
+def _summary(latencies: List[float], total_s: float, bus: EventBus) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "publish_mean_us": round(statistics.fmean(ordered) * 1e6, 2),
+        "publish_p99_us": round(ordered[int(0.99 * (len(ordered) - 1))] * 1e6, 2),
+        "delivered_s": round(total_s, 4),
+        "dropped": bus.stats()["dropped"],
+    }
+
+
+def bench_threaded(mode: str, n: int, events: int, work_s: float) -> Dict[str, Any]:
+    bus = EventBus(mode, max_buffer=events)  # type: ignore[arg-type]
+    _subscribers(bus, n, work_s)
+    latencies = []
+    t0 = time.perf_counter()
+    for i in range(events):
+        s = time.perf_counter()
+        bus.publish("oracle", {"i": i})
+        latencies.append(time.perf_counter() - s)
+    bus.close()
+    return _summary(latencies, time.perf_counter() - t0, bus)
+
+
+def bench_async(n: int, events: int, work_s: float) -> Dict[str, Any]:
+    async def run() -> Dict[str, Any]:
+        bus = EventBus("async", max_buffer=events)
+
+        async def handler(payload: Dict[str, Any]) -> None:
+            await asyncio.sleep(work_s)
+
+        for _ in range(n):
+            bus.subscribe("oracle", handler)
+        latencies = []
+        t0 = time.perf_counter()
+        for i in range(events):
+            s = time.perf_counter()
+            bus.publish("oracle", {"i": i})
+            latencies.append(time.perf_counter() - s)
+        await bus.drain()
+        return _summary(latencies, time.perf_counter() - t0, bus)
+
+    return asyncio.run(run())
+
+
+def run_benchmark(subscribers: List[int], events: int, work_ms: float) -> Dict[str, Any]:
+    work_s = work_ms / 1000.0
+    results: Dict[str, Any] = {}
+    for n in subscribers:
+        results[str(n)] = {
+            "sync": bench_threaded("sync", n, events, work_s),
+            "thread": bench_threaded("thread", n, events, work_s),
+            "async": bench_async(n, events, work_s),
+        }
+    return {"events": events, "work_ms": work_ms, "subscribers": results}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="EventBus publish latency microbenchmark")
+    ap.add_argument("--subscribers", default="1,4,16")
+    ap.add_argument("--events", type=int, default=200)
+    ap.add_argument("--work-ms", type=float, default=0.2)
+    args = ap.parse_args()
+    counts = [int(x) for x in args.subscribers.split(",") if x.strip()]
+    print(json.dumps(run_benchmark(counts, args.events, args.work_ms), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,7 +5,7 @@ import hashlib
 import json
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 DEFAULT_LOG_PATH = os.path.join(
     os.path.dirname(__file__), "..", "data", "aAlmanac.jsonl"
@@ -20,22 +20,17 @@ def _stable_json(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
 
 
-def record_event(
+def build_event(
     *,
     rune_id: str,
     payload: Dict[str, Any],
     result: Any,
     provenance_bundle: Dict[str, Any],
     source: Optional[Dict[str, Any]] = None,
-    log_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    Append-only write. Never overwrites. No deletes. No edits.
-    Returns the stored event (including id).
+    Build an almanac event (including id) without writing it.
     """
-    lp = log_path or DEFAULT_LOG_PATH
-    os.makedirs(os.path.dirname(lp), exist_ok=True)
-
     ts = datetime.now(timezone.utc).isoformat()
 
     # Minimal "source" bundle; callers can pass richer info later
@@ -82,8 +77,41 @@ def record_event(
         },
     }
 
-    # JSONL append (one line per event)
+    return event
+
+
+def append_events(events: Iterable[Dict[str, Any]], log_path: Optional[str] = None) -> None:
+    """
+    Append-only write of several events (one JSONL line each) in a single write.
+    """
+    lines = "".join(_stable_json(event) + "\n" for event in events)
+    if not lines:
+        return
+    lp = log_path or DEFAULT_LOG_PATH
+    os.makedirs(os.path.dirname(lp), exist_ok=True)
     with open(lp, "a", encoding="utf-8") as file:
-        file.write(_stable_json(event) + "\n")
+        file.write(lines)
 
+
+def record_event(
+    *,
+    rune_id: str,
+    payload: Dict[str, Any],
+    result: Any,
+    provenance_bundle: Dict[str, Any],
+    source: Optional[Dict[str, Any]] = None,
+    log_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Append-only write. Never overwrites. No deletes. No edits.
+    Returns the stored event (including id).
+    """
+    event = build_event(
+        rune_id=rune_id,
+        payload=payload,
+        result=result,
+        provenance_bundle=provenance_bundle,
+        source=source,
+    )
+    append_events([event], log_path)
     return event
@@ -4,7 +4,7 @@ import hashlib
 import json
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 DEFAULT_PATH = os.path.join(
     os.path.dirname(__file__), "..", "data", "rune_invocations.jsonl"
@@ -19,17 +19,14 @@ def _sha256(data: str) -> str:
     return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
 
-def record_invocation(
+def build_invocation(
     *,
     rune_id: str,
     payload: Dict[str, Any],
     provenance_bundle: Dict[str, Any],
     callsite: Optional[Dict[str, Any]] = None,
-    path: Optional[str] = None,
 ) -> Dict[str, Any]:
-    lp = path or DEFAULT_PATH
-    os.makedirs(os.path.dirname(lp), exist_ok=True)
-
+    """Build an invocation record without writing it."""
     ts = datetime.now(timezone.utc).isoformat()
     core = {
         "timestamp_utc": ts,
@@ -48,8 +45,33 @@ def record_invocation(
         "callsite": callsite or {},
         "provenance_bundle": provenance_bundle,
     }
+    return rec
+
 
+def append_invocations(records: Iterable[Dict[str, Any]], path: Optional[str] = None) -> None:
+    """Append several invocation records with a single write."""
+    lines = "".join(_stable_json(rec) + "\n" for rec in records)
+    if not lines:
+        return
+    lp = path or DEFAULT_PATH
+    os.makedirs(os.path.dirname(lp), exist_ok=True)
     with open(lp, "a", encoding="utf-8") as file:
-        file.write(_stable_json(rec) + "\n")
+        file.write(lines)
 
+
+def record_invocation(
+    *,
+    rune_id: str,
+    payload: Dict[str, Any],
+    provenance_bundle: Dict[str, Any],
+    callsite: Optional[Dict[str, Any]] = None,
+    path: Optional[str] = None,
+) -> Dict[str, Any]:
+    rec = build_invocation(
+        rune_id=rune_id,
+        payload=payload,
+        provenance_bundle=provenance_bundle,
+        callsite=callsite,
+    )
+    append_invocations([rec], path)
     return rec
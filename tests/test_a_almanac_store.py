@@ -0,0 +1,86 @@
+"""Tests for the journaled AAlmanac store."""
+
+from __future__ import annotations
+
+import json
+
+from abraxas.core.provenance import Provenance
+from abraxas.slang.a_almanac_store import AAlmanacStore
+
+
+def _prov() -> Provenance:
+    return Provenance(
+        run_id="test",
+        started_at_utc="2026-01-01T00:00:00Z",
+        inputs_hash="x",
+        config_hash="y",
+    )
+
+
+def _seed(store: AAlmanacStore, n: int) -> list:
+    ids = []
+    for i in range(n):
+        term_id = store.create_entry_if_missing(f"term{i}", "eggcorn", "2026-01-01T00:00:00Z", _prov())
+        for v in (1.0, 2.0):
+            store.append_annotation(term_id, "observation", {"value": v, "source_id": "s"}, _prov())
+        ids.append(term_id)
+    return ids
+
+
+def test_annotations_are_journaled_and_replayed(tmp_path):
+    path = tmp_path / "terms.jsonl"
+    store = AAlmanacStore(storage_path=str(path))
+    ids = _seed(store, 3)
+
+    # Entries file is write-once; updates live in the journal until compaction.
+    base = [json.loads(line) for line in path.read_text().splitlines()]
+    assert all(row["annotations"] == [] for row in base)
+    assert len(path.with_name("terms.jsonl.journal").read_text().splitlines()) == 6
+
+    reloaded = AAlmanacStore(storage_path=str(path))
+    assert reloaded.get_entry_by_term("term1").term_id == ids[1]
+    assert [len(e.annotations) for e in reloaded.load_entries()] == [2, 2, 2]
+    assert reloaded.create_entry_if_missing("term2", "x", "2026-01-01T00:00:00Z", _prov()) == ids[2]
+
+
+def test_bulk_recompute_matches_single_and_persists_once(tmp_path):
+    single = AAlmanacStore(storage_path=str(tmp_path / "a" / "terms.jsonl"))
+    bulk = AAlmanacStore(storage_path=str(tmp_path / "b" / "terms.jsonl"))
+    ids_single = _seed(single, 4)
+    ids_bulk = _seed(bulk, 4)
+
+    now = "2026-01-02T00:00:00Z"
+    expected = [single.compute_current_state(t, run_id="r", current_time_utc=now) for t in ids_single]
+    journal = bulk.journal_path
+    before = len(journal.read_text().splitlines())
+    results = bulk.compute_current_states(ids_bulk + ["missing"], run_id="r", current_time_utc=now)
+    assert list(results) == ids_bulk
+    assert len(journal.read_text().splitlines()) == before + 4
+    for (state, snap), (exp_state, exp_snap) in zip(results.values(), expected):
+        assert state == exp_state
+        assert snap.tau_half_life == exp_snap.tau_half_life
+        assert snap.tau_velocity == exp_snap.tau_velocity
+
+    reloaded = AAlmanacStore(storage_path=str(bulk.storage_path))
+    entry = reloaded.get_entry(ids_bulk[0])
+    assert entry.tau_snapshot["observation_count"] == 2
+
+
+def test_compaction_folds_journal_and_replay_is_idempotent(tmp_path):
+    path = tmp_path / "terms.jsonl"
+    store = AAlmanacStore(storage_path=str(path), compact_threshold=5)
+    ids = _seed(store, 3)
+    store.compute_current_states(ids)
+    store.compact()
+    assert not store.journal_path.exists()
+    base = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [len(row["annotations"]) for row in base] == [2, 2, 2]
+    assert all(row["tau_snapshot"] is not None for row in base)
+
+    # A journal left behind by an interrupted compaction must not double-apply.
+    store.append_annotation(ids[0], "observation", {"value": 3.0}, _prov())
+    journal = store.journal_path.read_text()
+    store._rewrite_storage()
+    store.journal_path.write_text(journal)
+    reloaded = AAlmanacStore(storage_path=str(path))
+    assert len(reloaded.get_entry(ids[0]).annotations) == 3
@@ -6,7 +6,7 @@ import tempfile
 from pathlib import Path
 import json
 
-from abraxas.runtime.artifacts import ArtifactWriter, ArtifactRecord
+from abraxas.runtime.artifacts import ArtifactWriter, ArtifactRecord, read_manifest
 
 
 def test_artifact_writer_basic():
@@ -219,3 +219,47 @@ def test_artifact_writer_sha256_differs_on_change():
 
         # Different content → different hash
         assert rec1.sha256 != rec2.sha256
+
+
+def _write_mixed_ticks(aw: ArtifactWriter, run_id: str) -> None:
+    for tick, kind in [(2, "b"), (0, "b"), (1, "a"), (0, "a"), (2, "a")]:
+        aw.write_json(
+            run_id=run_id,
+            tick=tick,
+            kind=kind,
+            schema="Test.v0",
+            obj={"tick": tick, "kind": kind},
+            rel_path=f"{kind}/{tick:06d}.json",
+            extra={"z": 1, "a": 2},
+        )
+
+
+def test_artifact_writer_journal_mode_matches_rewrite_bytes():
+    """Journal mode materializes the same Manifest.v0 bytes as rewrite mode."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manifest_path = Path(tmpdir) / "manifests" / "TEST-007.manifest.json"
+
+        _write_mixed_ticks(ArtifactWriter(tmpdir), "TEST-007")
+        rewrite_bytes = manifest_path.read_bytes()
+        manifest_path.unlink()
+
+        with ArtifactWriter(tmpdir, manifest_mode="journal") as aw:
+            _write_mixed_ticks(aw, "TEST-007")
+            assert not manifest_path.exists()
+            assert read_manifest(tmpdir, "TEST-007") == json.loads(rewrite_bytes)
+
+        assert manifest_path.read_bytes() == rewrite_bytes
+        assert not (Path(tmpdir) / "manifests" / "TEST-007.manifest.jsonl").exists()
+
+
+def test_artifact_writer_journal_finalize_mid_run_is_idempotent():
+    """Finalizing mid-run and continuing does not duplicate records."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        aw = ArtifactWriter(tmpdir, manifest_mode="journal")
+        aw.write_json(run_id="TEST-008", tick=1, kind="t", schema="Test.v0", obj={}, rel_path="1.json")
+        aw.finalize_manifest("TEST-008")
+        aw.write_json(run_id="TEST-008", tick=0, kind="t", schema="Test.v0", obj={}, rel_path="0.json")
+        aw.close()
+
+        manifest = read_manifest(tmpdir, "TEST-008")
+        assert [r["tick"] for r in manifest["records"]] == [0, 1]
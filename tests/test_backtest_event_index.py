@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from abraxas.backtest.event_index import SparseTimeIndex
+from abraxas.backtest.event_query import load_domain_ledgers, load_signal_events
+
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(hours: int) -> str:
+    return (BASE + timedelta(hours=hours)).isoformat().replace("+00:00", "Z")
+
+
+def _write_events(path: Path, hours: range, source: str) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        for h in hours:
+            f.write(json.dumps({"event_id": f"{source}-{h}", "timestamp": _ts(h), "text": "t", "source": source}) + "\n")
+
+
+def _ids(events) -> list[str]:
+    return [e.event_id for e in events]
+
+
+def test_indexed_event_window_matches_full_scan(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_events(path, range(0, 2000), "a")
+    _write_events(path, range(0, 2000, 7), "b")
+    with path.open("a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    t0, t1 = BASE + timedelta(hours=500), BASE + timedelta(hours=900)
+    for labels in (None, ["b"], ["zzz"]):
+        indexed = load_signal_events(t0, t1, source_labels=labels, events_path=path)
+        full = load_signal_events(t0, t1, source_labels=labels, events_path=path, use_index=False)
+        assert _ids(indexed) == _ids(full)
+    assert (tmp_path / "events.jsonl.tidx.json").exists()
+
+
+def test_index_extends_incrementally_and_rebuilds_on_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_events(path, range(0, 600), "a")
+    index = SparseTimeIndex(path, source_field="source")
+    index.refresh()
+    first_blocks = len(index.blocks)
+
+    _write_events(path, range(600, 1200), "a")
+    index.refresh()
+    assert len(index.blocks) > first_blocks
+    assert index.indexed_bytes == path.stat().st_size
+
+    path.write_text("", encoding="utf-8")
+    _write_events(path, range(5000, 5010), "c")
+    t0, t1 = BASE + timedelta(hours=5000), BASE + timedelta(hours=5005)
+    assert _ids(load_signal_events(t0, t1, events_path=path)) == [f"c-{h}" for h in range(5000, 5006)]
+
+
+def test_indexed_ledger_window_matches_full_scan(tmp_path: Path) -> None:
+    ledger_dir = tmp_path / "ledgers"
+    ledger_dir.mkdir()
+    with (ledger_dir / "tau_ledger.jsonl").open("w", encoding="utf-8") as f:
+        for h in range(1500):
+            f.write(json.dumps({"timestamp": _ts(h), "tau": h}) + "\n")
+        f.write(json.dumps({"timestamp": "garbage", "tau": -1}) + "\n")
+
+    t0, t1 = BASE + timedelta(hours=100), BASE + timedelta(hours=140)
+    indexed = load_domain_ledgers(t0, t1, ledger_dir=ledger_dir)
+    full = load_domain_ledgers(t0, t1, ledger_dir=ledger_dir, use_index=False)
+    assert indexed == full
+    assert [e["tau"] for e in indexed["tau"]] == list(range(100, 141))
+
+
+def test_lone_carriage_returns_split_lines_like_text_mode(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_events(path, range(0, 300), "a")
+    rows = [json.dumps({"event_id": f"cr-{h}", "timestamp": _ts(h), "text": "t", "source": "a"}) for h in range(100, 106)]
+    with path.open("ab") as f:
+        f.write("\r".join(rows[:3]).encode() + b"\n" + "\r\n".join(rows[3:]).encode() + b"\r\n")
+
+    t0, t1 = BASE + timedelta(hours=98), BASE + timedelta(hours=104)
+    with path.open("r", encoding="utf-8") as f:
+        expected = [
+            d["event_id"]
+            for d in (json.loads(line) for line in f if line.strip())
+            if t0 <= datetime.fromisoformat(d["timestamp"].replace("Z", "+00:00")) <= t1
+        ]
+    assert {"cr-100", "cr-104"} <= set(expected)
+    for use_index in (True, False):
+        assert sorted(_ids(load_signal_events(t0, t1, events_path=path, use_index=use_index))) == sorted(expected)
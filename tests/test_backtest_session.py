@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from abraxas.backtest.evaluator import evaluate_case
+from abraxas.backtest.event_query import load_domain_ledgers, load_signal_events
+from abraxas.backtest.schema import BacktestCase
+from abraxas.backtest.session import BacktestSession
+
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(hours: int, offset: str = "Z") -> str:
+    ts = (BASE + timedelta(hours=hours)).isoformat()
+    return ts.replace("+00:00", offset) if offset == "Z" else ts
+
+
+def _write_fixture(root: Path) -> None:
+    signals = root / "data" / "signals"
+    signals.mkdir(parents=True)
+    with (signals / "events.jsonl").open("w", encoding="utf-8") as f:
+        for h in range(0, 400):
+            text = "digital shift" if h % 5 == 0 else "noise"
+            f.write(json.dumps({"event_id": f"e{h % 7}", "timestamp": _ts(h), "text": text, "source": "OSH"}) + "\n")
+        f.write("not json\n")
+    ledgers = root / "out" / "temporal_ledgers"
+    ledgers.mkdir(parents=True)
+    with (ledgers / "integrity_ledger.jsonl").open("w", encoding="utf-8") as f:
+        for h in range(399, -1, -3):
+            # Mixed "Z"/"+00:00" spellings: string order differs from time order.
+            f.write(json.dumps({"timestamp": _ts(h, "Z" if h % 2 else "+"), "SSI": 0.1, "vector": "v", "score": 0.6}) + "\n")
+        f.write(json.dumps({"timestamp": "garbage"}) + "\n")
+    with (ledgers / "tau_ledger.jsonl").open("w", encoding="utf-8") as f:
+        for h in range(0, 400, 10):
+            f.write(json.dumps({"timestamp": _ts(h), "velocity_delta": 0.05 * (h % 4)}) + "\n")
+
+
+def _case(i: int, start: int, hours: int) -> BacktestCase:
+    return BacktestCase(
+        case_id=f"case_{i:02d}",
+        created_at=BASE,
+        description="session test",
+        forecast_ref={"run_id": "r", "artifact_path": "a", "tier": "analyst"},
+        evaluation_window={"start_ts": BASE + timedelta(hours=start), "end_ts": BASE + timedelta(hours=start + hours)},
+        triggers={
+            "any_of": [{"kind": "term_seen", "params": {"term": "digital", "min_count": 3 + i % 4}}],
+            "all_of": [{"kind": "tau_shift", "params": {"min_velocity_delta": 0.1}}],
+        },
+        guardrails={"min_signal_count": 40 if i % 3 == 0 else 5},
+        scoring={"type": "binary", "weights": {"trigger": 1.0}},
+        provenance={"required_ledgers": ["integrity_ledger.jsonl", "tau.jsonl"]},
+    )
+
+
+def _dump(result) -> dict:
+    data = result.model_dump()
+    data.pop("evaluated_at")  # wall clock
+    return data
+
+
+@pytest.fixture
+def fixture_root(tmp_path, monkeypatch):
+    _write_fixture(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_window_slices_match_loaders(fixture_root):
+    session = BacktestSession()
+    for start, hours in ((0, 24), (37, 100), (390, 50), (1000, 5)):
+        t0, t1 = BASE + timedelta(hours=start), BASE + timedelta(hours=start + hours)
+        expected_events = load_signal_events(t0, t1)
+        got_events = session.events_in(t0, t1)
+        assert [(e.event_id, e.timestamp) for e in got_events] == [(e.event_id, e.timestamp) for e in expected_events]
+        assert session.ledgers_in(t0, t1) == load_domain_ledgers(t0, t1)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_session_results_match_per_case_evaluation(fixture_root, workers):
+    cases = [_case(i, start=(i * 37) % 350, hours=24 + 12 * (i % 5)) for i in range(12)]
+    expected = [evaluate_case(case, run_id="t") for case in cases]
+    with BacktestSession(workers=workers) as session:
+        got = session.evaluate_cases(cases, run_id="t")
+        again = session.evaluate_cases(list(reversed(cases)), run_id="t")
+    assert [_dump(r) for r in got] == [_dump(r) for r in expected]
+    assert [r.case_id for r in again] == [c.case_id for c in reversed(cases)]
+    assert len({r.status for r in got}) > 1
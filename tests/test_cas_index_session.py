@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from abraxas.storage.cas import (
+    CASIndexSession,
+    cas_exists,
+    cas_exists_many,
+    cas_get_bytes,
+    cas_put_bytes,
+    cas_put_many,
+    close_cas_index_sessions,
+)
+from abraxas.storage.hashes import stable_hash_bytes
+
+
+@pytest.fixture()
+def cas_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("ABRAXAS_ROOT", str(tmp_path))
+    yield tmp_path
+    close_cas_index_sessions()
+
+
+def test_cas_put_many_round_trip(cas_root: Path) -> None:
+    blobs = [f"packet-{idx}".encode("utf-8") for idx in range(25)]
+    paths = cas_put_many("packets", blobs, "SRC", timestamp_utc="2025-03-01T00:00:00Z")
+
+    assert [path.read_bytes() for path in paths] == blobs
+    for blob in blobs:
+        assert cas_get_bytes(stable_hash_bytes(blob)) == blob
+
+
+def test_cas_exists_many_reports_each_hash(cas_root: Path) -> None:
+    cas_put_bytes("raw", b"present", "SRC")
+    present = stable_hash_bytes(b"present")
+    missing = stable_hash_bytes(b"missing")
+
+    assert cas_exists_many([present, missing]) == {present: True, missing: False}
+    assert cas_exists(present)
+    assert not cas_exists(missing)
+
+
+def test_cas_reads_before_index_exists_do_not_create_it(cas_root: Path) -> None:
+    assert cas_get_bytes("0" * 64) is None
+    assert cas_exists_many(["0" * 64]) == {"0" * 64: False}
+    assert not (cas_root / "data" / "cas" / "index" / "cas_index.db").exists()
+
+
+def test_cas_index_session_batches_commits_visible_to_other_connections(tmp_path: Path) -> None:
+    index_path = tmp_path / "index" / "cas_index.db"
+    rows = [
+        (f"{idx:064x}", "raw", "SRC", None, None, "bin", "2025-01-01T00:00:00Z", 1, "{}")
+        for idx in range(7)
+    ]
+    with CASIndexSession(index_path, batch_size=3) as session:
+        assert session.add_many(rows) == 7
+
+    conn = sqlite3.connect(str(index_path))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("SELECT COUNT(*) FROM cas_entries").fetchone()[0] == 7
+    finally:
+        conn.close()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from abraxas.core.canonical import canonical_json
+from abraxas.storage.cas import CASStore
+
+
+def test_lookup_url_returns_latest_entry(tmp_path: Path) -> None:
+    store = CASStore(base_dir=tmp_path / "cas")
+    url = "https://example.com/a"
+    store.store_bytes(b"first", url=url, recorded_at_utc="2025-01-01T00:00:00Z")
+    second = store.store_bytes(b"second", url=url, recorded_at_utc="2025-01-02T00:00:00Z")
+
+    entry = store.lookup_url(url)
+    assert entry is not None
+    assert entry.content_hash == second.content_hash
+    assert entry.recorded_at_utc == "2025-01-02T00:00:00Z"
+    assert store.lookup_url("https://example.com/missing") is None
+
+
+def test_lookup_urls_bulk_matches_single_lookups(tmp_path: Path) -> None:
+    store = CASStore(base_dir=tmp_path / "cas")
+    urls = [f"https://example.com/{idx}" for idx in range(20)]
+    for idx, url in enumerate(urls):
+        store.store_bytes(f"payload-{idx}".encode("utf-8"), url=url)
+
+    resolved = store.lookup_urls(urls + ["https://example.com/missing"])
+    assert resolved["https://example.com/missing"] is None
+    for url in urls:
+        assert resolved[url] == store.lookup_url(url)
+
+
+def test_url_index_catches_up_with_external_appends(tmp_path: Path) -> None:
+    store = CASStore(base_dir=tmp_path / "cas")
+    store.store_bytes(b"one", url="https://example.com/one")
+    assert store.lookup_url("https://example.com/one") is not None
+
+    # A writer that bypasses the sidecar (e.g. an older process) appends directly.
+    external = {
+        "url": "https://example.com/two",
+        "content_hash": "abc",
+        "path": "/tmp/abc.bin",
+        "subdir": "raw",
+        "suffix": ".bin",
+        "recorded_at_utc": None,
+        "meta": {},
+    }
+    with store.index_path.open("a", encoding="utf-8") as f:
+        f.write(canonical_json(external) + "\n")
+
+    entry = store.lookup_url("https://example.com/two")
+    assert entry is not None
+    assert entry.content_hash == "abc"
+
+
+def test_rebuild_url_index_from_existing_jsonl(tmp_path: Path) -> None:
+    store = CASStore(base_dir=tmp_path / "cas")
+    store.store_bytes(b"one", url="https://example.com/one")
+    store.store_bytes(b"two", url="https://example.com/two")
+    store.url_index_path.unlink(missing_ok=True)
+
+    assert store.rebuild_url_index() == 2
+    assert store.lookup_url("https://example.com/two") is not None
+
+
+def test_url_index_rebuilds_after_jsonl_rewrite(tmp_path: Path) -> None:
+    store = CASStore(base_dir=tmp_path / "cas")
+    store.store_bytes(b"one", url="https://example.com/one")
+    store.store_bytes(b"two", url="https://example.com/two")
+
+    lines = store.index_path.read_text(encoding="utf-8").splitlines()
+    store.index_path.write_text(lines[1] + "\n", encoding="utf-8")
+
+    assert store.lookup_url("https://example.com/one") is None
+    assert store.lookup_url("https://example.com/two") is not None
+
+
+def test_url_index_rebuilds_after_same_size_rewrite(tmp_path: Path) -> None:
+    store = CASStore(base_dir=tmp_path / "cas")
+    store.store_bytes(b"one", url="https://example.com/aaa")
+    assert store.lookup_url("https://example.com/aaa") is not None
+
+    text = store.index_path.read_text(encoding="utf-8")
+    store.index_path.write_text(text.replace("example.com/aaa", "example.com/bbb"), encoding="utf-8")
+
+    assert store.lookup_url("https://example.com/aaa") is None
+    assert store.lookup_url("https://example.com/bbb") is not None
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import random
+
+from abraxas.memetic.claim_cluster import candidate_pairs, cluster_claims
+
+
+def _random_items(rng: random.Random, n: int) -> list[dict]:
+    vocab = [f"term{i:03d}" for i in range(80)]
+    return [{"claim": " ".join(rng.sample(vocab, rng.randint(0, 9)))} for _ in range(n)]
+
+
+def test_blocking_matches_all_pairs_clustering() -> None:
+    rng = random.Random(11)
+    for threshold in (0.0, 0.25, 0.42, 0.7, 1.0):
+        items = _random_items(rng, 120)
+        assert cluster_claims(items, sim_threshold=threshold) == cluster_claims(
+            items, sim_threshold=threshold, blocking=False
+        )
+
+
+def test_blocking_has_no_pair_cap() -> None:
+    items = [{"claim": f"shared anchor words number{i}"} for i in range(800)]
+    clusters, metrics = cluster_claims(items, sim_threshold=0.42, max_pairs=10)
+    assert metrics.n_clusters == 1
+    assert len(clusters[0]) == 800
+
+    _, capped = cluster_claims(items, sim_threshold=0.42, max_pairs=10, blocking=False)
+    assert capped.n_clusters > 1
+
+
+def test_candidate_pairs_skip_disjoint_claims() -> None:
+    tokens = [{"alpha", "beta"}, {"gamma", "delta"}, {"alpha", "beta", "omega"}]
+    assert candidate_pairs(tokens, 0.42) == [(0, 2)]
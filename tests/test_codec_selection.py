@@ -0,0 +1,133 @@
+"""Tests for sampled codec selection and cached compressors."""
+
+from __future__ import annotations
+
+import collections
+import json
+import math
+import os
+import random
+
+import pytest
+
+from abraxas.storage import compress
+from abraxas.storage.compress import CompressionChoice, choose_codec, compress_bytes, decompress_bytes
+from abraxas.storage.entropy import estimate_entropy, estimate_repetition, sample_segments
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    compress.clear_codec_caches()
+    yield
+    compress.clear_codec_caches()
+
+
+def _reference_entropy(data: bytes) -> float:
+    counts = collections.Counter(data)
+    return -sum((c / len(data)) * math.log2(c / len(data)) for c in counts.values())
+
+
+def test_entropy_matches_histogram_reference():
+    rng = random.Random(7)
+    data = bytes(rng.randrange(40) for _ in range(5000))
+    assert estimate_entropy(data) == pytest.approx(_reference_entropy(data), abs=1e-12)
+    assert estimate_entropy(b"") == 0.0
+    assert estimate_entropy(b"aaaa") == 0.0
+
+
+def test_sampled_repetition_is_exact_within_budget_and_deterministic():
+    rng = random.Random(3)
+    small = bytes(rng.randrange(256) for _ in range(4000)) * 2
+    assert estimate_repetition(small, sample_bytes=64 * 1024) == estimate_repetition(small)
+
+    big = (b"header:" + bytes(rng.randrange(256) for _ in range(2000))) * 2000
+    first = estimate_repetition(big, sample_bytes=16 * 1024)
+    assert first == estimate_repetition(big, sample_bytes=16 * 1024)
+    assert first > 0.3
+
+
+def test_sample_segments_cover_both_ends():
+    data = bytes(range(256)) * 1000
+    parts = sample_segments(data, sample_bytes=1024, segments=4)
+    assert len(parts) == 4 and all(len(p) == 256 for p in parts)
+    assert parts[0] == data[:256]
+    assert parts[-1] == data[-256:]
+
+
+def test_choose_codec_caches_tuning_ir(tmp_path, monkeypatch):
+    perf_dir = tmp_path / ".aal" / "tuning" / "perf"
+    perf_dir.mkdir(parents=True)
+    (perf_dir / "ir.json").write_text("{}", encoding="utf-8")
+    active = perf_dir / "ACTIVE.json"
+    active.write_text(json.dumps({"manifest_path": "ir.json"}), encoding="utf-8")
+    monkeypatch.setenv("ABRAXAS_ROOT", str(tmp_path))
+
+    loads = []
+
+    class _Knobs:
+        zstd_level_cold = 7
+
+    class _IR:
+        knobs = _Knobs()
+
+    def fake_load():
+        loads.append(1)
+        return _IR()
+
+    monkeypatch.setattr(compress, "load_active_tuning_ir", fake_load)
+    data = b"some moderately repetitive text " * 50
+    for _ in range(5):
+        assert choose_codec(data).level == 7
+    assert len(loads) == 1
+
+    manifest = perf_dir / "ir.json"
+    manifest.write_text('{"changed": true}', encoding="utf-8")
+    os.utime(manifest, ns=(1, 1))
+    choose_codec(data)
+    assert len(loads) == 2
+
+
+def test_zstd_compressor_and_dictionary_are_reused(tmp_path):
+    zstd = pytest.importorskip("zstandard")
+    samples = [f"record-{i} alpha beta gamma delta {i % 7}".encode() for i in range(400)]
+    dict_path = tmp_path / "d.zstdict"
+    dict_path.write_bytes(zstd.train_dictionary(1024, samples).as_bytes())
+
+    choice = CompressionChoice(codec="zstd", level=3, dict_path=dict_path, reason="test")
+    payload = b"record-1 alpha beta gamma delta 1"
+    out1 = compress_bytes(payload, choice)
+    out2 = compress_bytes(payload, choice)
+    assert out1 == out2
+    assert len(compress._ZSTD_DICTS) == 1
+    assert compress._zstd_compressor(zstd, 3, dict_path) is compress._zstd_compressor(zstd, 3, dict_path)
+
+    plain = CompressionChoice(codec="zstd", level=3, dict_path=None, reason="test")
+    assert decompress_bytes(compress_bytes(payload, plain), "zstd") == payload
+
+
+def test_clear_codec_caches_reaches_other_threads():
+    import threading
+
+    class _FakeZstd:
+        class ZstdCompressor:
+            def __init__(self, level, dict_data=None):
+                self.level = level
+
+    built = {}
+    go, cleared, done = threading.Event(), threading.Event(), threading.Event()
+
+    def worker():
+        built["before"] = compress._zstd_compressor(_FakeZstd, 3, None)
+        go.set()
+        cleared.wait(5)
+        built["after"] = compress._zstd_compressor(_FakeZstd, 3, None)
+        done.set()
+
+    t = threading.Thread(target=worker)
+    t.start()
+    go.wait(5)
+    compress.clear_codec_caches()
+    cleared.set()
+    done.wait(5)
+    t.join()
+    assert built["after"] is not built["before"]
@@ -0,0 +1,125 @@
+"""Tests for the cycle runner step DAG."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from abx import cycle_dag
+from abx.cycle_dag import ArtifactCache, CycleStep, plan_dependencies, run_steps
+
+
+_STEP_MODULE = '''
+import json, sys, time
+
+def _read_jsonl(path):
+    raise AssertionError("in-process steps read through the cycle cache")
+
+def main():
+    delay, out = float(sys.argv[1]), sys.argv[2]
+    time.sleep(delay)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write(sys.argv[0] + "\\n")
+    print("done", sys.argv[0])
+    return 3 if out == "f.out" else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+'''
+
+
+@pytest.fixture
+def fake_modules(tmp_path, monkeypatch):
+    for name in ("cycfake_a", "cycfake_b", "cycfake_c", "cycfake_fail"):
+        (tmp_path / f"{name}.py").write_text(_STEP_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(tmp_path), *sys.path]))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_plan_dependencies_preserves_sequential_conflicts():
+    steps = [
+        CycleStep("reader", "m", reads=("report_*",), writes=("a",)),
+        CycleStep("writer", "m", reads=("ledger",), writes=("report_*",)),
+        CycleStep("independent", "m", reads=("other",), writes=("b",)),
+        CycleStep("consumer", "m", reads=("a", "b"), writes=("c",)),
+        CycleStep("rewriter", "m", writes=("c",)),
+    ]
+    deps = plan_dependencies(steps)
+    assert deps[0] == set()
+    assert deps[1] == {0}  # write-after-read
+    assert deps[2] == set()
+    assert deps[3] == {0, 2}  # read-after-write
+    assert deps[4] == {3}  # write-after-write
+
+
+@pytest.mark.parametrize("inprocess", [False, True])
+def test_parallel_run_logs_in_step_order(fake_modules, inprocess):
+    steps = [
+        CycleStep("a", "cycfake_a", ["0.3", "a.out"], writes=("x",)),
+        CycleStep("b", "cycfake_b", ["0.0", "b.out"], writes=("y",)),
+        CycleStep("c", "cycfake_c", lambda: ["0.0", "c.out"], reads=("x",)),
+        CycleStep("missing", "cycfake_missing_module"),
+        CycleStep("fail", "cycfake_fail", ["0.0", "f.out"]),
+    ]
+    log: list = []
+    oks = run_steps(steps, log, workers=3, inprocess=inprocess)
+
+    assert [e["step"] for e in log] == ["a", "b", "c", "missing", "fail"]
+    assert oks == [True, True, True, False, False]
+    assert log[0]["cmd"] == ["python", "-m", "cycfake_a", "0.3", "a.out"]
+    assert "done" in log[0]["output"]
+    assert log[3]["skipped"] is True and log[3]["reason"] == "module_missing"
+    assert log[4]["code"] == 3 and log[4]["ok"] is False
+    # c depended on a's artifact, so it started after a finished.
+    assert os.path.getmtime(fake_modules / "c.out") >= os.path.getmtime(fake_modules / "a.out")
+
+
+def test_sequential_run_matches_original_log_shape(fake_modules):
+    log: list = []
+    run_steps([CycleStep("a", "cycfake_a", ["0.0", "a.out"])], log)
+    assert set(log[0]) == {"ts", "step", "cmd", "code", "ok", "output", "duration_ms"}
+
+
+def test_artifact_cache_jsonl_tail_and_rewrite(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    path.write_text('{"a": 1}\n\n[1]\nnot json\n', encoding="utf-8")
+    cache = ArtifactCache()
+    assert cache.read_jsonl(str(path)) == [{"a": 1}]
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"a": 2}\n{"a": 3')
+    assert cache.read_jsonl(str(path)) == [{"a": 1}, {"a": 2}]
+    with path.open("a", encoding="utf-8") as f:
+        f.write("}\n")
+    assert cache.read_jsonl(str(path)) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+    path.write_text('{"b": 1}\n', encoding="utf-8")
+    assert cache.read_jsonl(str(path)) == [{"b": 1}]
+    assert cache.read_jsonl(str(tmp_path / "absent.jsonl")) == []
+
+
+def test_artifact_cache_json_returns_fresh_dicts(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_text(json.dumps({"k": 1}), encoding="utf-8")
+    cache = ArtifactCache()
+    first = cache.read_json(str(path))
+    first["k"] = 2
+    assert cache.read_json(str(path)) == {"k": 1}
+    assert cache.hits == 1
+    (tmp_path / "list.json").write_text("[]", encoding="utf-8")
+    assert cache.read_json(str(tmp_path / "list.json")) == {}
+    assert cache.read_json(str(tmp_path / "absent.json")) == {}
+
+
+def test_inprocess_restores_module_readers(fake_modules):
+    import cycfake_a
+
+    original = cycfake_a._read_jsonl
+    code, _ = cycle_dag._run_inprocess("cycfake_a", ["0.0", "a.out"])
+    assert code == 0
+    assert cycfake_a._read_jsonl is original
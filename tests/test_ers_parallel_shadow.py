@@ -0,0 +1,61 @@
+import threading
+
+from abraxas.ers import Budget, DeterministicScheduler
+from abraxas.ers.bindings import bind_callable
+from abraxas.ers.trace import canonicalize_trace
+
+
+def _build(shadow_workers, log, barrier=None):
+    s = DeterministicScheduler(shadow_workers=shadow_workers)
+
+    def f(ctx):
+        log.append("forecast")
+        return "F"
+
+    def task(tag):
+        def fn(ctx):
+            if barrier is not None:
+                barrier.wait()
+            log.append(tag)
+            return tag
+        return fn
+
+    def boom(ctx):
+        raise RuntimeError("shadow failed")
+
+    s.add(bind_callable(name="f", lane="forecast", priority=0, cost_ops=1, fn=f))
+    for i in range(4):
+        s.add(bind_callable(name=f"s{i}", lane="shadow", priority=i, cost_ops=1, fn=task(f"s{i}")))
+    s.add(bind_callable(name="s_err", lane="shadow", priority=5, cost_ops=1, fn=boom))
+    # Exceeds the remaining shadow budget: skipped, never attempted.
+    s.add(bind_callable(name="s_big", lane="shadow", priority=6, cost_ops=5, fn=task("s_big")))
+    return s
+
+
+def _run(s):
+    return s.run_tick(
+        tick=3,
+        budget_forecast=Budget(ops=5, entropy=0),
+        budget_shadow=Budget(ops=6, entropy=0),
+        context={},
+    )
+
+
+def test_parallel_shadow_matches_serial_output():
+    serial = _run(_build(1, []))
+    log = []
+    # Each shadow task waits until all four are running; run back to back
+    # they would break the barrier and error out.
+    barrier = threading.Barrier(4, timeout=5)
+    parallel = _run(_build(4, log, barrier))
+
+    assert canonicalize_trace(parallel["trace"]) == canonicalize_trace(serial["trace"])
+    assert parallel["results"] == serial["results"]
+    assert parallel["remaining"] == serial["remaining"]
+    assert parallel["results"]["s_err"].status == "error"
+    assert parallel["results"]["s_big"].status == "skipped_budget"
+
+    # Forecast lane completes before any shadow task starts.
+    assert log[0] == "forecast"
+    assert "s_big" not in log
+    assert not barrier.broken
@@ -0,0 +1,187 @@
+"""Tests for EventBus buffered dispatch modes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from abraxas.events.bus import EventBus
+
+
+def test_sync_mode_is_unchanged_and_batch_handlers_get_singletons():
+    bus = EventBus()
+    seen, batches = [], []
+    bus.subscribe("a", seen.append)
+    bus.subscribe_batch("a", batches.append)
+    bus.publish("a", {"i": 1})
+    assert seen == [{"i": 1}]
+    assert batches == [[{"i": 1}]]
+
+
+def test_thread_mode_returns_before_handlers_and_keeps_topic_order():
+    bus = EventBus("thread", max_batch=8, workers=4)
+    entered = threading.Event()
+    release = threading.Event()
+    seen = {"a": [], "b": []}
+
+    def slow(payload):
+        entered.set()
+        release.wait(5)
+        seen["a"].append(payload["i"])
+
+    bus.subscribe("a", slow)
+    bus.subscribe("b", lambda p: seen["b"].append(p["i"]))
+
+    for i in range(50):
+        bus.publish("a", {"i": i})
+        bus.publish("b", {"i": i})
+    # All publishes returned while the first handler is still blocked.
+    assert entered.wait(5)
+    assert seen["a"] == []
+
+    # Topic b is not held up by topic a's blocked handler.
+    deadline = time.time() + 5
+    while len(seen["b"]) < 50 and time.time() < deadline:
+        time.sleep(0.01)
+    assert seen["b"] == list(range(50))
+    assert seen["a"] == []
+
+    release.set()
+    assert bus.flush(timeout=5)
+    assert seen["a"] == list(range(50))
+    stats = bus.stats()
+    assert stats["published"] == 100 and stats["delivered"] == 100
+    bus.close()
+
+
+def test_thread_mode_batches_and_bounded_buffer():
+    bus = EventBus("thread", max_buffer=5, max_batch=3, workers=1)
+    gate = threading.Event()
+    batches = []
+    bus.subscribe("warm", lambda p: gate.wait(5))
+    bus.subscribe_batch("t", lambda b: batches.append([p["i"] for p in b]))
+
+    # Occupy the single worker so "t" events pile up in their buffer.
+    bus.publish("warm", {})
+    for i in range(12):
+        bus.publish("t", {"i": i})
+    gate.set()
+    assert bus.flush(timeout=5)
+
+    flat = [i for b in batches for i in b]
+    assert flat == list(range(7, 12))
+    assert all(len(b) <= 3 for b in batches)
+    assert bus.stats()["dropped"] == 7
+    bus.close()
+
+
+def test_handler_errors_are_reported_not_raised(capsys):
+    bus = EventBus("thread")
+    bus.subscribe("a", lambda p: 1 / 0)
+    bus.publish("a", {})
+    assert bus.flush(timeout=5)
+    assert "Error in event handler for a" in capsys.readouterr().out
+    bus.close()
+
+
+def test_async_mode_awaits_coroutine_handlers_in_order():
+    async def scenario():
+        bus = EventBus("async", max_batch=4)
+        seen, batches = [], []
+
+        async def handler(payload):
+            await asyncio.sleep(0)
+            seen.append(payload["i"])
+
+        bus.subscribe("a", handler)
+        bus.subscribe_batch("a", lambda b: batches.append(len(b)))
+        for i in range(10):
+            bus.publish("a", {"i": i})
+        assert seen == []
+
+        # Publishing from another thread is handed to the loop.
+        worker = threading.Thread(target=bus.publish, args=("a", {"i": 10}))
+        worker.start()
+        worker.join()
+
+        await bus.drain()
+        assert seen == list(range(11))
+        assert sum(batches) == 11 and max(batches) <= 4
+
+    asyncio.run(scenario())
+
+
+def test_async_mode_without_loop_delivers_inline():
+    bus = EventBus("async")
+    seen = []
+    bus.subscribe("a", seen.append)
+    bus.publish("a", {"i": 1})
+    assert seen == [{"i": 1}]
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        EventBus("eager")  # type: ignore[arg-type]
+
+
+class _Abort(BaseException):
+    pass
+
+
+def test_thread_mode_base_exception_releases_topic():
+    bus = EventBus("thread")
+    seen = []
+
+    def handler(payload):
+        if payload["i"] == 0:
+            raise _Abort()
+        seen.append(payload["i"])
+
+    bus.subscribe("a", handler)
+    bus.publish("a", {"i": 0})
+    assert bus.flush(timeout=5)
+
+    # The topic is not stuck as scheduled: later events still get a drain.
+    bus.publish("a", {"i": 1})
+    assert bus.flush(timeout=5)
+    assert seen == [1]
+    bus.close()
+
+
+def test_thread_mode_submit_failure_releases_topic():
+    bus = EventBus("thread")
+    bus.subscribe("a", lambda p: None)
+    bus.publish("a", {})
+    assert bus.flush(timeout=5)
+    bus._executor.shutdown(wait=True)  # shut down behind the bus's back
+
+    with pytest.raises(RuntimeError):
+        bus.publish("a", {})
+    assert bus.flush(timeout=1)
+    bus._executor = None
+    bus.close()
+
+
+def test_async_mode_cancelled_drain_releases_topic():
+    async def scenario():
+        bus = EventBus("async")
+        seen = []
+
+        async def handler(payload):
+            await asyncio.sleep(0.01)
+            seen.append(payload["i"])
+
+        bus.subscribe("a", handler)
+        bus.publish("a", {"i": 0})
+        for task in list(bus._tasks):
+            task.cancel()
+        await asyncio.wait_for(bus.drain(), 1.0)
+
+        bus.publish("a", {"i": 1})
+        await asyncio.wait_for(bus.drain(), 1.0)
+        assert seen[-1] == 1
+
+    asyncio.run(scenario())
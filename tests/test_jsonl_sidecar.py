@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from abraxas.core.jsonl_sidecar import (
+    AppendCursor,
+    iter_complete_lines,
+    iter_range_lines,
+    read_sidecar,
+    write_sidecar,
+)
+
+
+def _lines(n: int) -> bytes:
+    return b"".join(b'{"i": %05d}\n' % i for i in range(n))
+
+
+def test_cursor_detects_head_and_tail_rewrites(tmp_path: Path) -> None:
+    path = tmp_path / "f.jsonl"
+    path.write_bytes(_lines(2000))
+    cursor = AppendCursor(path)
+    cursor.advance(path.stat().st_size)
+    assert cursor.is_current(path.stat().st_size)
+
+    # Appends keep the prefix valid.
+    with path.open("ab") as f:
+        f.write(b'{"i": 99999}\n')
+    assert cursor.is_current(path.stat().st_size)
+
+    for edit_at in (0, cursor.indexed_bytes - 3):
+        data = bytearray(path.read_bytes())
+        data[edit_at + 1 : edit_at + 2] = b"X"
+        path.write_bytes(bytes(data))
+        assert not cursor.is_current(path.stat().st_size)
+        path.write_bytes(_lines(2000) + b'{"i": 99999}\n')
+
+    assert not cursor.is_current(10)
+
+
+def test_iter_complete_lines_stops_at_torn_tail(tmp_path: Path) -> None:
+    path = tmp_path / "f.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n{"b": 2}\n{"c":')
+    got = list(iter_complete_lines(path, 0, path.stat().st_size))
+    assert got == [(0, b'{"a": 1}\n'), (9, b"\n"), (10, b'{"b": 2}\n')]
+    assert list(iter_complete_lines(path, 10, 19)) == [(10, b'{"b": 2}\n')]
+
+
+def test_iter_range_lines_streams_each_range(tmp_path: Path) -> None:
+    path = tmp_path / "f.jsonl"
+    path.write_bytes(b"one\ntwo\nthree\nfour")
+    assert list(iter_range_lines(path, [(0, 4), (8, 18)])) == [b"one", b"three", b"four"]
+
+
+def test_sidecar_roundtrip_and_version_check(tmp_path: Path) -> None:
+    path = tmp_path / "f.jsonl.side.json"
+    assert write_sidecar(path, {"version": 2, "x": [1, 2]})
+    assert read_sidecar(path, 2) == {"version": 2, "x": [1, 2]}
+    assert read_sidecar(path, 1) is None
+    assert read_sidecar(tmp_path / "missing.json", 2) is None
+    assert not write_sidecar(tmp_path / "no_dir" / "s.json", {"version": 2})
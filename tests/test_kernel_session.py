@@ -0,0 +1,80 @@
+"""KernelSession: warm context and batched ledger appends."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from abx import kernel, runtime_events
+from shared import aAlmanac, rune_ledger
+
+
+@pytest.fixture()
+def kernel_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(rune_ledger, "DEFAULT_PATH", str(tmp_path / "rune_invocations.jsonl"))
+    monkeypatch.setattr(aAlmanac, "DEFAULT_LOG_PATH", str(tmp_path / "aAlmanac.jsonl"))
+    monkeypatch.setattr(runtime_events, "LEDGER_PATH", tmp_path / "runtime_events.log")
+
+    loads = {"registry": 0, "policy": 0, "git": 0}
+
+    def _registry():
+        loads["registry"] += 1
+        return {"runes": [{"rune_id": "test.unrouted", "evidence_mode": "detector_only"}]}
+
+    def _policy():
+        loads["policy"] += 1
+        return {"allow_runes": ["test.unrouted"]}
+
+    def _git():
+        loads["git"] += 1
+        return "deadbeef"
+
+    monkeypatch.setattr(kernel, "load_registry", _registry)
+    monkeypatch.setattr(kernel, "load_policy", _policy)
+    monkeypatch.setattr(kernel, "_git_commit", _git)
+    monkeypatch.setattr(kernel, "payload_schema_for", lambda _rune_id: None)
+    monkeypatch.setattr(kernel, "result_schema_for", lambda _rune_id: None)
+    return tmp_path, loads
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_session_captures_context_once(kernel_env):
+    _, loads = kernel_env
+    session = kernel.KernelSession()
+    for _ in range(5):
+        out = session.invoke("test.unrouted", {})
+        assert out["provenance_bundle"]["repo_commit"] == "deadbeef"
+
+    assert loads == {"registry": 1, "policy": 1, "git": 1}
+
+    session.invalidate(commit=False)
+    session.invoke("test.unrouted", {})
+    assert loads == {"registry": 2, "policy": 2, "git": 1}
+
+
+def test_invoke_many_matches_single_invocation_records(kernel_env):
+    tmp_path, _ = kernel_env
+    session = kernel.KernelSession()
+    results = session.invoke_many([("test.unrouted", {"i": i}) for i in range(4)])
+
+    assert [r["result"]["status"] for r in results] == ["not_computable"] * 4
+    invocations = _lines(tmp_path / "rune_invocations.jsonl")
+    events = _lines(tmp_path / "aAlmanac.jsonl")
+    telemetry = _lines(tmp_path / "runtime_events.log")
+    assert len(invocations) == 4
+    assert len(events) == 4
+    assert [e["phase"] for e in telemetry] == ["invoke_start", "invoke_end"] * 4
+    assert invocations[0]["callsite"]["file"].endswith("test_kernel_session.py")
+
+
+def test_invoke_many_flushes_completed_items_on_error(kernel_env):
+    tmp_path, _ = kernel_env
+    session = kernel.KernelSession()
+    with pytest.raises(ValueError):
+        session.invoke_many([("test.unrouted", {}), ("missing.rune", {})])
+
+    assert len(_lines(tmp_path / "rune_invocations.jsonl")) == 1
@@ -0,0 +1,89 @@
+"""Tests for parallel and resumable oracle batch packaging."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+
+import pytest
+
+from abraxas.oracle import batch
+
+
+@pytest.fixture
+def mda_calls(monkeypatch):
+    calls = []
+
+    def fake_run_mda_for_oracle(payload, *, env, run_at):
+        calls.append(payload["meta"]["id"])
+        return {"envelope": {"env": env, "run_at_iso": run_at}, "payload": payload}
+
+    monkeypatch.setattr(batch, "run_mda_for_oracle", fake_run_mda_for_oracle)
+    return calls
+
+
+def _payloads(tmp_path, ids):
+    payload_dir = tmp_path / "payloads"
+    payload_dir.mkdir(exist_ok=True)
+    for pid in ids:
+        (payload_dir / f"{pid}.json").write_text(json.dumps({"meta": {"id": pid}}), encoding="utf-8")
+    return payload_dir
+
+
+def _run(payload_dir, out_dir, *extra):
+    rc = batch.main([
+        "--payload-dir", str(payload_dir),
+        "--out", str(out_dir),
+        "--emit-signal-v2",
+        "--run-at", "2026-01-01T00:00:00Z",
+        *extra,
+    ])
+    assert rc == 0
+    return json.loads((out_dir / "oracle_packet.json").read_text(encoding="utf-8"))
+
+
+# The monkeypatched MDA stub reaches the workers only because
+# batch._payload_pool() forks; with the real run_mda_for_oracle the
+# parallel packet would differ from the serial one.
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_workers_keep_run_numbering_and_packet(tmp_path, mda_calls):
+    payload_dir = _payloads(tmp_path, ["a", "b", "c", "d"])
+    serial = _run(payload_dir, tmp_path / "serial", "--no-cache")
+    parallel = _run(payload_dir, tmp_path / "parallel", "--workers", "3", "--no-cache")
+
+    assert serial == parallel
+    runs = parallel["oracle_packet_v0_1"]["runs"]
+    assert [r["run_id"] for r in runs] == ["run_01", "run_02", "run_03", "run_04"]
+    assert [r["payload_path"].rsplit("/", 1)[-1] for r in runs] == ["a.json", "b.json", "c.json", "d.json"]
+
+
+def test_rerun_only_recomputes_changed_payloads(tmp_path, mda_calls):
+    payload_dir = _payloads(tmp_path, ["a", "b", "c"])
+    out_dir = tmp_path / "out"
+    first = _run(payload_dir, out_dir)
+    assert mda_calls == ["a", "b", "c"]
+
+    mda_calls.clear()
+    assert _run(payload_dir, out_dir) == first
+    assert mda_calls == []
+
+    (payload_dir / "b.json").write_text(json.dumps({"meta": {"id": "b"}, "x": 1}), encoding="utf-8")
+    (out_dir / "run_03" / "analyst.md").unlink()
+    _run(payload_dir, out_dir)
+    assert mda_calls == ["b", "c"]
+
+    mda_calls.clear()
+    _run(payload_dir, out_dir, "--run-at", "2026-02-01T00:00:00Z")
+    assert mda_calls == ["a", "b", "c"]
+
+
+def test_code_change_invalidates_cached_runs(tmp_path, mda_calls, monkeypatch):
+    payload_dir = _payloads(tmp_path, ["a", "b"])
+    out_dir = tmp_path / "out"
+    _run(payload_dir, out_dir)
+    assert mda_calls == ["a", "b"]
+
+    mda_calls.clear()
+    monkeypatch.setattr(batch, "_code_fingerprint", lambda: "edited")
+    _run(payload_dir, out_dir)
+    assert mda_calls == ["a", "b"]
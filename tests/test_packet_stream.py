@@ -0,0 +1,67 @@
+"""Tests for streaming packet writes and record decoding."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+import pytest
+
+from abraxas.storage.packet_codec import (
+    iter_packet_records,
+    read_packet,
+    write_packet,
+    write_packet_stream,
+)
+
+
+@pytest.fixture(autouse=True)
+def _cas_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("ABRAXAS_ROOT", str(tmp_path))
+
+
+def _records(n: int):
+    for i in range(n):
+        yield {"i": i, "term": f"term-{i % 17}", "score": i / 7.0, "tags": ["a", "b"]}
+
+
+@pytest.mark.parametrize("fmt", ["msgpack", "cbor", "json"])
+@pytest.mark.parametrize("codec", ["zstd", "gzip", "none"])
+def test_stream_round_trip(fmt, codec):
+    path = write_packet_stream(
+        "src", "w1", _records(500), fmt=fmt, codec=codec, chunk_bytes=1024,
+        timestamp_utc="2026-01-02T00:00:00Z",
+    )
+    assert list(iter_packet_records(path)) == list(_records(500))
+    assert read_packet(path) == list(_records(500))
+
+    meta = json.loads(path.with_suffix(path.suffix + ".meta.json").read_text())
+    assert meta["layout"] == "stream"
+    assert meta["record_count"] == 500
+    assert meta["codec"] == codec
+    assert path.name.endswith(f".packet.{fmt}.{codec}")
+    assert "/2026/01/" in path.as_posix()
+
+
+def test_stream_is_content_addressed_and_thread_count_independent():
+    a = write_packet_stream("src", "w", _records(2000), threads=0)
+    b = write_packet_stream("src", "w", _records(2000), threads=2, chunk_bytes=4096)
+    assert a == b
+    assert list(iter_packet_records(b)) == list(_records(2000))
+    assert not list(a.parent.glob(".stream-*"))
+
+
+def test_iter_packet_records_reads_whole_packets():
+    path = write_packet("src", "w", [{"a": 1}, {"b": 2}])
+    assert list(iter_packet_records(path)) == [{"a": 1}, {"b": 2}]
+    single = write_packet("src", "w", {"a": 1})
+    assert list(iter_packet_records(single)) == [{"a": 1}]
+
+
+def test_stream_write_memory_is_bounded():
+    n = 50_000  # ~3 MB encoded
+    tracemalloc.start()
+    write_packet_stream("src", "w", _records(n), chunk_bytes=64 * 1024)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1_500_000
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from abraxas.perf import rollup as rollup_mod
+from abraxas.perf.ledger import get_perf_ledger_path, read_perf_events, summarize_perf, write_perf_event
+from abraxas.perf.schema import PerfEvent
+
+
+@pytest.fixture()
+def perf_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("ABRAXAS_ROOT", str(tmp_path))
+    monkeypatch.setattr(rollup_mod, "_ROLLUP_CACHE", {})
+    return tmp_path
+
+
+def _write_events(now: datetime) -> None:
+    ops = ["acquire", "compress", "cas_put"]
+    for idx in range(120):
+        ts = (now - timedelta(minutes=17 * idx)).isoformat()
+        write_perf_event(
+            PerfEvent(
+                run_id=f"RUN-{idx}",
+                op_name=ops[idx % 3],
+                source_id=None if idx % 5 == 0 else f"SRC-{idx % 4}",
+                bytes_in=100 + idx,
+                bytes_out=50 + idx // 2,
+                duration_ms=float(idx % 9),
+                cache_hit=idx % 2 == 0,
+                compression_ratio=None if idx % 3 else 1.5 + idx / 100,
+                decodo_used=idx % 7 == 0,
+                timestamp_utc=ts,
+            )
+        )
+
+
+def _close(a: dict, b: dict) -> None:
+    """Integers exactly; floats up to rounding (rollups sum them per hour first)."""
+    assert a.keys() == b.keys()
+    for key in a:
+        if isinstance(b[key], float) or isinstance(a[key], float):
+            assert a[key] == pytest.approx(b[key], rel=1e-12, abs=1e-9)
+        else:
+            assert a[key] == b[key]
+
+
+@pytest.mark.parametrize("window_hours", [1, 5, 24, 720])
+@pytest.mark.parametrize("filters", [{}, {"op_name": "acquire"}, {"source_id": "SRC-1"}])
+def test_rollup_summary_matches_full_scan(perf_root, window_hours, filters) -> None:
+    _write_events(datetime.utcnow())
+
+    rolled = summarize_perf(window_hours=window_hours, **filters)
+    scanned = summarize_perf(window_hours=window_hours, use_rollups=False, **filters)
+    _close(rolled, scanned)
+
+
+def test_rollup_extends_incrementally(perf_root) -> None:
+    now = datetime.utcnow()
+    _write_events(now)
+    assert summarize_perf(window_hours=720)["event_count"] == 120
+
+    rollup_path = get_perf_ledger_path().with_name("perf_ledger.jsonl.rollup.json")
+    indexed = json.loads(rollup_path.read_text())["indexed_bytes"]
+    assert indexed == get_perf_ledger_path().stat().st_size
+
+    write_perf_event(PerfEvent(run_id="LATE", op_name="dedup", bytes_in=7, timestamp_utc=now.isoformat()))
+    summary = summarize_perf(window_hours=720)
+    assert summary["event_count"] == 121
+    _close(summary, summarize_perf(window_hours=720, use_rollups=False))
+
+
+def test_rollup_rebuilds_after_tail_rewrite(perf_root) -> None:
+    now = datetime.utcnow()
+    _write_events(now)
+    assert summarize_perf(window_hours=720)["total_bytes_in"] == sum(100 + i for i in range(120))
+
+    # Same-size edit of the last line: only the tail fingerprint changes.
+    path = get_perf_ledger_path()
+    data = path.read_bytes()
+    cut = data.rstrip(b"\n").rfind(b"\n") + 1
+    last = data[cut:]
+    assert b'"bytes_in":219' in last
+    path.write_bytes(data[:cut] + last.replace(b'"bytes_in":219', b'"bytes_in":919'))
+
+    rollup_mod._ROLLUP_CACHE.clear()
+    summary = summarize_perf(window_hours=720)
+    assert summary["total_bytes_in"] == sum(100 + i for i in range(120)) + 700
+    _close(summary, summarize_perf(window_hours=720, use_rollups=False))
+
+
+def test_read_perf_events_filters_raw_records(perf_root) -> None:
+    _write_events(datetime.utcnow())
+    events = read_perf_events(op_name="compress", source_id="SRC-1")
+    assert events
+    assert all(e.op_name == "compress" and e.source_id == "SRC-1" for e in events)
@@ -22,7 +22,14 @@ from abraxas.storage.hashes import stable_hash_bytes, stable_hash_json
 from abraxas.storage.cas import cas_put_bytes, cas_get_bytes, cas_put_json, cas_get_json
 from abraxas.storage.compress import choose_codec, compress_bytes, decompress_bytes
 from abraxas.storage.packet_codec import encode_packet, decode_packet, write_packet, read_packet
-from abraxas.storage.dedup import shingle_hashes, near_dup_score, dedup_items
+from abraxas.storage.dedup import (
+    dedup_items,
+    dedup_items_lsh,
+    minhash_permutations,
+    minhash_signature,
+    near_dup_score,
+    shingle_hashes,
+)
 from abraxas.perf.ledger import write_perf_event, summarize_perf
 from abraxas.perf.schema import PerfEvent
 from abraxas.runes.operators.acquisition_layer import (
@@ -147,6 +154,33 @@ class TestDedup:
         assert len(kept1) == len(kept2)
         assert dropped1 == dropped2
 
+    def test_dedup_items_lsh_matches_exact(self):
+        """Test that MinHash/LSH dedup with verification matches exact dedup."""
+        base = [
+            "the quick brown fox jumps over the lazy dog near the river bank",
+            "markets rallied today as investors shrugged off inflation worries",
+            "a new species of frog was discovered deep in the amazon rainforest",
+        ]
+        items = []
+        for i in range(30):
+            text = base[i % 3]
+            if i % 2:
+                text = text + "!"
+            items.append({"id": i, "text": text})
+        items.append({"id": 99, "text": "completely unrelated sentence about chess openings"})
+
+        exact = dedup_items(items, lambda x: x["text"], threshold=0.9)
+        lsh = dedup_items_lsh(items, lambda x: x["text"], threshold=0.9)
+        assert lsh == exact
+        assert len(lsh[0]) == 4
+
+    def test_minhash_signature_deterministic(self):
+        """Test that MinHash signatures are stable for a seed."""
+        perms = minhash_permutations(16, seed=7)
+        shingles = shingle_hashes("deterministic minhash signature")
+        assert minhash_signature(shingles, perms) == minhash_signature(shingles, perms)
+        assert perms == minhash_permutations(16, seed=7)
+
 
 class TestAcquisitionRunes:
     """Test acquisition runes (BULK/CACHE_ONLY/SURGICAL)."""
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from abraxas.runes.registry import (
+    _default_registry_path,
+    describe_rune,
+    get_registry_snapshot,
+    list_runes_by_capability,
+    load_registry,
+)
+
+
+def test_snapshot_matches_fresh_registry_load() -> None:
+    snapshot = get_registry_snapshot()
+    fresh = load_registry()
+
+    assert snapshot.bindings == fresh
+    for binding in fresh:
+        assert describe_rune(binding.rune_id, fresh) == describe_rune(binding.rune_id)
+        assert list_runes_by_capability(binding.capability, fresh) == list_runes_by_capability(
+            binding.capability
+        )
+
+
+def test_snapshot_is_reused_until_registry_changes(tmp_path: Path) -> None:
+    registry_path = tmp_path / "registry.json"
+    payload = json.loads(_default_registry_path().read_text())
+    registry_path.write_text(json.dumps(payload))
+
+    first = get_registry_snapshot(registry_path)
+    assert get_registry_snapshot(registry_path) is first
+
+    payload["capabilities"] = payload.get("capabilities", [])[:1]
+    registry_path.write_text(json.dumps(payload))
+    st = registry_path.stat()
+    os.utime(registry_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = get_registry_snapshot(registry_path)
+    assert second is not first
+    assert len(second.capability_registry.capabilities) == min(1, len(first.capability_registry.capabilities))
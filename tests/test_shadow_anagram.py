@@ -1,4 +1,13 @@
-from abraxas.detectors.shadow.anagram import detect_shadow_anagrams, AnagramConfig, AnagramBudgets
+from abraxas.detectors.shadow.anagram import (
+    AnagramBudgets,
+    AnagramConfig,
+    _dp_word_splits,
+    _letter_counts,
+    compile_lexicon,
+    detect_shadow_anagrams,
+    detect_shadow_anagrams_batch,
+)
+from abraxas.lexicon.anagram_lexicon_v0 import DEFAULT_LEXICON_V0
 
 
 def test_shadow_anagram_is_deterministic_and_budgeted():
@@ -27,3 +36,20 @@ def test_shadow_anagram_evidence_gating():
     for c in out_yes["shadow_anagram_v1"]["candidates"]:
         # candidates only include evidence_refs when there is evidence
         assert "evidence_refs" in c
+
+
+def test_shadow_anagram_batch_matches_single_calls():
+    token_sets = [["Signal Layer", "ABRAXAS"], ["Slang Drift", "lasgn"], []]
+    batched = detect_shadow_anagrams_batch(token_sets, evidence_refs=["ref:1"])
+    assert batched == [detect_shadow_anagrams(ts, evidence_refs=["ref:1"]) for ts in token_sets]
+
+
+def test_compiled_dp_matches_python_dp_under_budget():
+    compiled = compile_lexicon(DEFAULT_LEXICON_V0, True)
+    assert compile_lexicon(DEFAULT_LEXICON_V0, True) is compiled
+    target = _letter_counts("signalshadowdrift")
+    for max_states in (1, 10, 50_000):
+        budgets = AnagramBudgets(max_states=max_states, max_words_per_phrase=3)
+        vectorized = _dp_word_splits(target, compiled.words, budgets=budgets, compiled=compiled)
+        python = _dp_word_splits(target, list(compiled.words), budgets=budgets)
+        assert vectorized == python
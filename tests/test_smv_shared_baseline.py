@@ -0,0 +1,182 @@
+"""SMV evaluates the baseline once and shares untouched case variants."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import yaml
+
+from abraxas.backtest.session import BacktestSession
+from abraxas.replay.counterfactual import run_counterfactual_exclusion
+from abraxas.value import smv
+from abraxas.value.smv import build_units_from_vector_map, run_smv
+from abraxas.value.types import SMVUnitKind
+
+FDR_PATH = Path(__file__).resolve().parents[1] / "data" / "forecast" / "decomposition" / "fdr_v0_1.yaml"
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+VECTOR_MAP = """
+version: "0.1.0"
+created_at: "2025-12-26"
+nodes:
+  - node_id: "node_a"
+    domain: "INTEGRITY"
+    description: "Node A"
+    allowlist_source_ids: ["src_a", "src_b"]
+    cadence_hint: "daily"
+    narrative_affinity: ["N1_primary"]
+    enabled: true
+settings:
+  max_nodes_active: 10
+  min_allowlist_sources_per_node: 1
+  max_allowlist_sources_per_node: 5
+  require_domain_validation: true
+  allowed_domains: ["INTEGRITY", "PROPAGANDA", "AALMANAC", "MW"]
+  allowed_cadences: ["hourly", "daily", "weekly"]
+"""
+
+
+def _write_fixture(root):
+    (root / "vector_map.yaml").write_text(VECTOR_MAP.lstrip())
+    (root / "portfolios.yaml").write_text(
+        yaml.safe_dump({"portfolios": [{"portfolio_id": "p", "horizons": [], "segments": [], "narratives": [], "case_selectors": []}]})
+    )
+    signals = root / "data" / "signals"
+    signals.mkdir(parents=True)
+    with (signals / "events.jsonl").open("w", encoding="utf-8") as f:
+        for h in range(200):
+            ts = (BASE + timedelta(hours=h)).isoformat().replace("+00:00", "Z")
+            f.write(json.dumps({"event_id": f"e{h}", "timestamp": ts, "text": "digital" if h % 3 else "x", "source": "src_a"}) + "\n")
+    cases_dir = root / "cases"
+    cases_dir.mkdir()
+    for i in range(4):
+        case = {
+            "case_id": f"case_{i}",
+            "created_at": BASE.isoformat(),
+            "description": "smv",
+            "forecast_ref": {"run_id": "r", "artifact_path": "a", "tier": "analyst"},
+            "evaluation_window": {
+                "start_ts": (BASE + timedelta(hours=40 * i)).isoformat(),
+                "end_ts": (BASE + timedelta(hours=40 * i + 30)).isoformat(),
+            },
+            "triggers": {"any_of": [{"kind": "term_seen", "params": {"term": "digital", "min_count": 10 + 5 * i}}]},
+            "scoring": {"type": "binary", "weights": {"trigger": 1.0}},
+            "forecast_delta_summary": {"probs_before": {"a": 0.5}},
+        }
+        (cases_dir / f"case_{i}.yaml").write_text(yaml.safe_dump(case))
+
+
+def test_smv_matches_per_unit_counterfactual_and_shares_variants(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_fixture(tmp_path)
+    units = build_units_from_vector_map(str(tmp_path / "vector_map.yaml"))
+    assert len(units) == 3
+
+    evaluated = []
+    original = BacktestSession.evaluate_case
+
+    def counting(self, case, enable_learning=False, run_id="manual"):
+        evaluated.append((case.case_id, run_id))
+        return original(self, case, enable_learning, run_id)
+
+    monkeypatch.setattr(BacktestSession, "evaluate_case", counting)
+    report = run_smv(
+        run_id="r",
+        portfolio_id="p",
+        units=units,
+        cases_dir=str(tmp_path / "cases"),
+        portfolios_path=str(tmp_path / "portfolios.yaml"),
+        vector_map_path=str(tmp_path / "vector_map.yaml"),
+    )
+    # Baseline once, then one shared variant per case for all three units.
+    assert len(evaluated) == 8
+    assert sorted(r for _, r in evaluated) == ["counterfactual"] * 4 + ["counterfactual_masked"] * 4
+
+    reference = {}
+    for unit in units:
+        mask = smv._unit_to_mask(unit, str(tmp_path / "vector_map.yaml"))
+        masked = run_counterfactual_exclusion(
+            run_id="r",
+            portfolio_id="p",
+            masks=[mask],
+            cases_dir=str(tmp_path / "cases"),
+            portfolios_path=str(tmp_path / "portfolios.yaml"),
+            fdr_path=str(FDR_PATH),
+        )
+        reference[unit.unit_id] = smv._compute_benefit(
+            masked["baseline_forecast_scores"],
+            masked["baseline_regime_scores"],
+            masked["masked_forecast_scores"],
+            masked["masked_regime_scores"],
+        )
+    assert {u["unit_id"]: u["benefit"] for u in report["units"]} == reference
+
+
+def test_smv_loads_vector_map_only_for_vector_node_units(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_fixture(tmp_path)
+    units = [u for u in build_units_from_vector_map(str(tmp_path / "vector_map.yaml")) if u.kind != SMVUnitKind.VECTOR_NODE]
+
+    def fail(path):
+        raise AssertionError("vector map loaded without VECTOR_NODE units")
+
+    monkeypatch.setattr(smv, "load_vector_map", fail)
+    report = run_smv(
+        run_id="r",
+        portfolio_id="p",
+        units=units,
+        cases_dir=str(tmp_path / "cases"),
+        portfolios_path=str(tmp_path / "portfolios.yaml"),
+        vector_map_path=str(tmp_path / "vector_map.yaml"),
+    )
+    assert sorted(u["unit_id"] for u in report["units"]) == ["src_a", "src_b"]
+
+
+def test_smv_keeps_cases_with_duplicate_ids_apart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_fixture(tmp_path)
+    dup = tmp_path / "cases" / "case_1.yaml"
+    dup.write_text(dup.read_text().replace("case_id: case_1", "case_id: case_0"))
+    units = build_units_from_vector_map(str(tmp_path / "vector_map.yaml"))
+
+    evaluated = []
+    original = BacktestSession.evaluate_case
+
+    def counting(self, case, enable_learning=False, run_id="manual"):
+        evaluated.append((case.case_id, run_id))
+        return original(self, case, enable_learning, run_id)
+
+    monkeypatch.setattr(BacktestSession, "evaluate_case", counting)
+    run_smv(
+        run_id="r",
+        portfolio_id="p",
+        units=units,
+        cases_dir=str(tmp_path / "cases"),
+        portfolios_path=str(tmp_path / "portfolios.yaml"),
+        vector_map_path=str(tmp_path / "vector_map.yaml"),
+    )
+    masked = sorted(c for c, r in evaluated if r == "counterfactual_masked")
+    assert masked == ["case_0", "case_0", "case_2", "case_3"]
+
+
+def test_smv_cli_passes_workers(monkeypatch):
+    from argparse import Namespace
+
+    from abraxas.cli import smv as smv_cli
+
+    seen = {}
+
+    def fake_run_smv(**kwargs):
+        seen.update(kwargs)
+        return {"baseline_scores": {}, "units": []}
+
+    monkeypatch.setattr(smv_cli, "build_units_from_vector_map", lambda *a: [])
+    monkeypatch.setattr(smv_cli, "run_smv", fake_run_smv)
+    args = Namespace(
+        run_id="r", portfolio="p", vector_map="vm.yaml", allowlist_spec=None,
+        cases_dir="cases", portfolios_path="p.yaml", max_units=5, workers=3,
+    )
+    assert smv_cli.run_smv_cli(args) == 0
+    assert seen["workers"] == 3
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from abraxas.runtime.concurrency import ConcurrencyConfig
+from abraxas.runtime.deterministic_executor import WorkResult, commit_results, execute_parallel, iter_parallel
+from abraxas.runtime.work_units import WorkUnit
+
+
+def _unit(i: int, *, stage: str = "FETCH", size: int = 10) -> WorkUnit:
+    return WorkUnit.build(
+        stage=stage,
+        source_id="S1",
+        window_utc={"start": "2026-01-01T00:00:00Z", "end": "2026-01-02T00:00:00Z"},
+        key=("S1", f"{i:04d}"),
+        input_refs={"i": i},
+        input_bytes=size,
+    )
+
+
+def _handler(unit: WorkUnit) -> WorkResult:
+    i = unit.input_refs["i"]
+    # Early units finish last so completion order differs from submission order.
+    time.sleep(0.002 * ((7 - i) % 8))
+    return WorkResult(
+        unit_id=unit.unit_id,
+        key=unit.key,
+        output_refs={"square": i * i},
+        bytes_processed=unit.input_bytes,
+        stage=unit.stage,
+    )
+
+
+def test_stream_matches_batch_commit_order():
+    config = ConcurrencyConfig(enabled=True, max_workers_fetch=4)
+    units = [_unit(i) for i in range(20)]
+    expected = commit_results(execute_parallel(units, config=config, stage="FETCH", handler=_handler).results)
+
+    unordered = list(iter_parallel(iter(units), config=config, stage="FETCH", handler=_handler))
+    assert commit_results(unordered) == expected
+
+    ordered = list(iter_parallel(iter(units), config=config, stage="FETCH", handler=_handler, ordered=True))
+    assert ordered == expected
+
+
+def test_generator_is_consumed_lazily_under_unit_cap():
+    config = ConcurrencyConfig(enabled=True, max_workers_fetch=2)
+    pulled = []
+
+    def source():
+        for i in range(50):
+            pulled.append(i)
+            yield _unit(i)
+
+    stats: dict = {}
+    stream = iter_parallel(source(), config=config, stage="FETCH", handler=_handler, ordered=True, stats=stats)
+    first = next(stream)
+    assert first.output_refs == {"square": 0}
+    # Cap is 2 * workers outstanding, plus one unit held back by the cap.
+    assert len(pulled) <= 5
+    stream.close()
+    assert stats["max_inflight_units"] <= 4
+
+
+def test_byte_cap_applies_before_submission():
+    config = ConcurrencyConfig(enabled=True, max_workers_fetch=8, max_inflight_bytes=25)
+    lock = threading.Lock()
+    live = [0, 0]
+
+    def handler(unit: WorkUnit) -> WorkResult:
+        with lock:
+            live[0] += unit.input_bytes
+            live[1] = max(live[1], live[0])
+        time.sleep(0.005)
+        with lock:
+            live[0] -= unit.input_bytes
+        return _handler(unit)
+
+    units = [_unit(i, size=10) for i in range(12)]
+    stats: dict = {}
+    results = list(iter_parallel(units, config=config, stage="FETCH", handler=handler, stats=stats))
+    assert len(results) == 12
+    assert stats["submitted"] == stats["completed"] == 12
+    assert live[1] <= 20
+    assert stats["max_inflight_bytes"] <= 20
+
+    # A unit larger than the cap still runs, but alone.
+    live[1] = 0
+    big = [_unit(0, size=10), _unit(1, size=100), _unit(2, size=10)]
+    assert len(list(iter_parallel(big, config=config, stage="FETCH", handler=handler))) == 3
+    assert live[1] == 100
+
+
+def test_ordered_rejects_unsorted_keys():
+    config = ConcurrencyConfig(enabled=True, max_workers_fetch=2)
+    units = [_unit(2), _unit(1)]
+    with pytest.raises(ValueError):
+        list(iter_parallel(units, config=config, stage="FETCH", handler=_handler, ordered=True))
+
+
+def test_process_backend_for_parse_stage():
+    config = ConcurrencyConfig(enabled=True, max_workers_parse=2)
+    units = [_unit(i, stage="PARSE") for i in range(6)]
+    results = list(
+        iter_parallel(units, config=config, stage="PARSE", handler=_handler, backend="process", ordered=True)
+    )
+    assert [r.output_refs["square"] for r in results] == [i * i for i in range(6)]
+
+
+def test_disabled_config_runs_inline():
+    config = ConcurrencyConfig(enabled=False)
+    results = list(iter_parallel((_unit(i) for i in range(3)), config=config, stage="FETCH", handler=_handler))
+    assert [r.output_refs["square"] for r in results] == [0, 1, 4]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from abraxas_ase.subword_index import SubwordIndex, get_subword_index
+
+
+def _naive(subwords, token, min_len, proper):
+    have = Counter(token)
+    out = []
+    for sub in sorted(set(subwords)):
+        if len(sub) < min_len or (proper and len(sub) >= len(token)):
+            continue
+        if all(have.get(ch, 0) >= n for ch, n in Counter(sub).items()):
+            out.append(sub)
+    return tuple(out)
+
+
+def test_subword_index_matches_counter_containment() -> None:
+    subwords = ["nuke", "rain", "keen", "ear", "near", "ukraine", "ill", "sip", "miss", "sss"]
+    index = SubwordIndex(subwords)
+    for token in ["ukraine", "mississippi", "kneeling", "zzz", "earn"]:
+        for proper in (False, True):
+            assert index.contained(token, min_len=3, proper=proper) == _naive(subwords, token, 3, proper)
+
+
+def test_contained_many_resolves_anagram_tokens_once() -> None:
+    index = SubwordIndex(["ear", "are"])
+    out = index.contained_many(["earn", "near", "earn"], min_len=3, proper=True)
+    assert out == {"earn": ("are", "ear"), "near": ("are", "ear")}
+
+
+def test_get_subword_index_is_cached_per_runtime_lexicon() -> None:
+    core = frozenset({"nuke", "rain"})
+    assert get_subword_index(core) is get_subword_index(core)
+    assert get_subword_index(core, frozenset({"ear"})) is not get_subword_index(core)
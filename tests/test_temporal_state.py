@@ -0,0 +1,212 @@
+"""Tests for the incremental temporal profile state."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from abraxas.memetic import temporal
+from abraxas.memetic.temporal import build_temporal_profiles
+
+
+NOW = "2025-12-26T00:00:00+00:00"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state_cache():
+    temporal._STATE_CACHE.clear()
+    yield
+    temporal._STATE_CACHE.clear()
+
+
+def _row(key: str, day: int, count: int, **extra) -> dict:
+    ts = f"2025-12-{day:02d}T00:00:00+00:00"
+    row = {
+        "term_key": key,
+        "term": f"term {key}",
+        "ts": ts,
+        "last_seen_ts": ts,
+        "first_seen_ts": "2025-12-01T00:00:00Z",
+        "count": count,
+        "manipulation_risk": 0.1 * day % 1,
+        "novelty_score": 0.3,
+        "propagation_score": 0.05 * count,
+        "tags": [f"d{day % 3}"],
+    }
+    row.update(extra)
+    return row
+
+
+def _append(path: Path, rows, *, newline: bool = True) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        text = "\n".join(json.dumps(r) for r in rows)
+        f.write(text + ("\n" if newline else ""))
+
+
+def _dicts(profiles):
+    return [p.to_dict() for p in profiles]
+
+
+def test_incremental_matches_full_scan_across_appends(tmp_path):
+    reg = tmp_path / "terms.jsonl"
+    _append(reg, [_row("a", 2, 3), _row("b", 3, 1), _row("a", 9, 4), _row("a", 9, 2)])
+    for rows in ([_row("b", 20, 5), _row("c", 21, 1)], [_row("c", 24, 7), _row("a", 25, 1)]):
+        _append(reg, rows)
+        inc = build_temporal_profiles(str(reg), now_iso=NOW, min_obs=1)
+        full = build_temporal_profiles(str(reg), now_iso=NOW, min_obs=1, incremental=False)
+        assert _dicts(inc) == _dicts(full)
+    assert (tmp_path / "terms.jsonl.temporal_state.json").exists()
+
+    a = next(p for p in inc if p.term_key == "a")
+    assert a.obs_n == 4
+    assert a.recurrence_days == 7.0
+    assert a.first_seen_ts == "2025-12-01T00:00:00+00:00"
+
+
+def test_only_new_lines_are_parsed(tmp_path, monkeypatch):
+    reg = tmp_path / "terms.jsonl"
+    _append(reg, [_row("a", d, 1) for d in range(1, 21)])
+    build_temporal_profiles(str(reg), now_iso=NOW)
+
+    folded = []
+    real_fold = temporal._fold_row
+    monkeypatch.setattr(temporal, "_fold_row", lambda terms, row, overlay=None: (folded.append(row), real_fold(terms, row, overlay)))
+    # A new process (empty cache) resumes from the persisted state.
+    temporal._STATE_CACHE.clear()
+    _append(reg, [_row("a", 22, 2), _row("b", 23, 1)])
+    profiles = build_temporal_profiles(str(reg), now_iso=NOW, min_obs=1)
+    assert len(folded) == 2
+    assert {p.term_key for p in profiles} == {"a", "b"}
+
+
+def test_unterminated_line_and_rewrite(tmp_path):
+    reg = tmp_path / "terms.jsonl"
+    _append(reg, [_row("a", 1, 1), _row("a", 5, 1)])
+    _append(reg, [_row("a", 6, 9)], newline=False)
+    inc = build_temporal_profiles(str(reg), now_iso=NOW)
+    assert inc[0].obs_n == 3
+    assert _dicts(inc) == _dicts(build_temporal_profiles(str(reg), now_iso=NOW, incremental=False))
+
+    # The torn line is not persisted; completing it is picked up once.
+    with reg.open("a", encoding="utf-8") as f:
+        f.write("\n")
+    assert build_temporal_profiles(str(reg), now_iso=NOW)[0].obs_n == 3
+
+    reg.write_text(json.dumps(_row("z", 3, 1)) + "\n" + json.dumps(_row("z", 4, 1)) + "\n", encoding="utf-8")
+    assert [p.term_key for p in build_temporal_profiles(str(reg), now_iso=NOW)] == ["z"]
+
+
+def _full_rebuild_profiles(registry_path: str, *, now_iso: str, min_obs: int = 2):
+    """The full-rebuild fold build_temporal_profiles used before the per-term state."""
+    now = temporal._parse_dt(now_iso)
+    rows = []
+    with open(registry_path, "r", encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            if i >= temporal.MAX_REGISTRY_LINES:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(obj, dict):
+                rows.append(obj)
+
+    by_key = {}
+    for row in rows:
+        ts = temporal._parse_dt(str(row.get("ts") or "")) or temporal._parse_dt(str(row.get("last_seen_ts") or ""))
+        if not row.get("term_key") or not row.get("term") or not ts:
+            continue
+        by_key.setdefault(str(row["term_key"]), []).append(row)
+
+    def window_velocity(obs, window_days):
+        start = now - timedelta(days=window_days)
+        return float(sum(int(c) for ts, c in obs if ts >= start)) / float(max(1, window_days))
+
+    def recurrence_days(obs_ts):
+        if len(obs_ts) < 2:
+            return None
+        obs_ts = sorted(obs_ts)
+        gaps = sorted(g for g in ((b - a).total_seconds() / 86400.0 for a, b in zip(obs_ts[:-1], obs_ts[1:])) if g >= 0.0)
+        if not gaps:
+            return None
+        mid = len(gaps) // 2
+        if len(gaps) % 2 == 1:
+            return float(gaps[mid])
+        return float((gaps[mid - 1] + gaps[mid]) / 2.0)
+
+    profiles = []
+    for key, recs in by_key.items():
+        obs, obs_ts, tags = [], [], set()
+        risk, nov, prop = [], [], []
+        first_seen = last_seen = None
+        for rec in recs:
+            t_last = temporal._parse_dt(str(rec.get("last_seen_ts") or "")) or temporal._parse_dt(str(rec.get("ts") or ""))
+            t_first = temporal._parse_dt(str(rec.get("first_seen_ts") or "")) or t_last
+            if not t_last:
+                continue
+            obs.append((t_last, int(rec.get("count") or 0)))
+            obs_ts.append(t_last)
+            tags.update(list(rec.get("tags") or []))
+            risk.append(float(rec.get("manipulation_risk") or 0.0))
+            nov.append(float(rec.get("novelty_score") or 0.0))
+            prop.append(float(rec.get("propagation_score") or 0.0))
+            if first_seen is None or (t_first and t_first < first_seen):
+                first_seen = t_first
+            if last_seen is None or t_last > last_seen:
+                last_seen = t_last
+        if not obs or len(obs) < min_obs:
+            continue
+        v14 = window_velocity(obs, 14)
+        v60 = window_velocity(obs, 60)
+        rec_days = recurrence_days(obs_ts)
+        profiles.append(
+            temporal.TermTemporalProfile(
+                term_key=key,
+                term=str(recs[-1].get("term") or ""),
+                first_seen_ts=first_seen.isoformat(),
+                last_seen_ts=last_seen.isoformat(),
+                obs_n=len(obs),
+                v14=v14,
+                v60=v60,
+                recurrence_days=rec_days,
+                half_life_days_fit=temporal._decay_fit_half_life_days(v14, v60),
+                phase=temporal._phase_state(
+                    first_seen=first_seen, last_seen=last_seen, now=now, v14=v14, v60=v60, prev_gap_days=rec_days
+                ),
+                manipulation_risk_mean=sum(risk) / max(1, len(risk)),
+                novelty_mean=sum(nov) / max(1, len(nov)),
+                propagation_mean=sum(prop) / max(1, len(prop)),
+                tags_union=sorted(tags),
+                provenance={"method": "build_temporal_profiles.v0.1", "registry": registry_path},
+            )
+        )
+    rank = {"surging": 0, "resurgent": 1, "emergent": 2, "plateau": 3, "decaying": 4, "dormant": 5}
+    profiles.sort(key=lambda p: (rank.get(p.phase, 9), -(p.v14 + 0.35 * p.v60), p.manipulation_risk_mean, p.term))
+    return profiles
+
+
+def test_incremental_matches_pre_state_full_rebuild(tmp_path):
+    reg = tmp_path / "terms.jsonl"
+    batches = [
+        [_row("a", 2, 3), _row("b", 3, 1), _row("a", 9, 4), _row("a", 9, 2, manipulation_risk=0.7)],
+        [_row("b", 20, 5, first_seen_ts="2025-11-02T00:00:00Z"), _row("c", 21, 1, tags=[])],
+        [_row("c", 24, 7, last_seen_ts=""), _row("a", 25, 1, term="renamed a"), {"term_key": "d", "ts": "bad"}],
+        [_row("d", 12, 2), _row("d", 12, 3), {**_row("d", 19, 1), "count": None}, _row("e", 23, 1)],
+    ]
+    for rows in batches:
+        _append(reg, rows)
+        with reg.open("a", encoding="utf-8") as f:
+            f.write("\n{not json\n")
+        inc = build_temporal_profiles(str(reg), now_iso=NOW, min_obs=1)
+        assert _dicts(inc) == _dicts(_full_rebuild_profiles(str(reg), now_iso=NOW, min_obs=1))
+
+    # An unterminated last line counts, as it did for the full rebuild.
+    _append(reg, [_row("e", 24, 2)], newline=False)
+    inc = build_temporal_profiles(str(reg), now_iso=NOW)
+    assert _dicts(inc) == _dicts(_full_rebuild_profiles(str(reg), now_iso=NOW))
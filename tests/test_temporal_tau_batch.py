@@ -0,0 +1,89 @@
+"""Batch τ snapshots must match the scalar path exactly."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from abraxas.core.temporal_tau import Observation, TauCalculator, observation_columns
+
+NOW = "2026-03-01T00:00:00Z"
+
+
+def _random_history(rng: random.Random, n: int) -> list:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(hours=rng.randrange(500))
+    obs = []
+    for _ in range(n):
+        ts = base + timedelta(seconds=rng.randrange(0, 40 * 86400), microseconds=rng.choice([0, 0, 250000, 1]))
+        value = rng.choice([1.0, 1.0, rng.uniform(0.5, 1.5), rng.uniform(-3, 10), 0.0])
+        obs.append(Observation(ts=ts.isoformat().replace("+00:00", "Z"), value=value, source_id="s"))
+    return obs
+
+
+def test_batch_matches_scalar_bit_for_bit():
+    rng = random.Random(11)
+    calc = TauCalculator()
+    histories = {f"t{i:03d}": _random_history(rng, rng.choice([1, 2, 3, 6, 25, 40])) for i in range(120)}
+    # Steady term that reaches HIGH confidence.
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    histories["steady"] = [
+        Observation(ts=(start + timedelta(hours=6 * k)).isoformat().replace("+00:00", "Z"), value=1.0, source_id="s")
+        for k in range(30)
+    ]
+
+    term_ids, epoch_s, values, ts = observation_columns(histories)
+    # Shuffle rows: the batch path must not depend on input grouping.
+    rows = list(zip(term_ids, epoch_s, values, ts))
+    rng.shuffle(rows)
+    batch = calc.compute_snapshots_batch(
+        [r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows], current_time_utc=NOW
+    )
+
+    assert list(batch) == sorted(histories)
+    levels = set()
+    for term, obs in histories.items():
+        expected = calc.compute_snapshot(obs, current_time_utc=NOW)
+        got = batch[term]
+        assert got.tau_half_life == expected.tau_half_life
+        assert got.tau_velocity == expected.tau_velocity
+        assert got.tau_phase_proximity == expected.tau_phase_proximity
+        assert got.confidence == expected.confidence
+        assert got.observation_count == expected.observation_count
+        assert got.observation_window_hours == expected.observation_window_hours
+        levels.add(got.confidence)
+    assert len(levels) == 3
+
+
+def test_batch_rejects_ragged_columns_and_handles_empty():
+    calc = TauCalculator()
+    assert calc.compute_snapshots_batch([], [], []) == {}
+    with pytest.raises(ValueError):
+        calc.compute_snapshots_batch(["a", "b"], [0.0], [1.0, 1.0])
+
+
+def test_batch_with_ts_column_follows_scalar_string_order():
+    calc = TauCalculator()
+    # Mixed offsets and precision: text order differs from chronological order.
+    history = [
+        Observation(ts="2026-01-01T10:00:00+02:00", value=5.0, source_id="s"),  # 08:00Z
+        Observation(ts="2026-01-01T09:00:00Z", value=1.0, source_id="s"),
+        Observation(ts="2026-01-01T09:00:00.500000Z", value=2.0, source_id="s"),
+        Observation(ts="2026-01-02T00:00:00Z", value=4.0, source_id="s"),
+    ]
+    expected = calc.compute_snapshot(history, current_time_utc=NOW)
+    term_ids, epoch_s, values, ts = observation_columns({"mixed": list(reversed(history))})
+
+    got = calc.compute_snapshots_batch(term_ids, epoch_s, values, ts=ts, current_time_utc=NOW)["mixed"]
+    assert got.tau_half_life == expected.tau_half_life
+    assert got.tau_velocity == expected.tau_velocity
+    assert got.confidence == expected.confidence
+    assert got.observation_window_hours == expected.observation_window_hours
+
+    # Without the text column rows are ordered chronologically instead.
+    by_instant = calc.compute_snapshots_batch(term_ids, epoch_s, values, current_time_utc=NOW)["mixed"]
+    assert by_instant.observation_window_hours != expected.observation_window_hours
+
+    with pytest.raises(ValueError):
+        calc.compute_snapshots_batch(term_ids, epoch_s, values, ts=ts[:1])
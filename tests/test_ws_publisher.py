@@ -0,0 +1,158 @@
+"""Tests for the backpressured WebSocket publisher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from abraxas.api.ws import WebSocketPublisher
+from abraxas.api.ws_bridge import wire_bus_to_ws
+from abraxas.events.bus import EventBus
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.sent: list = []
+        self.gate = asyncio.Event()
+        self.closed = asyncio.Event()
+        self.close_code = None
+
+    async def accept(self) -> None:
+        return None
+
+    async def receive_text(self) -> str:
+        await self.closed.wait()
+        raise RuntimeError("closed")
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+        self.closed.set()
+
+    async def send_text(self, text: str) -> None:
+        if self.fail:
+            raise RuntimeError("broken pipe")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+
+async def _settle(steps: int = 20) -> None:
+    for _ in range(steps):
+        await asyncio.sleep(0)
+
+
+def test_slow_client_does_not_block_others_and_drops_oldest():
+    async def scenario():
+        pub = WebSocketPublisher(max_queue=3, policies={})
+        fast, slow = FakeSocket(), FakeSocket(delay=0.5)
+        tasks = [asyncio.ensure_future(pub.connect(ws)) for ws in (fast, slow)]
+        await _settle()
+
+        for i in range(10):
+            await pub.broadcast({"type": "oracle", "payload": {"i": i}})
+            await _settle()
+        assert [m["payload"]["i"] for m in fast.sent] == list(range(10))
+
+        stats = pub.stats()
+        assert stats["connections"] == 2
+        assert stats["max_queue_depth"] == 3
+        assert stats["dropped"] >= 6
+
+        for ws in (fast, slow):
+            ws.closed.set()
+        await asyncio.gather(*tasks)
+        assert pub.connection_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_coalesce_keeps_latest_per_type():
+    async def scenario():
+        pub = WebSocketPublisher(max_queue=16)
+        ws = FakeSocket()
+        task = asyncio.ensure_future(pub.connect(ws))
+        await _settle()
+
+        for i in range(5):
+            await pub.broadcast({"type": "compression", "payload": {"i": i}})
+        await pub.broadcast({"type": "oracle", "payload": {"i": "o"}})
+        await _settle()
+
+        assert [m["payload"]["i"] for m in ws.sent] == [4, "o"]
+        assert pub.stats()["coalesced"] == 4
+
+        ws.closed.set()
+        await task
+
+    asyncio.run(scenario())
+
+
+def test_failed_client_is_removed():
+    async def scenario():
+        pub = WebSocketPublisher()
+        bad, good = FakeSocket(fail=True), FakeSocket()
+        tasks = [asyncio.ensure_future(pub.connect(ws)) for ws in (bad, good)]
+        await _settle()
+        await pub.broadcast({"type": "error", "payload": {}})
+        await _settle()
+        assert pub.connection_count() == 1
+        assert pub.stats()["send_errors"] == 1
+        assert len(good.sent) == 1
+        for ws in (bad, good):
+            ws.closed.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_client_is_closed():
+    async def scenario():
+        pub = WebSocketPublisher(send_timeout=0.05)
+        stuck = FakeSocket(delay=10.0)
+        task = asyncio.ensure_future(pub.connect(stuck))
+        await _settle()
+        await pub.broadcast({"type": "oracle", "payload": {}})
+
+        # The handler loop sees the close and returns instead of waiting forever.
+        await asyncio.wait_for(task, 1.0)
+        assert stuck.close_code == 1013
+        assert pub.connection_count() == 0
+        assert pub.stats()["send_errors"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_bus_events_from_worker_threads_reach_clients():
+    async def scenario():
+        bus = EventBus()
+        pub = WebSocketPublisher()
+        wire_bus_to_ws(bus, pub)
+        ws = FakeSocket()
+        task = asyncio.ensure_future(pub.connect(ws))
+        await _settle()
+
+        worker = threading.Thread(target=bus.publish, args=("oracle", {"id": "a"}))
+        worker.start()
+        worker.join()
+        await _settle()
+
+        assert ws.sent == [{"type": "oracle", "payload": {"id": "a"}}]
+        ws.closed.set()
+        await task
+
+    asyncio.run(scenario())
+
+
+def test_publish_without_clients_is_a_noop():
+    bus = EventBus()
+    pub = WebSocketPublisher()
+    wire_bus_to_ws(bus, pub)
+    bus.publish("oracle", {"id": "a"})
+    assert pub.stats()["broadcasts"] == 0